@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+CCO Approval Log
+Append-only JSONL store of CCO approval records with a bounded in-memory
+ring of recent summaries; reports stream the full history from disk
+"""
+
+import os
+from collections import deque
+from typing import Dict, Iterator, List, Optional
+
+from segmented_log import get_log_writer, iter_log_records, tail_log_records
+
+APPROVAL_LOG_FILE = '/root/wirereport_organization/logs/cco_approvals.jsonl'
+
+def summarize_record(record: Dict) -> Dict:
+    """Compact view of an approval record - drops the full reviewer payloads"""
+    decision = record.get('cco_decision', {})
+    return {
+        'pr_number': record.get('pr_number', 'N/A'),
+        'executive_level': record.get('executive_level', 'unknown'),
+        'change_types': record.get('change_analysis', {}).get('change_types', []),
+        'approved': decision.get('approved', False),
+        'openai_approved': record.get('openai_review', {}).get('approved', 'N/A'),
+        'claude_approved': record.get('claude_review', {}).get('approved', 'N/A'),
+        'merged': record.get('merge', {}).get('merged'),
+        'timestamp': record.get('timestamp', 'N/A')
+    }
+
+class ApprovalLog:
+    def __init__(self, log_file: Optional[str] = None, recent_size: int = 100):
+        self.log_file = log_file or os.getenv('CCO_APPROVAL_LOG', APPROVAL_LOG_FILE)
+        self.recent = deque(maxlen=recent_size)
+        self.writer = get_log_writer(self.log_file)
+        self.appended = 0
+        
+        # Warm the ring from the tail of the existing log
+        for record in tail_log_records(self.log_file, recent_size):
+            self.recent.append(summarize_record(record))
+    
+    def append(self, record: Dict):
+        """Persist a full record and keep only its summary in memory"""
+        self.writer.append(record)
+        self.recent.append(summarize_record(record))
+        self.appended += 1
+    
+    def __len__(self) -> int:
+        """Records held in memory (the recent ring, not the full history)"""
+        return len(self.recent)
+    
+    def iter_records(self) -> Iterator[Dict]:
+        """Stream every persisted record across log segments"""
+        self.writer.flush()
+        return iter_log_records(self.log_file)
+    
+    def summarize(self, recent: int = 10) -> Dict:
+        """Aggregate the full history in a single streaming pass"""
+        summary = {
+            'total': 0,
+            'approved': 0,
+            'rejected': 0,
+            'merged': 0,
+            'by_level': {},
+            'recent': deque(maxlen=recent)
+        }
+        
+        for record in self.iter_records():
+            entry = summarize_record(record)
+            summary['total'] += 1
+            summary['approved' if entry['approved'] else 'rejected'] += 1
+            if entry['merged']:
+                summary['merged'] += 1
+            
+            level = summary['by_level'].setdefault(entry['executive_level'], {'total': 0, 'approved': 0})
+            level['total'] += 1
+            if entry['approved']:
+                level['approved'] += 1
+            
+            summary['recent'].append(entry)
+        
+        summary['recent'] = list(summary['recent'])
+        return summary
+    
+    def recent_entries(self, count: int = 10) -> List[Dict]:
+        """Most recent summaries from memory, oldest first"""
+        return list(self.recent)[-count:]
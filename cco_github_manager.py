@@ -6,12 +6,28 @@ Handles executive-level approvals with OpenAI/Claude consensus
 
 import os
 import json
+import base64
 import requests
-import subprocess
 from datetime import datetime
 from typing import Dict, List, Optional
-from github import Github
+from concurrent.futures import ThreadPoolExecutor
+from github import Github, InputGitTreeElement
 import asyncio
+from cco_sync import IncrementalSync, git_file_mode
+from cco_patch_review import PatchReviewer, estimate_tokens, format_chunk
+from cco_path_router import PathRouter
+from cco_merge_train import MergeTrain
+from cco_approval_log import ApprovalLog
+from document_corpus import get_corpus
+from review_json import extract_json, response_format, structured_output_enabled, ReviewParseError, DECISION_SCHEMA
+from cco_status_checks import (
+    StatusPublisher, REQUIRED_STATUS_CONTEXTS, CONSENSUS_CONTEXT, OPENAI_CONTEXT, CLAUDE_CONTEXT
+)
+
+ORGANIZATION_ROOT = '/root/wirereport_organization'
+
+# Directories seeded into a fresh organization repository by --bulk-upload
+BULK_UPLOAD_DIRECTORIES = ['implementation', 'governance', 'consensus']
 
 class ChiefCodeOfficer:
     def __init__(self):
@@ -20,8 +36,15 @@ class ChiefCodeOfficer:
         self.repo_name = "wirereport-ai-organization"
         self.organization = None  # Will be set when creating repo
         
-        # Initialize GitHub client
-        self.github = Github(self.github_token) if self.github_token else None
+        # Initialize GitHub client (GITHUB_API_URL points at GHE or fake_github_server.py)
+        self.github_api_url = os.getenv('GITHUB_API_URL', 'https://api.github.com')
+        self.github = Github(
+            self.github_token,
+            base_url=self.github_api_url,
+            # PyGithub's client-side throttling; set both to 0 when benchmarking against the fake server
+            seconds_between_requests=float(os.getenv('GITHUB_REQUEST_INTERVAL', '0.25')),
+            seconds_between_writes=float(os.getenv('GITHUB_WRITE_INTERVAL', '1.0'))
+        ) if self.github_token else None
         
         # Executive authority levels
         self.executive_levels = {
@@ -32,8 +55,26 @@ class ChiefCodeOfficer:
             'cao': ['agent_management', 'performance_policies', 'resource_allocation']
         }
         
+        # Compiled path → executive level routing (CCO_PATH_RULES for custom rules)
+        self.path_router = PathRouter.load()
+        
+        # Concurrent blob uploads for Git Data API commits
+        self.upload_workers = int(os.getenv('CCO_UPLOAD_WORKERS', '16'))
+        
+        # Diff review: 'auto' (map-reduce only when diffs exceed one prompt), 'map-reduce' or 'summary'
+        self.review_mode = os.getenv('CCO_REVIEW_MODE', 'auto')
+        self.review_token_budget = int(os.getenv('CCO_REVIEW_TOKEN_BUDGET', '6000'))
+        self.review_concurrency = int(os.getenv('CCO_REVIEW_CONCURRENCY', '8'))
+        
+        # Merge trains and status check publishers, one per repository
+        self.merge_trains = {}
+        self.status_publishers = {}
+        
+        # Incremental sync engine (created on first sync)
+        self.incremental_sync = None
+        
         # Approval log
-        self.approval_log = []
+        self.approval_log = ApprovalLog(recent_size=int(os.getenv('CCO_APPROVAL_RECENT', '100')))
     
     async def create_github_repository(self, org_name: str = None):
         """Create the centralized GitHub repository"""
@@ -47,7 +88,7 @@ class ChiefCodeOfficer:
             'has_issues': True,
             'has_projects': True,
             'has_wiki': True,
-            'auto_init': False
+            'auto_init': True  # Git Data API commits need an existing main ref
         }
         
         try:
@@ -63,12 +104,13 @@ class ChiefCodeOfficer:
             
             print(f"✅ Repository created: {repo.html_url}")
             
+            # Initial commit with organizational structure (before protection,
+            # which would otherwise reject the direct ref update)
+            await self.initial_commit(repo)
+            
             # Set up branch protection
             await self.setup_branch_protection(repo)
             
-            # Initial commit with organizational structure
-            await self.initial_commit(repo)
-            
             return repo
             
         except Exception as e:
@@ -81,20 +123,14 @@ class ChiefCodeOfficer:
             # Protect main branch
             main_branch = repo.get_branch('main')
             main_branch.edit_protection(
-                required_status_checks={
-                    'strict': True,
-                    'contexts': ['cco-consensus-check', 'openai-approval', 'claude-approval']
-                },
+                strict=True,
+                contexts=REQUIRED_STATUS_CONTEXTS,
                 enforce_admins=True,
-                required_pull_request_reviews={
-                    'required_approving_review_count': 1,
-                    'dismiss_stale_reviews': True,
-                    'require_code_owner_reviews': True
-                },
-                restrictions={
-                    'users': [],
-                    'teams': []
-                }
+                required_approving_review_count=1,
+                dismiss_stale_reviews=True,
+                require_code_owner_reviews=True,
+                user_push_restrictions=[],
+                team_push_restrictions=[]
             )
             
             print("✅ Branch protection configured")
@@ -115,22 +151,18 @@ class ChiefCodeOfficer:
                 'cco-system/README.md'
             ]
             
+            files = {}
             for dir_file in directories:
-                content = f"# {dir_file.split('/')[0].title()}\n\nOrganizational documents for WireReport AI Autonomous Organization"
-                repo.create_file(
-                    dir_file,
-                    f"Initial structure: {dir_file}",
-                    content
-                )
+                files[dir_file] = f"# {dir_file.split('/')[0].title()}\n\nOrganizational documents for WireReport AI Autonomous Organization"
             
             # Add governance workflow
-            with open('/root/wirereport_organization/GOVERNANCE_WORKFLOW.md', 'r') as f:
-                workflow_content = f.read()
+            files['GOVERNANCE_WORKFLOW.md'] = get_corpus(ORGANIZATION_ROOT).read('GOVERNANCE_WORKFLOW.md')
             
-            repo.create_file(
-                'GOVERNANCE_WORKFLOW.md',
-                'Add: Executive governance workflow with CCO approval system',
-                workflow_content
+            # Single commit for the whole structure
+            await self.bulk_upload(
+                repo,
+                files,
+                'Initial structure: organizational directories and executive governance workflow'
             )
             
             print("✅ Initial commit completed")
@@ -138,104 +170,270 @@ class ChiefCodeOfficer:
         except Exception as e:
             print(f"❌ Initial commit failed: {e}")
     
+    def collect_local_files(self, directories: List[str], modes: Optional[Dict[str, str]] = None) -> Dict[str, bytes]:
+        """Collect files under the given organization directories, keyed by repo path
+        
+        Pass a dict as modes to have it filled with each file's git mode for bulk_upload.
+        """
+        files = {}
+        
+        for directory in directories:
+            base = os.path.join(ORGANIZATION_ROOT, directory)
+            for root, dirnames, filenames in os.walk(base):
+                dirnames[:] = [d for d in dirnames if not d.startswith('.') and d != '__pycache__']
+                for filename in filenames:
+                    if filename.startswith('.') or filename.endswith('.pyc'):
+                        continue
+                    full_path = os.path.join(root, filename)
+                    repo_path = os.path.relpath(full_path, ORGANIZATION_ROOT).replace(os.sep, '/')
+                    with open(full_path, 'rb') as f:
+                        files[repo_path] = f.read()
+                        if modes is not None:
+                            modes[repo_path] = git_file_mode(os.fstat(f.fileno()).st_mode)
+        
+        return files
+    
+    async def bulk_upload(self, repo, files: Dict[str, object], message: str, branch: str = 'main',
+                          deletions: Optional[List[str]] = None, modes: Optional[Dict[str, str]] = None):
+        """Upload many files as a single commit via the Git Data API
+        
+        Blobs are created concurrently, then one tree and one commit are built
+        on top of the branch head and the branch ref is moved to the new commit.
+        Paths in deletions are removed from the tree in the same commit. modes
+        maps paths to git file modes (e.g. 100755 for executables); others get 100644.
+        """
+        modes = modes or {}
+        deletions = deletions or []
+        if not files and not deletions:
+            return None
+        
+        loop = asyncio.get_running_loop()
+        
+        def create_blob(content):
+            if isinstance(content, bytes):
+                try:
+                    return repo.create_git_blob(content.decode('utf-8'), 'utf-8').sha
+                except UnicodeDecodeError:
+                    return repo.create_git_blob(base64.b64encode(content).decode('ascii'), 'base64').sha
+            return repo.create_git_blob(content, 'utf-8').sha
+        
+        paths = sorted(files)
+        with ThreadPoolExecutor(max_workers=self.upload_workers) as executor:
+            blob_shas = await asyncio.gather(*[
+                loop.run_in_executor(executor, create_blob, files[path]) for path in paths
+            ])
+        
+        ref = repo.get_git_ref(f'heads/{branch}')
+        parent = repo.get_git_commit(ref.object.sha)
+        
+        tree_elements = [
+            InputGitTreeElement(path=path, mode=modes.get(path, '100644'), type='blob', sha=sha)
+            for path, sha in zip(paths, blob_shas)
+        ]
+        tree_elements.extend(
+            InputGitTreeElement(path=path, mode='100644', type='blob', sha=None)
+            for path in deletions
+        )
+        tree = repo.create_git_tree(tree_elements, base_tree=parent.tree)
+        
+        commit = repo.create_git_commit(message, tree, [parent])
+        ref.edit(commit.sha)
+        
+        print(f"✅ Uploaded {len(paths)} files ({len(deletions)} deleted) in commit {commit.sha[:7]}")
+        return commit
+    
+    def get_status_publisher(self, repo) -> StatusPublisher:
+        """Get the coalescing status check publisher for a repository"""
+        if repo.full_name not in self.status_publishers:
+            self.status_publishers[repo.full_name] = StatusPublisher(repo)
+        return self.status_publishers[repo.full_name]
+    
+    @staticmethod
+    def review_status(review: Dict, reviewer: str):
+        """Map a reviewer verdict to a commit status state and description"""
+        if review.get('error'):
+            return 'error', f"{reviewer} review failed"
+        if review.get('approved', False):
+            return 'success', f"{reviewer} approved (confidence {review.get('confidence', 0)}%)"
+        return 'failure', f"{reviewer} requested changes (confidence {review.get('confidence', 0)}%)"
+    
+    def get_merge_train(self, repo) -> MergeTrain:
+        """Get the merge train for a repository"""
+        if repo.full_name not in self.merge_trains:
+            self.merge_trains[repo.full_name] = MergeTrain(
+                repo, checks=lambda sha, prs: self.run_merge_train_checks(repo, sha, prs)
+            )
+        return self.merge_trains[repo.full_name]
+    
+    def get_repository(self):
+        """Get the organization repository handle"""
+        return self.github.get_repo(f"{self.organization or self.github.get_user().login}/{self.repo_name}")
+    
     async def review_pull_request(self, pr_number: int) -> Dict:
         """CCO review of pull request with OpenAI/Claude consensus"""
         if not self.github:
             return {'error': 'GitHub not configured'}
         
+        publishing_sha = None
         try:
-            repo = self.github.get_repo(f"{self.organization or self.github.get_user().login}/{self.repo_name}")
+            repo = self.get_repository()
             pr = repo.get_pull(pr_number)
+            head_sha = pr.head.sha
+            publishing_sha = head_sha
+            statuses = self.get_status_publisher(repo)
+            statuses.update_all(head_sha, 'pending', 'CCO review in progress')
             
-            # Analyze the changes
-            change_analysis = await self.analyze_changes(pr)
-            
-            # Determine executive level
-            executive_level = self.determine_executive_level(change_analysis)
+            pr_files = list(pr.get_files())
             
-            # Get OpenAI consensus
-            openai_review = await self.get_openai_consensus(change_analysis, executive_level)
-            
-            # Get Claude consensus (simulated - would use Claude API)
-            claude_review = await self.get_claude_consensus(change_analysis, executive_level)
+            # Analyze the changes
+            change_analysis = await self.analyze_changes(pr, pr_files)
             
-            # Make CCO decision
-            cco_decision = await self.make_cco_decision(openai_review, claude_review, change_analysis)
+            # OpenAI/Claude consensus and CCO decision, published as the required checks
+            review = await self.review_head(repo, head_sha, change_analysis, pr_files)
+            cco_decision = review['cco_decision']
             
             # Log the approval process
             approval_record = {
                 'pr_number': pr_number,
-                'executive_level': executive_level,
-                'change_analysis': change_analysis,
-                'openai_review': openai_review,
-                'claude_review': claude_review,
-                'cco_decision': cco_decision,
+                **review,
                 'timestamp': datetime.now().isoformat()
             }
             
-            self.approval_log.append(approval_record)
-            
             # Apply decision
             if cco_decision['approved']:
-                # Approve and merge PR
+                # Approve and queue PR on the repository's merge train
                 pr.create_review(body=cco_decision['reasoning'], event='APPROVE')
-                if pr.mergeable:
-                    pr.merge(commit_message=f"CCO Approved: {pr.title}")
+                merge_result = await self.get_merge_train(repo).submit(pr, f"CCO Approved: {pr.title}")
+                approval_record['merge'] = merge_result
+                
+                if merge_result['merged']:
                     print(f"✅ PR #{pr_number} approved and merged")
+                else:
+                    print(f"⚠️ PR #{pr_number} approved but not merged: {merge_result['reason']}")
             else:
                 # Request changes
                 pr.create_review(body=cco_decision['reasoning'], event='REQUEST_CHANGES')
                 print(f"❌ PR #{pr_number} requires changes")
             
+            self.approval_log.append(approval_record)
+            
             return approval_record
             
         except Exception as e:
+            if publishing_sha:
+                statuses = self.get_status_publisher(repo)
+                statuses.update_all(publishing_sha, 'error', f'CCO review failed: {e}')
+                await statuses.settle(publishing_sha, final=True)
             return {'error': f'Review failed: {e}'}
     
-    async def analyze_changes(self, pr) -> Dict:
+    async def review_head(self, repo, head_sha: str, change_analysis: Dict, files: List) -> Dict:
+        """Run the OpenAI/Claude consensus for a commit and publish the required checks on it"""
+        statuses = self.get_status_publisher(repo)
+        
+        # Determine executive level
+        executive_level = self.determine_executive_level(change_analysis)
+        
+        # Get OpenAI consensus
+        openai_review = await self.get_openai_consensus(change_analysis, executive_level, files)
+        statuses.update(head_sha, OPENAI_CONTEXT, *self.review_status(openai_review, 'OpenAI'))
+        
+        # Get Claude consensus (simulated - would use Claude API)
+        claude_review = await self.get_claude_consensus(change_analysis, executive_level)
+        statuses.update(head_sha, CLAUDE_CONTEXT, *self.review_status(claude_review, 'Claude'))
+        
+        # Make CCO decision
+        cco_decision = await self.make_cco_decision(openai_review, claude_review, change_analysis)
+        statuses.update(
+            head_sha, CONSENSUS_CONTEXT,
+            'success' if cco_decision['approved'] else 'failure',
+            f"CCO {executive_level} consensus {'approved' if cco_decision['approved'] else 'rejected'}"
+        )
+        
+        # Required checks must be posted before the merge train merges
+        await statuses.settle(head_sha, final=True)
+        
+        return {
+            'executive_level': executive_level,
+            'change_analysis': change_analysis,
+            'openai_review': openai_review,
+            'claude_review': claude_review,
+            'cco_decision': cco_decision
+        }
+    
+    async def run_merge_train_checks(self, repo, sha: str, prs: List) -> bool:
+        """Re-review a merge train commit (the combined head or a PR head updated onto the base)
+        
+        The required checks are published on that commit, so only a commit that
+        was actually reviewed can satisfy branch protection.
+        """
+        statuses = self.get_status_publisher(repo)
+        try:
+            statuses.update_all(sha, 'pending', 'CCO merge train review in progress')
+            files = [file for pr in prs for file in pr.get_files()]
+            change_analysis = await self.analyze_changes(prs[0], files)
+            if len(prs) > 1:
+                change_analysis.update({
+                    'pr_title': f"Merge train: {', '.join(f'#{pr.number}' for pr in prs)}",
+                    'pr_body': '\n\n'.join(f"#{pr.number} {pr.title}\n{pr.body or ''}" for pr in prs),
+                    'author': 'cco-merge-train'
+                })
+            review = await self.review_head(repo, sha, change_analysis, files)
+            return review['cco_decision']['approved']
+        except Exception as e:
+            statuses.update_all(sha, 'error', f'CCO merge train review failed: {e}')
+            await statuses.settle(sha, final=True)
+            return False
+    
+    async def analyze_changes(self, pr, files: Optional[List] = None) -> Dict:
         """Analyze PR changes to determine impact and requirements"""
         files_changed = []
-        change_types = []
+        patch_tokens = 0
         
-        for file in pr.get_files():
+        for file in (files if files is not None else pr.get_files()):
             files_changed.append(file.filename)
-            
-            # Determine change type based on file path
-            if 'governance/' in file.filename:
-                change_types.append('governance')
-            elif 'consensus/' in file.filename:
-                change_types.append('consensus')
-            elif 'charters/' in file.filename:
-                change_types.append('charter')
-            elif 'implementation/' in file.filename:
-                change_types.append('implementation')
+            patch_tokens += estimate_tokens(file.patch or '')
+        
+        # Determine change types and required level from file paths in one pass
+        routing = self.path_router.classify(files_changed)
         
         return {
             'files_changed': files_changed,
-            'change_types': list(set(change_types)),
+            'change_types': routing['change_types'],
+            'path_executive_level': routing['executive_level'],
             'pr_title': pr.title,
             'pr_body': pr.body,
-            'author': pr.user.login
+            'author': pr.user.login,
+            'patch_tokens': patch_tokens
         }
     
     def determine_executive_level(self, change_analysis: Dict) -> str:
         """Determine required executive approval level"""
-        change_types = change_analysis['change_types']
-        
-        if 'governance' in change_types or 'charter' in change_types:
-            return 'board'
-        elif 'consensus' in change_types:
-            return 'c-suite'
-        elif 'implementation' in change_types:
-            return 'cco'
-        else:
-            return 'standard'
+        if 'path_executive_level' in change_analysis:
+            return change_analysis['path_executive_level']
+        
+        return self.path_router.highest_level(change_analysis.get('files_changed', []))
     
-    async def get_openai_consensus(self, change_analysis: Dict, executive_level: str) -> Dict:
+    async def get_openai_consensus(self, change_analysis: Dict, executive_level: str,
+                                   files: Optional[List] = None) -> Dict:
         """Get OpenAI review and consensus on changes"""
         if not self.openai_api_key:
             return {'approved': True, 'reasoning': 'OpenAI API not configured', 'confidence': 0}
         
+        diff_section = ''
+        if files and self.review_mode != 'summary':
+            patch_files = [
+                {'filename': f.filename, 'status': f.status, 'patch': f.patch}
+                for f in files
+            ]
+            
+            if self.review_mode == 'map-reduce' or change_analysis.get('patch_tokens', 0) > self.review_token_budget:
+                return await self.review_patches_map_reduce(change_analysis, executive_level, patch_files)
+            
+            diff_section = f"""
+DIFFS:
+{format_chunk({'files': [{**f, 'hunks': f['patch'] or '(no textual diff available)', 'part': None} for f in patch_files]})}
+"""
+        
         prompt = f"""
 You are OpenAI, reviewing executive-level changes to the WireReport AI Autonomous Organization.
 
@@ -245,7 +443,7 @@ CHANGE ANALYSIS:
 - Files Modified: {change_analysis['files_changed']}
 - Title: {change_analysis['pr_title']}
 - Description: {change_analysis['pr_body']}
-
+{diff_section}
 As OpenAI, provide your technical review focusing on:
 1. Technical feasibility
 2. System integration impact
@@ -262,6 +460,11 @@ Respond in JSON format:
 }}
 """
         
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.request_openai_review, prompt)
+    
+    def request_openai_review(self, prompt: str, max_tokens: int = 1000) -> Dict:
+        """Send a review prompt to OpenAI and parse the JSON verdict"""
         try:
             headers = {
                 'Authorization': f'Bearer {self.openai_api_key}',
@@ -275,8 +478,10 @@ Respond in JSON format:
                     {'role': 'user', 'content': prompt}
                 ],
                 'temperature': 0.3,
-                'max_tokens': 1000
+                'max_tokens': max_tokens
             }
+            if structured_output_enabled():
+                data['response_format'] = response_format('code_review_decision', DECISION_SCHEMA)
             
             response = requests.post(
                 'https://api.openai.com/v1/chat/completions',
@@ -287,14 +492,58 @@ Respond in JSON format:
             
             if response.status_code == 200:
                 content = response.json()['choices'][0]['message']['content']
-                # Parse JSON response
-                import json
-                return json.loads(content)
+                # Parse and validate the JSON verdict (bare, fenced or in prose)
+                try:
+                    return extract_json(content, DECISION_SCHEMA)
+                except ReviewParseError as e:
+                    return {'approved': False, 'reasoning': f'Unparseable OpenAI verdict ({e})', 'confidence': 0,
+                            'error': True}
             else:
-                return {'approved': False, 'reasoning': f'API error: {response.status_code}', 'confidence': 0}
+                return {'approved': False, 'reasoning': f'API error: {response.status_code}', 'confidence': 0,
+                        'error': True}
                 
         except Exception as e:
-            return {'approved': False, 'reasoning': f'OpenAI consensus failed: {e}', 'confidence': 0}
+            return {'approved': False, 'reasoning': f'OpenAI consensus failed: {e}', 'confidence': 0, 'error': True}
+    
+    async def review_patches_map_reduce(self, change_analysis: Dict, executive_level: str,
+                                        patch_files: List[Dict]) -> Dict:
+        """Review large diffs chunk by chunk and reduce into one OpenAI verdict"""
+        loop = asyncio.get_running_loop()
+        
+        async def review_chunk(chunk: Dict) -> Dict:
+            prompt = f"""
+You are OpenAI, reviewing one part of a large change to the WireReport AI Autonomous Organization.
+
+PULL REQUEST:
+- Executive Level: {executive_level}
+- Change Types: {change_analysis['change_types']}
+- Title: {change_analysis['pr_title']}
+- Total Files Modified: {len(change_analysis['files_changed'])}
+
+DIFFS IN THIS PART:
+{format_chunk(chunk)}
+
+Review only the diffs above for technical correctness, governance impact and risk.
+
+Respond in JSON format:
+{{
+    "approved": true/false,
+    "reasoning": "concise analysis citing file names",
+    "confidence": 0-100,
+    "recommendations": ["list of suggestions"]
+}}
+"""
+            review = await loop.run_in_executor(None, self.request_openai_review, prompt, 600)
+            if review.get('error'):
+                return {'error': review['reasoning']}
+            return review
+        
+        reviewer = PatchReviewer(
+            review_chunk,
+            token_budget=self.review_token_budget,
+            concurrency=self.review_concurrency
+        )
+        return await reviewer.review(patch_files)
     
     async def get_claude_consensus(self, change_analysis: Dict, executive_level: str) -> Dict:
         """Get Claude consensus (simulated - would integrate with Claude API)"""
@@ -347,68 +596,65 @@ Respond in JSON format:
                 'confidence': 0,
                 'consensus_achieved': False
             }
+            
+            if openai_review.get('cited_files'):
+                decision['reasoning'] += f' Cited files: {", ".join(openai_review["cited_files"])}.'
+        
+        if 'cited_files' in openai_review:
+            decision['cited_files'] = openai_review['cited_files']
         
         return decision
     
     async def sync_local_to_github(self):
         """Sync local organizational folder to GitHub repository"""
         try:
-            # Add GitHub remote if not exists
-            try:
-                result = subprocess.run(['git', 'remote', 'get-url', 'origin'], 
-                                      cwd='/root/wirereport_organization',
-                                      capture_output=True, text=True, check=True)
-            except subprocess.CalledProcessError:
-                # Add remote
-                github_url = f"https://github.com/{self.organization or self.github.get_user().login}/{self.repo_name}.git"
-                subprocess.run(['git', 'remote', 'add', 'origin', github_url],
-                             cwd='/root/wirereport_organization', check=True)
-            
-            # Stage all changes
-            subprocess.run(['git', 'add', '.'], cwd='/root/wirereport_organization', check=True)
-            
-            # Commit changes
-            commit_message = f"CCO Update: Sync organizational documents - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-            subprocess.run(['git', 'commit', '-m', commit_message], 
-                         cwd='/root/wirereport_organization', check=True)
-            
-            # Push to GitHub
-            subprocess.run(['git', 'push', 'origin', 'main'], 
-                         cwd='/root/wirereport_organization', check=True)
+            result = await self.get_incremental_sync().sync()
             
-            print("✅ Successfully synced to GitHub")
+            if result['committed']:
+                print(f"✅ Successfully synced to GitHub: {result['changed']} changed, {result['deleted']} deleted")
             return True
             
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Git sync failed: {e}")
-            return False
         except Exception as e:
             print(f"❌ Sync error: {e}")
             return False
     
+    def get_incremental_sync(self) -> IncrementalSync:
+        """Get the stat-cache sync engine for the organization tree"""
+        if self.incremental_sync is None:
+            self.incremental_sync = IncrementalSync(self, ORGANIZATION_ROOT)
+        return self.incremental_sync
+    
     def generate_approval_report(self) -> str:
-        """Generate approval audit report"""
+        """Generate approval audit report from the full persisted history"""
+        summary = self.approval_log.summarize(recent=10)
+        
         report = f"""
 # CCO Approval Audit Report
 Generated: {datetime.now().isoformat()}
 
 ## Summary
-- Total Reviews: {len(self.approval_log)}
-- Approved: {sum(1 for log in self.approval_log if log.get('cco_decision', {}).get('approved', False))}
-- Rejected: {sum(1 for log in self.approval_log if not log.get('cco_decision', {}).get('approved', False))}
+- Total Reviews: {summary['total']}
+- Approved: {summary['approved']}
+- Rejected: {summary['rejected']}
+- Merged: {summary['merged']}
 
-## Recent Decisions
+## By Executive Level
 """
         
-        for log in self.approval_log[-10:]:  # Last 10 decisions
-            status = "✅ APPROVED" if log.get('cco_decision', {}).get('approved', False) else "❌ REJECTED"
+        for level, counts in sorted(summary['by_level'].items()):
+            report += f"- **{level}**: {counts['approved']}/{counts['total']} approved\n"
+        
+        report += "\n## Recent Decisions\n"
+        
+        for log in summary['recent']:  # Last 10 decisions
+            status = "✅ APPROVED" if log['approved'] else "❌ REJECTED"
             report += f"""
-### PR #{log.get('pr_number', 'N/A')} - {status}
-- **Level**: {log.get('executive_level', 'unknown')}
-- **Changes**: {', '.join(log.get('change_analysis', {}).get('change_types', []))}
-- **OpenAI**: {log.get('openai_review', {}).get('approved', 'N/A')}
-- **Claude**: {log.get('claude_review', {}).get('approved', 'N/A')}
-- **Timestamp**: {log.get('timestamp', 'N/A')}
+### PR #{log['pr_number']} - {status}
+- **Level**: {log['executive_level']}
+- **Changes**: {', '.join(log['change_types'])}
+- **OpenAI**: {log['openai_approved']}
+- **Claude**: {log['claude_approved']}
+- **Timestamp**: {log['timestamp']}
 """
         
         return report
@@ -422,19 +668,36 @@ async def main():
     parser.add_argument('--org', type=str, help='GitHub organization name')
     parser.add_argument('--review-pr', type=int, help='Review pull request number')
     parser.add_argument('--sync', action='store_true', help='Sync local to GitHub')
+    parser.add_argument('--sync-interval', type=float, help='Keep syncing, one commit per interval (seconds)')
+    parser.add_argument('--bulk-upload', nargs='*', metavar='DIR',
+                        help=f'Upload directories in a single commit (default: {" ".join(BULK_UPLOAD_DIRECTORIES)})')
     parser.add_argument('--report', action='store_true', help='Generate approval report')
     
     args = parser.parse_args()
     
     cco = ChiefCodeOfficer()
+    if args.org:
+        cco.organization = args.org
     
     if args.create_repo:
         await cco.create_github_repository(args.org)
     elif args.review_pr:
         result = await cco.review_pull_request(args.review_pr)
         print(json.dumps(result, indent=2))
+    elif args.sync_interval:
+        await cco.get_incremental_sync().run(args.sync_interval)
     elif args.sync:
         await cco.sync_local_to_github()
+    elif args.bulk_upload is not None:
+        directories = args.bulk_upload or BULK_UPLOAD_DIRECTORIES
+        modes = {}
+        files = cco.collect_local_files(directories, modes)
+        await cco.bulk_upload(
+            cco.get_repository(),
+            files,
+            f"CCO Update: Bulk upload of {', '.join(directories)} ({len(files)} files)",
+            modes=modes
+        )
     elif args.report:
         report = cco.generate_approval_report()
         print(report)
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+CCO Merge Train
+Per-repository queue that batches CCO-approved PRs, validates the combined
+head once on a scratch branch and merges the batch in approval order
+The combined head must pass the required status checks, and with strict branch
+protection each PR left behind by the merges ahead of it is updated onto the
+new base and merged only once its own checks pass on the updated head
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional
+from github import GithubException
+
+from cco_status_checks import REQUIRED_STATUS_CONTEXTS
+
+class MergeTrain:
+    def __init__(self, repo, base: str = 'main', max_batch: int = 10, batch_window: float = 5.0,
+                 max_mergeable_polls: int = 8, initial_backoff: float = 1.0, max_backoff: float = 30.0,
+                 checks: Optional[Callable[[str, List], Awaitable]] = None, max_check_polls: int = 10,
+                 max_requeues: int = 3):
+        """checks(sha, prs) runs the required checks for a commit made of prs and publishes
+        them on it; without it the train waits for checks reported by something else"""
+        self.repo = repo
+        self.checks = checks
+        self.max_check_polls = max_check_polls
+        self.max_requeues = max_requeues
+        self.base = base
+        self.max_batch = max_batch
+        self.batch_window = batch_window
+        self.max_mergeable_polls = max_mergeable_polls
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        
+        self.queue = asyncio.Queue()
+        self.worker = None
+        self.trains_run = 0
+        self.requeues = {}    # PR number -> times put back waiting for its checks
+    
+    async def submit(self, pr, commit_message: str) -> Dict:
+        """Queue an approved PR for the next train and wait for its merge result"""
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((pr, commit_message, future))
+        
+        if self.worker is None or self.worker.done():
+            self.worker = asyncio.create_task(self.run())
+        
+        return await future
+    
+    async def run(self):
+        """Form and run trains until the queue is drained"""
+        while not self.queue.empty():
+            batch = [self.queue.get_nowait()]
+            
+            # Give concurrent approvals a short window to join this train
+            deadline = asyncio.get_running_loop().time() + self.batch_window
+            while len(batch) < self.max_batch:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                await self.run_train(batch)
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_result({'merged': False, 'reason': f'Merge train failed: {e}'})
+    
+    async def call(self, func, *args, **kwargs):
+        """Run a blocking GitHub call off the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(None, lambda: func(*args, **kwargs))
+    
+    async def wait_mergeable(self, pr) -> Optional[bool]:
+        """Poll GitHub's lazily computed mergeable flag with exponential backoff"""
+        delay = self.initial_backoff
+        
+        for _ in range(self.max_mergeable_polls):
+            if pr.mergeable is not None:
+                return pr.mergeable
+            await asyncio.sleep(delay)
+            await self.call(pr.update)
+            delay = min(delay * 2, self.max_backoff)
+        
+        return pr.mergeable
+    
+    async def wait_for_checks(self, sha: str) -> Optional[bool]:
+        """Poll a commit's required contexts: True once all succeed, False on any failure,
+        None if some are still pending or missing after polling"""
+        delay = self.initial_backoff
+        
+        for attempt in range(self.max_check_polls):
+            combined = await self.call(lambda: self.repo.get_commit(sha).get_combined_status())
+            states = {status.context: status.state for status in combined.statuses}
+            required = [states.get(context) for context in REQUIRED_STATUS_CONTEXTS]
+            if any(state in ('failure', 'error') for state in required):
+                return False
+            if all(state == 'success' for state in required):
+                return True
+            if attempt + 1 < self.max_check_polls:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_backoff)
+        
+        return None
+    
+    async def check_commit(self, sha: str, prs: List) -> Optional[bool]:
+        """Run the checks for a commit (if configured) and wait for them to report"""
+        if self.checks:
+            await self.checks(sha, prs)
+        return await self.wait_for_checks(sha)
+    
+    def requeue(self, item, reason: str):
+        """Put a PR back for a later train while its checks are pending, up to max_requeues"""
+        pr, _, future = item
+        attempts = self.requeues.get(pr.number, 0) + 1
+        if attempts > self.max_requeues:
+            self.requeues.pop(pr.number, None)
+            future.set_result({'merged': False, 'reason': f'{reason} after {self.max_requeues} retries',
+                               'train': self.trains_run})
+            return
+        self.requeues[pr.number] = attempts
+        self.queue.put_nowait(item)
+        print(f"   ⏳ PR #{pr.number} back in the queue: {reason}")
+    
+    def finish(self, pr, future, result: Dict):
+        self.requeues.pop(pr.number, None)
+        future.set_result({**result, 'train': self.trains_run})
+    
+    async def update_head(self, pr):
+        """Merge the moved base into a PR head (GitHub's "Update branch") and wait for the new head"""
+        old_sha = pr.head.sha
+        await self.call(pr.update_branch, old_sha)
+        
+        delay = self.initial_backoff
+        for _ in range(self.max_mergeable_polls):
+            await self.call(pr.update)
+            if pr.head.sha != old_sha:
+                return
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_backoff)
+        raise RuntimeError(f"head of PR #{pr.number} was not updated onto {self.base}")
+    
+    async def run_train(self, batch: List):
+        """Validate the combined head of a batch once, then merge it in order"""
+        self.trains_run += 1
+        # A requeued PR may already have been failed by an earlier train's error
+        batch = [item for item in batch if not item[2].done()]
+        print(f"🚂 Merge train #{self.trains_run}: {len(batch)} approved PRs → {self.base}")
+        
+        candidates = []
+        mergeable_flags = await asyncio.gather(*[self.wait_mergeable(pr) for pr, _, _ in batch])
+        for (pr, commit_message, future), mergeable in zip(batch, mergeable_flags):
+            if mergeable:
+                candidates.append((pr, commit_message, future))
+            else:
+                state = 'still being computed' if mergeable is None else 'conflicting'
+                self.finish(pr, future, {'merged': False, 'reason': f'Mergeability {state} after polling'})
+        
+        if not candidates:
+            return
+        
+        # Trial-merge every candidate onto a scratch branch cut from the current base,
+        # then require the checks to pass on the combined head
+        base_sha = (await self.call(self.repo.get_branch, self.base)).commit.sha
+        train_branch = f"cco-merge-train/{datetime.now().strftime('%Y%m%d%H%M%S')}-{self.trains_run}"
+        train_ref = await self.call(self.repo.create_git_ref, f'refs/heads/{train_branch}', base_sha)
+        
+        validated = []
+        try:
+            for pr, commit_message, future in candidates:
+                try:
+                    await self.call(self.repo.merge, train_branch, pr.head.sha, f"Merge train: #{pr.number}")
+                    validated.append((pr, commit_message, future))
+                except GithubException as e:
+                    self.finish(pr, future, {'merged': False, 'reason': f'Conflicts with PRs ahead in the train: {e.data}'})
+            
+            if validated:
+                train_head = (await self.call(self.repo.get_branch, train_branch)).commit.sha
+                passed = await self.check_commit(train_head, [pr for pr, _, _ in validated])
+                if passed is None:
+                    for item in validated:
+                        self.requeue(item, 'checks on the combined head are still pending')
+                    return
+                if not passed:
+                    for pr, _, future in validated:
+                        self.finish(pr, future, {'merged': False, 'reason': 'Combined head failed the required checks'})
+                    print(f"   ❌ Combined head of train #{self.trains_run} failed the required checks")
+                    return
+        finally:
+            await self.call(train_ref.delete)
+        
+        # Combined head is valid - merge each PR in approval order. A PR left behind by the
+        # merges ahead of it is updated onto the base and merged only once its own checks
+        # pass on the updated head
+        for item in validated:
+            pr, commit_message, future = item
+            try:
+                await self.call(pr.update)
+                mergeable = await self.wait_mergeable(pr)
+                if mergeable and pr.mergeable_state == 'behind':
+                    await self.update_head(pr)
+                    print(f"   🔄 Updated PR #{pr.number} onto {self.base}, re-running checks")
+                    passed = await self.check_commit(pr.head.sha, [pr])
+                    if passed is None:
+                        self.requeue(item, 'checks on the updated head are still pending')
+                        continue
+                    if not passed:
+                        self.finish(pr, future, {'merged': False, 'reason': f'Checks failed after updating onto {self.base}'})
+                        print(f"   ❌ PR #{pr.number} failed checks on the updated head")
+                        continue
+                    mergeable = await self.wait_mergeable(pr)
+                if not mergeable:
+                    self.finish(pr, future, {'merged': False, 'reason': f'Not mergeable onto the updated {self.base}'})
+                    print(f"   ❌ PR #{pr.number} no longer mergeable")
+                    continue
+                
+                status = await self.call(pr.merge, commit_message=commit_message, sha=pr.head.sha)
+                self.finish(pr, future, {'merged': status.merged, 'sha': status.sha})
+                print(f"   ✅ Merged PR #{pr.number}")
+            except (GithubException, RuntimeError) as e:
+                reason = e.data if isinstance(e, GithubException) else e
+                self.finish(pr, future, {'merged': False, 'reason': f'Merge rejected: {reason}'})
+                print(f"   ❌ PR #{pr.number} merge rejected")
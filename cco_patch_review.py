@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+CCO Map-Reduce Patch Review
+Splits large pull request diffs by file and hunk under a token budget,
+reviews the chunks concurrently and reduces the verdicts into one review
+"""
+
+import re
+import asyncio
+from typing import Awaitable, Callable, Dict, List
+
+HUNK_HEADER = re.compile(r'^@@ ', re.MULTILINE)
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token)"""
+    return len(text) // 4 + 1
+
+def split_patch_hunks(patch: str) -> List[str]:
+    """Split a unified diff patch into its @@ hunks"""
+    if not patch:
+        return []
+    
+    starts = [m.start() for m in HUNK_HEADER.finditer(patch)]
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+    
+    return [patch[start:end] for start, end in zip(starts, starts[1:] + [len(patch)]) if patch[start:end].strip()]
+
+def split_oversized(text: str, token_budget: int) -> List[str]:
+    """Split text on line boundaries into pieces that fit the token budget"""
+    pieces = []
+    current = []
+    current_tokens = 0
+    
+    for line in text.splitlines(keepends=True):
+        line_tokens = estimate_tokens(line)
+        if current and current_tokens + line_tokens > token_budget:
+            pieces.append(''.join(current))
+            current, current_tokens = [], 0
+        
+        # A single line longer than the budget is hard-truncated
+        if line_tokens > token_budget:
+            line = line[:token_budget * 4] + '\n'
+            line_tokens = token_budget
+        
+        current.append(line)
+        current_tokens += line_tokens
+    
+    if current:
+        pieces.append(''.join(current))
+    return pieces
+
+def chunk_pr_files(files: List[Dict], token_budget: int) -> List[Dict]:
+    """Pack file patches into review chunks no larger than token_budget
+    
+    Small files are packed together; a file whose patch exceeds the budget is
+    split by hunk, and a hunk that still exceeds it is split by lines.
+    """
+    chunks = []
+    current = {'files': [], 'tokens': 0}
+    
+    def flush():
+        nonlocal current
+        if current['files']:
+            chunks.append(current)
+        current = {'files': [], 'tokens': 0}
+    
+    def add(piece: Dict):
+        if current['tokens'] + piece['tokens'] > token_budget:
+            flush()
+        current['files'].append(piece)
+        current['tokens'] += piece['tokens']
+    
+    for file in files:
+        patch = file.get('patch') or ''
+        header = {'filename': file['filename'], 'status': file.get('status', 'modified')}
+        
+        if not patch:
+            # Binary or oversized file GitHub did not diff - review by name only
+            add({**header, 'hunks': '(no textual diff available)', 'part': None, 'tokens': estimate_tokens(file['filename'])})
+            continue
+        
+        if estimate_tokens(patch) <= token_budget:
+            add({**header, 'hunks': patch, 'part': None, 'tokens': estimate_tokens(patch)})
+            continue
+        
+        pieces = []
+        for hunk in split_patch_hunks(patch):
+            pieces.extend(split_oversized(hunk, token_budget) if estimate_tokens(hunk) > token_budget else [hunk])
+        
+        # Pack consecutive hunks of the same file together where they fit
+        group, group_tokens = [], 0
+        parts = []
+        for piece in pieces:
+            piece_tokens = estimate_tokens(piece)
+            if group and group_tokens + piece_tokens > token_budget:
+                parts.append(''.join(group))
+                group, group_tokens = [], 0
+            group.append(piece)
+            group_tokens += piece_tokens
+        if group:
+            parts.append(''.join(group))
+        
+        for index, part in enumerate(parts, 1):
+            add({**header, 'hunks': part, 'part': f'{index}/{len(parts)}', 'tokens': estimate_tokens(part)})
+    
+    flush()
+    return chunks
+
+def format_chunk(chunk: Dict) -> str:
+    """Render a chunk's diffs for a review prompt"""
+    sections = []
+    for piece in chunk['files']:
+        label = piece['filename'] + (f" (part {piece['part']})" if piece['part'] else '')
+        sections.append(f"--- {label} [{piece['status']}]\n{piece['hunks']}")
+    return '\n\n'.join(sections)
+
+def reduce_chunk_verdicts(verdicts: List[Dict], total_chunks: int) -> Dict:
+    """Reduce per-chunk verdicts into a single review with cited files
+    
+    Every chunk must be reviewed and approved for the PR to be approved;
+    files from rejected or unreviewed chunks are cited in the reasoning.
+    """
+    reviewed = [v for v in verdicts if not v.get('error')]
+    rejected = [v for v in reviewed if not v.get('approved', False)]
+    failed = [v for v in verdicts if v.get('error')]
+    
+    cited_files = []
+    for verdict in rejected + failed:
+        for filename in verdict['files']:
+            if filename not in cited_files:
+                cited_files.append(filename)
+    
+    recommendations = []
+    for verdict in reviewed:
+        for recommendation in verdict.get('recommendations', []):
+            if recommendation not in recommendations:
+                recommendations.append(recommendation)
+    
+    approved = bool(reviewed) and not rejected and not failed and len(verdicts) == total_chunks
+    confidences = [v.get('confidence', 0) for v in reviewed]
+    confidence = min(confidences) if confidences else 0
+    
+    if approved:
+        reasoning = f"All {total_chunks} diff chunks approved. " + ' '.join(
+            v.get('reasoning', '') for v in reviewed[:3]
+        )
+    else:
+        reasoning = (
+            f"{len(rejected)} of {total_chunks} diff chunks rejected, "
+            f"{len(failed)} not reviewed. "
+            f"Cited files: {', '.join(cited_files) or 'none'}. "
+        ) + ' '.join(f"[{', '.join(v['files'])}] {v.get('reasoning', '')}" for v in rejected[:5])
+    
+    return {
+        'approved': approved,
+        'reasoning': reasoning.strip(),
+        'confidence': confidence,
+        'recommendations': recommendations[:20],
+        'cited_files': cited_files,
+        'review_mode': 'map-reduce',
+        'chunks_total': total_chunks,
+        'chunks_reviewed': len(reviewed),
+        'chunk_verdicts': [
+            {'files': v['files'], 'approved': v.get('approved', False), 'confidence': v.get('confidence', 0), 'error': v.get('error')}
+            for v in verdicts
+        ]
+    }
+
+class PatchReviewer:
+    def __init__(self, review_chunk: Callable[[Dict], Awaitable[Dict]], token_budget: int = 6000,
+                 concurrency: int = 8, chunk_timeout: float = 90, review_timeout: float = 300):
+        self.review_chunk = review_chunk
+        self.token_budget = token_budget
+        self.concurrency = concurrency
+        self.chunk_timeout = chunk_timeout
+        self.review_timeout = review_timeout
+    
+    async def review(self, files: List[Dict]) -> Dict:
+        """Map chunks to concurrent reviews and reduce them into one verdict"""
+        chunks = chunk_pr_files(files, self.token_budget)
+        if not chunks:
+            return {'approved': True, 'reasoning': 'No file changes to review', 'confidence': 0, 'cited_files': []}
+        
+        print(f"   🧩 Map-reduce review: {len(files)} files in {len(chunks)} chunks")
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        def chunk_files(chunk: Dict) -> List[str]:
+            return list(dict.fromkeys(piece['filename'] for piece in chunk['files']))
+        
+        async def review_one(chunk: Dict) -> Dict:
+            async with semaphore:
+                try:
+                    verdict = await asyncio.wait_for(self.review_chunk(chunk), timeout=self.chunk_timeout)
+                except asyncio.TimeoutError:
+                    verdict = {'error': f'chunk review timed out after {self.chunk_timeout}s'}
+                except Exception as e:
+                    verdict = {'error': f'chunk review failed: {e}'}
+            verdict['files'] = chunk_files(chunk)
+            return verdict
+        
+        tasks = [asyncio.ensure_future(review_one(chunk)) for chunk in chunks]
+        done, pending = await asyncio.wait(tasks, timeout=self.review_timeout)
+        for task in pending:
+            task.cancel()
+        
+        verdicts = [
+            task.result() if task in done
+            else {'error': f'not reviewed within {self.review_timeout}s', 'files': chunk_files(chunk)}
+            for chunk, task in zip(chunks, tasks)
+        ]
+        return reduce_chunk_verdicts(verdicts, len(chunks))
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+CCO Path Router
+Compiled CODEOWNERS-style routing of changed file paths to executive levels
+Each path is classified in a single walk of a segment trie
+"""
+
+import os
+import re
+import fnmatch
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Executive levels from lowest to highest authority
+LEVEL_RANK = {'standard': 0, 'cco': 1, 'c-suite': 2, 'board': 3}
+
+# <pattern> <executive level> <change type>
+DEFAULT_PATH_RULES = """
+governance/      board    governance
+charters/        board    charter
+consensus/       c-suite  consensus
+implementation/  cco      implementation
+"""
+
+class _Node:
+    __slots__ = ('literal', 'globs', 'double_star', 'is_double_star', 'routes', 'subtree_routes')
+    
+    def __init__(self):
+        self.literal = {}          # segment -> _Node
+        self.globs = []            # [(compiled segment regex, _Node)]
+        self.double_star = None    # _Node matching zero or more segments
+        self.is_double_star = False
+        self.routes = []           # routes for paths ending exactly here
+        self.subtree_routes = []   # routes for any path below this node
+
+class PathRouter:
+    def __init__(self, rules: List[Tuple[str, str, str]]):
+        """Compile (pattern, level, change_type) rules into a segment trie"""
+        self.rules = rules
+        self.root = _Node()
+        
+        for pattern, level, change_type in rules:
+            if level not in LEVEL_RANK:
+                raise ValueError(f"Unknown executive level '{level}' for pattern '{pattern}'")
+            self._add(pattern, (LEVEL_RANK[level], level, change_type))
+        
+        self._directory_states = lru_cache(maxsize=65536)(self._walk_directory)
+    
+    @classmethod
+    def from_codeowners(cls, text: str) -> 'PathRouter':
+        """Build a router from CODEOWNERS-style lines: <pattern> <level> [change type]"""
+        rules = []
+        for line in text.splitlines():
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            parts = line.split()
+            if len(parts) < 2:
+                raise ValueError(f"Invalid path rule: '{line}'")
+            level = parts[1].lstrip('@')
+            change_type = parts[2] if len(parts) > 2 else level
+            rules.append((parts[0], level, change_type))
+        return cls(rules)
+    
+    @classmethod
+    def load(cls, rules_file: Optional[str] = None) -> 'PathRouter':
+        """Load rules from CCO_PATH_RULES (or the given file), falling back to the defaults"""
+        rules_file = rules_file or os.getenv('CCO_PATH_RULES')
+        if rules_file and os.path.exists(rules_file):
+            with open(rules_file, 'r') as f:
+                return cls.from_codeowners(f.read())
+        return cls.from_codeowners(DEFAULT_PATH_RULES)
+    
+    def _add(self, pattern: str, route: Tuple[int, str, str]):
+        directory_only = pattern.endswith('/')
+        # Like CODEOWNERS, a pattern with a leading or inner slash is anchored to the root;
+        # one without matches at any depth
+        anchored = pattern.startswith('/') or '/' in pattern.strip('/')
+        segments = [s for s in pattern.split('/') if s]
+        
+        if not anchored and not segments[0] == '**':
+            segments.insert(0, '**')
+        
+        node = self.root
+        for segment in segments:
+            if segment == '**':
+                if node.double_star is None:
+                    node.double_star = _Node()
+                    node.double_star.is_double_star = True
+                node = node.double_star
+            elif any(c in segment for c in '*?['):
+                regex = re.compile(fnmatch.translate(segment))
+                for existing_regex, child in node.globs:
+                    if existing_regex.pattern == regex.pattern:
+                        node = child
+                        break
+                else:
+                    child = _Node()
+                    node.globs.append((regex, child))
+                    node = child
+            else:
+                node = node.literal.setdefault(segment, _Node())
+        
+        # A directory pattern covers everything below it; others match paths ending here
+        # ('dir/*' only direct children, 'dir/**' any depth through the ** node)
+        if directory_only:
+            node.subtree_routes.append(route)
+        else:
+            node.routes.append(route)
+    
+    @staticmethod
+    def _closure(nodes: Iterable[_Node]) -> frozenset:
+        """Add nodes reachable by letting ** match zero segments"""
+        result = set()
+        stack = list(nodes)
+        while stack:
+            node = stack.pop()
+            if node in result:
+                continue
+            result.add(node)
+            if node.double_star is not None:
+                stack.append(node.double_star)
+        return frozenset(result)
+    
+    def _step(self, states: frozenset, segment: str) -> frozenset:
+        next_states = []
+        for node in states:
+            child = node.literal.get(segment)
+            if child is not None:
+                next_states.append(child)
+            for regex, glob_child in node.globs:
+                if regex.match(segment):
+                    next_states.append(glob_child)
+            if node.is_double_star:
+                next_states.append(node)
+        return self._closure(next_states)
+    
+    def _walk_directory(self, directory: str) -> Tuple[frozenset, Optional[Tuple[int, str, str]]]:
+        """States after consuming a directory, plus the best subtree route passed on the way"""
+        if not directory:
+            return self._closure([self.root]), None
+        
+        parent, _, segment = directory.rpartition('/')
+        parent_states, best = self._directory_states(parent)
+        
+        for node in parent_states:
+            for route in node.subtree_routes:
+                if best is None or route[0] > best[0]:
+                    best = route
+        
+        return self._step(parent_states, segment), best
+    
+    def route(self, path: str) -> Optional[Tuple[str, str]]:
+        """Return (executive level, change type) of the highest-ranked rule matching path"""
+        directory, _, filename = path.strip('/').rpartition('/')
+        states, best = self._directory_states(directory)
+        
+        for node in states:
+            for route in node.subtree_routes:
+                if best is None or route[0] > best[0]:
+                    best = route
+        
+        for node in self._step(states, filename):
+            for route in node.routes:
+                if best is None or route[0] > best[0]:
+                    best = route
+        
+        return (best[1], best[2]) if best else None
+    
+    def classify(self, paths: Iterable[str]) -> Dict:
+        """Classify paths once each: change types seen and the highest executive level"""
+        change_types = []
+        highest = 'standard'
+        
+        for path in paths:
+            routed = self.route(path)
+            if routed is None:
+                continue
+            level, change_type = routed
+            if change_type not in change_types:
+                change_types.append(change_type)
+            if LEVEL_RANK[level] > LEVEL_RANK[highest]:
+                highest = level
+        
+        return {'change_types': change_types, 'executive_level': highest}
+    
+    def highest_level(self, paths: Iterable[str]) -> str:
+        """Highest executive level required by any path, stopping early at the top level"""
+        top = max(LEVEL_RANK.values())
+        highest = 'standard'
+        
+        for path in paths:
+            routed = self.route(path)
+            if routed and LEVEL_RANK[routed[0]] > LEVEL_RANK[highest]:
+                highest = routed[0]
+                if LEVEL_RANK[highest] == top:
+                    break
+        
+        return highest
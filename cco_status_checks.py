@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+CCO Status Check Publisher
+Publishes the branch protection status contexts as reviewers finish
+Updates are coalesced per head SHA so only the latest state of each context is posted
+"""
+
+import asyncio
+from typing import Dict, Optional, Tuple
+
+# Branch protection contexts required on main
+CONSENSUS_CONTEXT = 'cco-consensus-check'
+OPENAI_CONTEXT = 'openai-approval'
+CLAUDE_CONTEXT = 'claude-approval'
+REQUIRED_STATUS_CONTEXTS = [CONSENSUS_CONTEXT, OPENAI_CONTEXT, CLAUDE_CONTEXT]
+
+class StatusPublisher:
+    def __init__(self, repo, flush_delay: float = 1.0, target_url: Optional[str] = None):
+        self.repo = repo
+        self.flush_delay = flush_delay
+        self.target_url = target_url
+        
+        self.pending = {}     # sha -> {context: (state, description)}
+        self.published = {}   # sha -> {context: (state, description)}
+        self.flush_tasks = {} # sha -> scheduled flush task
+        self.flush_locks = {} # sha -> lock serializing posts for that SHA
+        self.api_calls = 0
+    
+    def update(self, sha: str, context: str, state: str, description: str):
+        """Record a context's latest state; it is posted on the next flush for this SHA"""
+        self.pending.setdefault(sha, {})[context] = (state, description[:140])
+        
+        task = self.flush_tasks.get(sha)
+        if task is None or task.done():
+            self.flush_tasks[sha] = asyncio.create_task(self.delayed_flush(sha))
+    
+    def update_all(self, sha: str, state: str, description: str):
+        """Set every required context to the same state"""
+        for context in REQUIRED_STATUS_CONTEXTS:
+            self.update(sha, context, state, description)
+    
+    async def delayed_flush(self, sha: str):
+        await asyncio.sleep(self.flush_delay)
+        if sha in self.pending:
+            await self.flush(sha)
+    
+    async def flush(self, sha: str):
+        """Post the coalesced states for a SHA, skipping contexts whose state did not change"""
+        lock = self.flush_locks.setdefault(sha, asyncio.Lock())
+        async with lock:
+            await self.post_pending(sha)
+    
+    async def post_pending(self, sha: str):
+        updates = self.pending.pop(sha, {})
+        published = self.published.setdefault(sha, {})
+        changed = {ctx: value for ctx, value in updates.items() if published.get(ctx) != value}
+        if not changed:
+            return
+        
+        loop = asyncio.get_running_loop()
+        commit = await loop.run_in_executor(None, self.repo.get_commit, sha)
+        
+        def post(context: str, state: str, description: str):
+            kwargs = {'state': state, 'description': description, 'context': context}
+            if self.target_url:
+                kwargs['target_url'] = self.target_url
+            commit.create_status(**kwargs)
+        
+        results = await asyncio.gather(*[
+            loop.run_in_executor(None, post, context, state, description)
+            for context, (state, description) in changed.items()
+        ], return_exceptions=True)
+        
+        for (context, value), result in zip(changed.items(), results):
+            if isinstance(result, Exception):
+                print(f"⚠️ Status {context} for {sha[:7]} failed: {result}")
+                # Keep it pending unless a newer state already replaced it
+                self.pending.setdefault(sha, {}).setdefault(context, value)
+            else:
+                published[context] = value
+                self.api_calls += 1
+    
+    async def settle(self, sha: str, final: bool = False):
+        """Flush a SHA now, waiting for any in-flight posts (e.g. before merging)
+        
+        final drops the SHA's bookkeeping once everything has been posted.
+        """
+        await self.flush(sha)
+        
+        if final and sha not in self.pending:
+            self.published.pop(sha, None)
+            self.flush_locks.pop(sha, None)
+            self.flush_tasks.pop(sha, None)
+    
+    def latest(self, sha: str) -> Dict[str, Tuple[str, str]]:
+        """Latest known state per context, published or pending"""
+        return {**self.published.get(sha, {}), **self.pending.get(sha, {})}
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Incremental Organization Sync
+Stat-cache driven sync of the local organization tree to GitHub
+Stages only changed paths and commits them in-process via the Git Data API
+"""
+
+import os
+import re
+import stat
+import json
+import hashlib
+import asyncio
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+# Never synced, even when not covered by .gitignore: VCS metadata, bytecode and the sync cache itself
+IGNORED_DIRECTORIES = {'.git', '__pycache__', '.pytest_cache', '.mypy_cache', '.venv', 'venv'}
+IGNORED_SUFFIXES = ('.pyc', '.pyo', '.swp', '.tmp')
+SYNC_CACHE_FILE = '.cco_sync_cache.json'
+
+def git_blob_sha(data: bytes) -> str:
+    """Compute the git blob SHA-1 of file content (matches GitHub blob SHAs)"""
+    digest = hashlib.sha1()
+    digest.update(b'blob %d\0' % len(data))
+    digest.update(data)
+    return digest.hexdigest()
+
+def git_file_mode(st_mode: int) -> str:
+    """Git tree mode for a regular file: executable if any execute bit is set"""
+    return '100755' if st_mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH) else '100644'
+
+def gitignore_glob(pattern: str) -> str:
+    """Regex for a gitignore glob: * and ? stay within a segment, ** crosses segments"""
+    regex = ''
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith('**/', i):
+            regex += '(?:.*/)?'
+            i += 3
+            continue
+        if pattern.startswith('**', i):
+            regex += '.*'
+            i += 2
+            continue
+        char = pattern[i]
+        if char == '*':
+            regex += '[^/]*'
+        elif char == '?':
+            regex += '[^/]'
+        elif char == '[' and pattern.find(']', i + 2) != -1:
+            end = pattern.find(']', i + 2)
+            body = pattern[i + 1:end]
+            if body.startswith('!'):
+                body = '^' + body[1:]
+            regex += '[' + body.replace('\\', '\\\\') + ']'
+            i = end
+        elif char == '\\' and i + 1 < len(pattern):
+            i += 1
+            regex += re.escape(pattern[i])
+        else:
+            regex += re.escape(char)
+        i += 1
+    return regex
+
+def parse_gitignore(text: str, base: str) -> List[Tuple[re.Pattern, bool, bool, str]]:
+    """(regex, negated, directory_only, base) rules of a .gitignore in directory base ('' or 'dir/')"""
+    rules = []
+    for line in text.splitlines():
+        line = line.rstrip()
+        if not line or line.startswith('#'):
+            continue
+        negated = line.startswith('!')
+        if negated:
+            line = line[1:]
+        if line.startswith('\\'):
+            line = line[1:]
+        directory_only = line.endswith('/')
+        line = line.rstrip('/')
+        if not line:
+            continue
+        # A slash anywhere but the end anchors the pattern to the .gitignore's directory
+        anchored = '/' in line
+        regex = ('' if anchored else '(?:.*/)?') + gitignore_glob(line.lstrip('/')) + '$'
+        rules.append((re.compile(regex), negated, directory_only, base))
+    return rules
+
+def is_ignored(rules: List[Tuple[re.Pattern, bool, bool, str]], repo_path: str, is_directory: bool) -> bool:
+    """Whether the last matching rule (deeper .gitignore files last) excludes the path"""
+    ignored = False
+    for regex, negated, directory_only, base in rules:
+        if directory_only and not is_directory:
+            continue
+        if regex.match(repo_path[len(base):]):
+            ignored = not negated
+    return ignored
+
+class IncrementalSync:
+    def __init__(self, cco, root: str, branch: str = 'main', cache_file: Optional[str] = None):
+        self.cco = cco
+        self.root = root
+        self.branch = branch
+        self.cache_file = cache_file or os.path.join(root, SYNC_CACHE_FILE)
+        
+        # repo path -> {'mtime_ns', 'size', 'sha', 'mode'} of the last synced content
+        self.cache, self.head_sha = self.load_cache()
+        self.stats_refreshed = False
+        
+        # .gitignore path -> (mtime_ns, parsed rules), re-parsed only when the file changes
+        self.ignore_files = {}
+        
+        # repo path -> {'sha', 'mode'} on the remote, consulted only for files not yet cached
+        self.remote_blobs = {}
+    
+    def load_cache(self) -> Tuple[Dict[str, Dict], Optional[str]]:
+        """Load the stat cache and last synced head from disk"""
+        try:
+            with open(self.cache_file, 'r') as f:
+                cached = json.load(f)
+            return cached.get('files', {}), cached.get('head_sha')
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}, None
+    
+    def save_cache(self, head_sha: Optional[str]):
+        """Persist the stat cache atomically"""
+        self.head_sha = head_sha
+        self.stats_refreshed = False
+        tmp_file = f"{self.cache_file}.tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump({
+                'branch': self.branch,
+                'head_sha': head_sha,
+                'updated': datetime.now().isoformat(),
+                'files': self.cache
+            }, f, separators=(',', ':'))
+        os.replace(tmp_file, self.cache_file)
+    
+    def seed_from_remote(self, repo):
+        """Record the remote blob SHAs so local files already on the remote are not re-uploaded
+        
+        Only change detection uses them: files that exist only on the remote (e.g.
+        the README stubs from the initial commit) are left alone, not deleted.
+        """
+        self.head_sha = repo.get_git_ref(f'heads/{self.branch}').object.sha
+        tree = repo.get_git_tree(self.head_sha, recursive=True)
+        self.remote_blobs = {
+            element.path: {'sha': element.sha, 'mode': element.mode}
+            for element in tree.tree if element.type == 'blob'
+        }
+    
+    def ignore_rules(self, path: str, base: str) -> List[Tuple[re.Pattern, bool, bool, str]]:
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+            cached = self.ignore_files.get(path)
+            if cached is None or cached[0] != mtime_ns:
+                with open(path, 'r', errors='replace') as f:
+                    cached = self.ignore_files[path] = (mtime_ns, parse_gitignore(f.read(), base))
+            return cached[1]
+        except OSError:
+            return []
+    
+    def iter_files(self):
+        """Yield (repo_path, stat) for every syncable file under root, honoring .gitignore files
+        
+        Ignore rules are applied during the walk, so excluded directories are never entered.
+        """
+        cache_name = os.path.basename(self.cache_file)
+        stack = [(self.root, '', [])]
+        
+        while stack:
+            directory, prefix, rules = stack.pop()
+            try:
+                with os.scandir(directory) as scanned:
+                    entries = list(scanned)
+            except OSError:
+                continue
+            
+            if any(entry.name == '.gitignore' for entry in entries):
+                rules = rules + self.ignore_rules(os.path.join(directory, '.gitignore'), prefix)
+            
+            for entry in entries:
+                repo_path = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in IGNORED_DIRECTORIES and not is_ignored(rules, repo_path, True):
+                        stack.append((entry.path, f"{repo_path}/", rules))
+                elif entry.is_file(follow_symlinks=False):
+                    if entry.name.endswith(IGNORED_SUFFIXES) or entry.name.startswith(cache_name):
+                        continue
+                    if not is_ignored(rules, repo_path, False):
+                        yield repo_path, entry.stat(follow_symlinks=False)
+    
+    def scan(self) -> Tuple[Dict[str, Tuple[bytes, Dict]], List[str]]:
+        """Find changed and deleted paths since the last sync
+        
+        Files whose mtime and size match the cache are skipped without being
+        read. Files whose stat changed are hashed and only reported when the
+        content actually differs from what was last synced.
+        """
+        changed = {}
+        seen = set()
+        
+        for repo_path, file_stat in self.iter_files():
+            seen.add(repo_path)
+            cached = self.cache.get(repo_path)
+            mode = git_file_mode(file_stat.st_mode)
+            
+            # chmod does not touch mtime, so the mode is part of the fast check
+            # (entries cached before modes were tracked were all uploaded as 100644)
+            if (cached and cached['mtime_ns'] == file_stat.st_mtime_ns and cached['size'] == file_stat.st_size
+                    and cached.get('mode', '100644') == mode):
+                continue
+            
+            with open(os.path.join(self.root, repo_path), 'rb') as f:
+                data = f.read()
+            
+            entry = {'mtime_ns': file_stat.st_mtime_ns, 'size': file_stat.st_size, 'sha': git_blob_sha(data),
+                     'mode': mode}
+            synced = cached or self.remote_blobs.get(repo_path)
+            if synced and synced['sha'] == entry['sha'] and synced.get('mode', '100644') == mode:
+                # Touched (or never cached) but identical - refresh stat only
+                self.cache[repo_path] = entry
+                self.stats_refreshed = True
+                continue
+            
+            changed[repo_path] = (data, entry)
+        
+        deleted = [path for path in self.cache if path not in seen]
+        return changed, deleted
+    
+    async def sync(self, message: Optional[str] = None) -> Dict:
+        """Commit all changes since the last sync as one commit; no-op when nothing changed"""
+        repo = self.cco.get_repository()
+        
+        if not self.cache:
+            self.seed_from_remote(repo)
+        
+        changed, deleted = await asyncio.get_running_loop().run_in_executor(None, self.scan)
+        
+        if not changed and not deleted:
+            if self.stats_refreshed:
+                self.save_cache(self.head_sha)
+            print("✅ Already in sync - no changes to push")
+            return {'committed': False, 'changed': 0, 'deleted': 0}
+        
+        commit_message = message or (
+            f"CCO Update: Sync organizational documents - {datetime.now().strftime('%Y-%m-%d %H:%M')} "
+            f"({len(changed)} changed, {len(deleted)} deleted)"
+        )
+        
+        commit = await self.cco.bulk_upload(
+            repo,
+            {path: data for path, (data, _) in changed.items()},
+            commit_message,
+            branch=self.branch,
+            deletions=deleted,
+            modes={path: entry['mode'] for path, (_, entry) in changed.items()}
+        )
+        
+        for path, (_, entry) in changed.items():
+            self.cache[path] = entry
+        for path in deleted:
+            self.cache.pop(path, None)
+        self.save_cache(commit.sha)
+        self.remote_blobs = {}
+        
+        return {'committed': True, 'commit_sha': commit.sha, 'changed': len(changed), 'deleted': len(deleted)}
+    
+    async def run(self, interval_seconds: float):
+        """Sync continuously, batching all changes within each interval into one commit"""
+        print(f"🔄 Incremental sync every {interval_seconds:.0f}s: {self.root} → {self.branch}")
+        
+        while True:
+            try:
+                await self.sync()
+            except Exception as e:
+                print(f"❌ Sync error: {e}")
+            await asyncio.sleep(interval_seconds)
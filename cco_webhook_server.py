@@ -12,12 +12,14 @@ import hmac
 import hashlib
 import os
 from cco_github_manager import ChiefCodeOfficer
+from segmented_log import get_log_writer, tail_log_records, count_log_records
 
 app = Flask(__name__)
 
 # Configuration
 WEBHOOK_SECRET = os.getenv('GITHUB_WEBHOOK_SECRET', 'cco-webhook-secret-2025')
 CCO_PORT = int(os.getenv('CCO_WEBHOOK_PORT', '8090'))
+DECISION_LOG_FILE = '/root/wirereport_organization/logs/cco_decisions.jsonl'
 
 # Initialize CCO
 cco = ChiefCodeOfficer()
@@ -136,25 +138,19 @@ def log_cco_decision(pr_number: int, result: dict):
         'consensus_achieved': result.get('cco_decision', {}).get('consensus_achieved', False)
     }
     
-    # Append to log file
-    log_file = '/root/wirereport_organization/logs/cco_decisions.jsonl'
-    os.makedirs(os.path.dirname(log_file), exist_ok=True)
-    
-    with open(log_file, 'a') as f:
-        f.write(json.dumps(log_entry) + '\n')
+    # Queue on the shared buffered log writer
+    get_log_writer(DECISION_LOG_FILE).append(log_entry)
 
 @app.route('/cco/status', methods=['GET'])
 def get_cco_status():
     """Get CCO system status"""
     
-    # Count recent decisions
-    log_file = '/root/wirereport_organization/logs/cco_decisions.jsonl'
+    # Count recent decisions across all log segments
     recent_decisions = 0
     
     try:
-        if os.path.exists(log_file):
-            with open(log_file, 'r') as f:
-                recent_decisions = sum(1 for line in f)
+        get_log_writer(DECISION_LOG_FILE).flush()
+        recent_decisions = count_log_records(DECISION_LOG_FILE)
     except:
         pass
     
@@ -173,16 +169,12 @@ def get_cco_status():
 def get_recent_decisions():
     """Get recent CCO decisions"""
     
-    log_file = '/root/wirereport_organization/logs/cco_decisions.jsonl'
     decisions = []
     
     try:
-        if os.path.exists(log_file):
-            with open(log_file, 'r') as f:
-                lines = f.readlines()
-                # Get last 20 decisions
-                for line in lines[-20:]:
-                    decisions.append(json.loads(line.strip()))
+        get_log_writer(DECISION_LOG_FILE).flush()
+        # Get last 20 decisions
+        decisions = tail_log_records(DECISION_LOG_FILE, 20)
     except Exception as e:
         return jsonify({'error': f'Failed to read decisions: {e}'}), 500
     
@@ -7,15 +7,37 @@ Ensures complete alignment before moving to operations
 
 import os
 import json
+import time
 import asyncio
-import requests
 from datetime import datetime
 from typing import Dict, List, Optional
 import glob
+from review_json import extract_json, ReviewParseError
+from openai_client import OpenAIClient
+from phase_scheduler import Phase, PhaseScheduler
+from document_cache import DocumentReviewCache, changed_sections
+from document_corpus import get_corpus
+from document_sections import chunk_document, reduce_section_analyses
+from cco_patch_review import estimate_tokens
+from review_trends import ReviewTrendStore
+from review_watcher import DocumentWatcher
+from review_artifacts import save_review_artifact, load_review_artifact, latest_review_summary, load_latest_review
+
+ORGANIZATION_ROOT = '/root/wirereport_organization'
 
 class ComprehensiveOrganizationalReview:
-    def __init__(self):
+    def __init__(self, concurrency: Optional[int] = None, reuse_analyses: bool = True):
         self.openai_api_key = os.getenv('OPENAI_API_KEY')
+        self.reuse_analyses = reuse_analyses
+        self.document_cache = DocumentReviewCache()
+        self.corpus = get_corpus(ORGANIZATION_ROOT)
+        self.concurrency = concurrency or int(os.getenv('CCO_DOCUMENT_CONCURRENCY', '8'))
+        self.openai_client = OpenAIClient(self.openai_api_key, pool_size=self.concurrency)
+        
+        # Documents larger than this are reviewed section by section
+        self.document_token_budget = int(os.getenv('CCO_DOCUMENT_TOKEN_BUDGET', '6000'))
+        self.section_concurrency = int(os.getenv('CCO_SECTION_CONCURRENCY', '4'))
+        self.section_timeout = float(os.getenv('CCO_SECTION_TIMEOUT', '150'))
         self.review_log = []
         self.consensus_achieved = False
         
@@ -64,8 +86,29 @@ class ComprehensiveOrganizationalReview:
             }
         }
     
-    async def conduct_comprehensive_review(self):
-        """Conduct full organizational review with OpenAI/Claude consensus"""
+    def build_phase_scheduler(self) -> PhaseScheduler:
+        """Review phases as a dependency graph - only final consensus needs the other four"""
+        analysis_phases = ['document_analysis', 'structural_review', 'consensus_evaluation', 'gap_analysis']
+        
+        return PhaseScheduler([
+            Phase('document_analysis', lambda results: self.analyze_all_documents(),
+                  title="📋 PHASE: DOCUMENT ANALYSIS"),
+            Phase('structural_review', lambda results: self.review_organizational_structure(),
+                  title="🏗️ PHASE: STRUCTURAL REVIEW"),
+            Phase('consensus_evaluation', lambda results: self.evaluate_consensus_mechanisms(),
+                  title="⚖️ PHASE: CONSENSUS EVALUATION"),
+            Phase('gap_analysis', lambda results: self.identify_gaps_and_improvements(),
+                  title="🔍 PHASE: GAP ANALYSIS"),
+            Phase('final_consensus', lambda results: self.achieve_final_consensus(
+                      *[results[name] for name in analysis_phases]
+                  ), depends_on=analysis_phases, title="✅ PHASE: FINAL CONSENSUS")
+        ], max_attempts=int(os.getenv('CCO_PHASE_ATTEMPTS', '2')))
+    
+    async def conduct_comprehensive_review(self, previous_review: Optional[Dict] = None):
+        """Conduct full organizational review with OpenAI/Claude consensus
+        
+        Given a previous review, phases it completed are reused and only failed ones re-run.
+        """
         
         print("🏛️ COMPREHENSIVE ORGANIZATIONAL REVIEW")
         print("=" * 80)
@@ -75,107 +118,155 @@ class ComprehensiveOrganizationalReview:
         
         review_start = datetime.now()
         
-        # Phase 1: Document Analysis
-        print("\n📋 PHASE 1: DOCUMENT ANALYSIS")
-        print("-" * 40)
-        document_analysis = await self.analyze_all_documents()
-        
-        # Phase 2: Structural Review
-        print("\n🏗️ PHASE 2: STRUCTURAL REVIEW")
-        print("-" * 40)
-        structural_review = await self.review_organizational_structure()
-        
-        # Phase 3: Consensus Evaluation
-        print("\n⚖️ PHASE 3: CONSENSUS EVALUATION")
-        print("-" * 40)
-        consensus_evaluation = await self.evaluate_consensus_mechanisms()
-        
-        # Phase 4: Gap Analysis
-        print("\n🔍 PHASE 4: GAP ANALYSIS")
-        print("-" * 40)
-        gap_analysis = await self.identify_gaps_and_improvements()
-        
-        # Phase 5: Final Consensus
-        print("\n✅ PHASE 5: FINAL CONSENSUS")
-        print("-" * 40)
-        final_consensus = await self.achieve_final_consensus(
-            document_analysis, structural_review, consensus_evaluation, gap_analysis
-        )
+        completed = {}
+        if previous_review:
+            for name, timing in previous_review.get('phase_timings', {}).items():
+                if timing.get('status') in ('completed', 'reused') and name in previous_review:
+                    completed[name] = previous_review[name]
+            print(f"♻️ Reusing phases: {', '.join(completed) or 'none'}")
+        
+        # Independent phases run concurrently; final consensus waits for all four
+        outcome = await self.build_phase_scheduler().run(completed)
+        results = outcome['results']
+        failed_phases = [name for name, timing in outcome['phases'].items() if timing['status'] in ('failed', 'skipped')]
+        final_consensus = results.get('final_consensus', {})
         
         # Compile comprehensive review
         comprehensive_review = {
             'review_id': f"org-review-{int(datetime.now().timestamp())}",
             'timestamp': datetime.now().isoformat(),
             'duration_minutes': (datetime.now() - review_start).total_seconds() / 60,
-            'document_analysis': document_analysis,
-            'structural_review': structural_review,
-            'consensus_evaluation': consensus_evaluation,
-            'gap_analysis': gap_analysis,
-            'final_consensus': final_consensus,
+            **{name: results[name] for name in outcome['phases'] if name in results},
+            'phase_timings': outcome['phases'],
+            'failed_phases': failed_phases,
             'consensus_achieved': final_consensus.get('consensus_achieved', False),
             'ready_for_operations': final_consensus.get('ready_for_operations', False)
         }
+        if previous_review:
+            comprehensive_review['retry_of'] = previous_review.get('review_id')
         
         # Save comprehensive review
-        await self.save_comprehensive_review(comprehensive_review)
+        summary = await self.save_comprehensive_review(comprehensive_review)
         
         # Generate final report
-        await self.generate_final_report(comprehensive_review)
+        if failed_phases:
+            print(f"\n❌ Phases not completed: {', '.join(failed_phases)} - rerun with --retry-failed")
+        else:
+            await self.generate_final_report(summary)
         
         print(f"\n{'🎉' if comprehensive_review['consensus_achieved'] else '⚠️'} REVIEW COMPLETE")
         print(f"Duration: {comprehensive_review['duration_minutes']:.1f} minutes")
+        for name, timing in outcome['phases'].items():
+            print(f"   ⏱️ {name}: {timing['status']} in {timing['duration_seconds']:.1f}s")
         print(f"Consensus: {'ACHIEVED' if comprehensive_review['consensus_achieved'] else 'PENDING'}")
         print(f"Operations Ready: {'YES' if comprehensive_review['ready_for_operations'] else 'NO'}")
         
         return comprehensive_review
     
-    async def analyze_all_documents(self) -> Dict:
-        """Analyze all critical organizational documents"""
+    def expand_document_patterns(self, patterns: List[str]):
+        """Add documents matching glob patterns (relative to the organization root) to the review"""
+        for pattern in patterns:
+            matches = sorted(glob.glob(os.path.join(ORGANIZATION_ROOT, pattern)))
+            for full_path in matches or [os.path.join(ORGANIZATION_ROOT, pattern)]:
+                doc_path = os.path.relpath(full_path, ORGANIZATION_ROOT)
+                if doc_path not in self.critical_documents:
+                    self.critical_documents.append(doc_path)
+    
+    @staticmethod
+    def is_reusable_analysis(openai_analysis: Dict) -> bool:
+        """Only genuine reviewer output is cached - not API errors, parse failures or missing keys"""
+        return not (openai_analysis.get('error') or openai_analysis.get('parse_error')
+                    or openai_analysis.get('analysis_quality') == 'unavailable')
+    
+    async def analyze_all_documents(self, doc_paths: Optional[List[str]] = None) -> Dict:
+        """Analyze all critical organizational documents (or just doc_paths) concurrently
         
-        document_reviews = {}
+        Documents whose content hash matches the cache reuse their previous analyses.
+        """
         
-        for doc_path in self.critical_documents:
-            full_path = f"/root/wirereport_organization/{doc_path}"
+        doc_paths = doc_paths or self.critical_documents
+        semaphore = asyncio.Semaphore(self.concurrency)
+        loop = asyncio.get_running_loop()
+        
+        # Read and hash every document up front on the corpus thread pool
+        loaded = await loop.run_in_executor(None, self.corpus.load_many, doc_paths)
+        
+        async def analyze_document(doc_path: str) -> Dict:
+            document = loaded[doc_path]
             
-            if os.path.exists(full_path):
+            if document is None:
+                print(f"   ❌ Missing: {doc_path}")
+                return {'error': 'Document not found'}
+            
+            async with semaphore:
                 print(f"   📄 Analyzing: {doc_path}")
                 
-                # Read document content
-                with open(full_path, 'r') as f:
-                    content = f.read()
+                content = document['content']
+                sha256 = document['sha256']
+                sections = self.corpus.get_section_hashes(doc_path) if doc_path.endswith('.md') else {}
+                
+                cached = self.document_cache.get(doc_path, sha256) if self.reuse_analyses else None
+                if cached:
+                    print(f"     ♻️ Unchanged since {cached['analyzed_at']} - reusing analysis: {doc_path}")
+                    return {
+                        **cached['review'],
+                        'content_length': len(content),
+                        'content_sha256': sha256,
+                        'last_modified': datetime.fromtimestamp(document['mtime']).isoformat(),
+                        'result_source': 'reused',
+                        'reused_from': cached['analyzed_at']
+                    }
                 
-                # Get OpenAI analysis
-                openai_analysis = await self.get_openai_document_analysis(doc_path, content)
+                section_changes = changed_sections(self.document_cache.previous_sections(doc_path), sections)
                 
-                # Get Claude analysis
-                claude_analysis = await self.get_claude_document_analysis(doc_path, content)
+                # OpenAI and Claude analyses are independent - run them together
+                openai_analysis, claude_analysis = await asyncio.gather(
+                    self.get_openai_document_analysis(doc_path, content),
+                    self.get_claude_document_analysis(doc_path, content)
+                )
                 
                 # Document consensus
                 doc_consensus = await self.analyze_document_consensus(openai_analysis, claude_analysis, doc_path)
-                
-                document_reviews[doc_path] = {
-                    'openai_analysis': openai_analysis,
-                    'claude_analysis': claude_analysis,
-                    'consensus': doc_consensus,
-                    'content_length': len(content),
-                    'last_modified': datetime.fromtimestamp(os.path.getmtime(full_path)).isoformat()
-                }
-                
-                print(f"     {'✅' if doc_consensus['consensus_achieved'] else '❌'} {doc_path}")
-            else:
-                print(f"   ❌ Missing: {doc_path}")
-                document_reviews[doc_path] = {'error': 'Document not found'}
+            
+            review = {
+                'openai_analysis': openai_analysis,
+                'claude_analysis': claude_analysis,
+                'consensus': doc_consensus
+            }
+            if self.is_reusable_analysis(openai_analysis):
+                self.document_cache.put(doc_path, sha256, sections, review)
+            
+            print(f"     {'✅' if doc_consensus['consensus_achieved'] else '❌'} {doc_path}")
+            return {
+                **review,
+                'content_length': len(content),
+                'content_sha256': sha256,
+                'last_modified': datetime.fromtimestamp(document['mtime']).isoformat(),
+                'result_source': 'fresh',
+                'changed_sections': section_changes
+            }
+        
+        results = await asyncio.gather(*[analyze_document(doc_path) for doc_path in doc_paths])
+        self.document_cache.save()
+        
+        # Assemble in the original document order
+        document_reviews = dict(zip(doc_paths, results))
         
         return {
             'documents_reviewed': len([d for d in document_reviews.values() if 'error' not in d]),
             'documents_missing': len([d for d in document_reviews.values() if 'error' in d]),
+            'documents_reused': len([d for d in document_reviews.values() if d.get('result_source') == 'reused']),
             'consensus_achieved': all(d.get('consensus', {}).get('consensus_achieved', False) 
                                     for d in document_reviews.values() if 'error' not in d),
             'document_details': document_reviews
         }
     
     async def get_openai_document_analysis(self, doc_path: str, content: str) -> Dict:
-        """Get OpenAI analysis of organizational document"""
+        """Get OpenAI analysis of organizational document
+        
+        Documents over the token budget are reviewed section by section and the
+        section analyses reduced into one document analysis.
+        """
         
         if not self.openai_api_key:
             return {
@@ -186,14 +277,47 @@ class ComprehensiveOrganizationalReview:
                 'approval_status': 'conditional'
             }
         
-        prompt = f"""
+        if estimate_tokens(content) <= self.document_token_budget:
+            return await self.request_document_analysis(self.build_document_prompt(doc_path, content))
+        
+        return await self.analyze_document_sections(doc_path, content)
+    
+    async def analyze_document_sections(self, doc_path: str, content: str) -> Dict:
+        """Map each section chunk to its own OpenAI analysis, then reduce"""
+        chunks = chunk_document(content, self.document_token_budget, markdown=doc_path.endswith('.md'))
+        semaphore = asyncio.Semaphore(self.section_concurrency)
+        print(f"   🧩 {doc_path}: {len(chunks)} section chunks")
+        
+        async def analyze_chunk(index: int, chunk: Dict) -> Dict:
+            prompt = self.build_document_prompt(
+                doc_path, chunk['text'],
+                section=f"chunk {index}/{len(chunks)} - {', '.join(chunk['headings'][:5])}",
+                document_length=len(content)
+            )
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(self.request_document_analysis(prompt), self.section_timeout)
+                except asyncio.TimeoutError:
+                    return {'error': f'Section analysis timed out after {self.section_timeout:.0f}s'}
+        
+        analyses = await asyncio.gather(*(analyze_chunk(index, chunk) for index, chunk in enumerate(chunks, 1)))
+        return reduce_section_analyses(chunks, analyses)
+    
+    def build_document_prompt(self, doc_path: str, content: str, section: Optional[str] = None,
+                              document_length: Optional[int] = None) -> str:
+        scope = f"""
+SECTION: {section}
+Review only this section; other sections of the document are reviewed separately.
+""" if section else ""
+        
+        return f"""
 You are OpenAI conducting a comprehensive review of WireReport's organizational documentation.
 
 DOCUMENT: {doc_path}
-CONTENT LENGTH: {len(content)} characters
-
-CONTENT PREVIEW:
-{content[:2000]}...
+CONTENT LENGTH: {document_length or len(content)} characters
+{scope}
+CONTENT:
+{content}
 
 As OpenAI, provide detailed analysis focusing on:
 
@@ -220,13 +344,9 @@ Provide your analysis in JSON format:
     "reasoning": "detailed explanation of your analysis"
 }}
 """
-        
+    
+    async def request_document_analysis(self, prompt: str) -> Dict:
         try:
-            headers = {
-                'Authorization': f'Bearer {self.openai_api_key}',
-                'Content-Type': 'application/json'
-            }
-            
             data = {
                 'model': 'gpt-4o',
                 'messages': [
@@ -237,18 +357,13 @@ Provide your analysis in JSON format:
                 'max_tokens': 2500
             }
             
-            response = requests.post(
-                'https://api.openai.com/v1/chat/completions',
-                headers=headers,
-                json=data,
-                timeout=120
-            )
+            response = await self.openai_client.achat(data, timeout=120)
             
             if response.status_code == 200:
                 content_response = response.json()['choices'][0]['message']['content']
                 try:
-                    return json.loads(content_response)
-                except json.JSONDecodeError:
+                    return extract_json(content_response)
+                except ReviewParseError:
                     return {
                         'analysis_quality': 'fair',
                         'overall_score': 70,
@@ -477,11 +592,6 @@ Respond in JSON format:
 """
         
         try:
-            headers = {
-                'Authorization': f'Bearer {self.openai_api_key}',
-                'Content-Type': 'application/json'
-            }
-            
             data = {
                 'model': 'gpt-4o',
                 'messages': [
@@ -492,18 +602,13 @@ Respond in JSON format:
                 'max_tokens': 2000
             }
             
-            response = requests.post(
-                'https://api.openai.com/v1/chat/completions',
-                headers=headers,
-                json=data,
-                timeout=120
-            )
+            response = await self.openai_client.achat(data, timeout=120)
             
             if response.status_code == 200:
                 content = response.json()['choices'][0]['message']['content']
                 try:
-                    return json.loads(content)
-                except json.JSONDecodeError:
+                    return extract_json(content)
+                except ReviewParseError:
                     return {
                         'coherence_score': 75,
                         'structural_soundness': 'good',
@@ -859,19 +964,24 @@ Respond in JSON format:
                 'reasoning': 'AIs disagree on improvement approach. Requires discussion and alignment.'
             }
     
+    @staticmethod
+    def readiness_score(document_analysis: Dict, structural_review: Dict,
+                        consensus_evaluation: Dict, gap_analysis: Dict) -> float:
+        """Overall readiness (0-100) from the four analysis phases"""
+        document_score = 100 if document_analysis.get('consensus_achieved', False) else 50
+        structural_score = structural_review.get('coherence_score', 0)
+        consensus_score = consensus_evaluation.get('consensus_effectiveness', 0)
+        improvement_score = 100 if gap_analysis.get('improvement_consensus', {}).get('consensus_achieved', False) else 70
+        
+        return (document_score + structural_score + consensus_score + improvement_score) / 4
+    
     async def achieve_final_consensus(self, document_analysis: Dict, structural_review: Dict, 
                                     consensus_evaluation: Dict, gap_analysis: Dict) -> Dict:
         """Achieve final consensus on organizational readiness"""
         
         print("   Evaluating overall organizational readiness...")
         
-        # Calculate overall readiness scores
-        document_score = 100 if document_analysis.get('consensus_achieved', False) else 50
-        structural_score = structural_review.get('coherence_score', 0)
-        consensus_score = consensus_evaluation.get('consensus_effectiveness', 0)
-        improvement_score = 100 if gap_analysis.get('improvement_consensus', {}).get('consensus_achieved', False) else 70
-        
-        overall_readiness = (document_score + structural_score + consensus_score + improvement_score) / 4
+        overall_readiness = self.readiness_score(document_analysis, structural_review, consensus_evaluation, gap_analysis)
         
         # Final consensus evaluation
         final_consensus = {
@@ -918,64 +1028,136 @@ Respond in JSON format:
         
         return final_consensus
     
-    async def save_comprehensive_review(self, review: Dict):
-        """Save comprehensive review to files"""
+    @staticmethod
+    def load_latest_review() -> Optional[Dict]:
+        """Most recent saved comprehensive review, if any"""
+        return load_latest_review()
+    
+    def quick_check(self) -> Dict:
+        """Offline readiness projection from the last review summary and the document cache
+        
+        Only hashes the documents - no reviewer calls. A document whose content differs
+        from what was last reviewed counts as lacking consensus until it is re-reviewed.
+        """
+        started = time.monotonic()
+        last_review = latest_review_summary() or {}
+        last_documents = last_review.get('documents', {})
+        documents = {}
+        loaded = self.corpus.load_many(self.critical_documents)
         
-        # Save detailed review
-        review_file = f"/root/wirereport_organization/logs/comprehensive_review_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        os.makedirs(os.path.dirname(review_file), exist_ok=True)
+        for doc_path in self.critical_documents:
+            if loaded[doc_path] is None:
+                documents[doc_path] = {'status': 'missing'}
+                continue
+            sha256 = loaded[doc_path]['sha256']
+            
+            cached = self.document_cache.get(doc_path, sha256)
+            if cached:
+                documents[doc_path] = {
+                    'status': 'unchanged',
+                    'reviewed_at': cached['analyzed_at'],
+                    'consensus_achieved': cached['review'].get('consensus', {}).get('consensus_achieved', False)
+                }
+            elif last_documents.get(doc_path, {}).get('content_sha256') == sha256:
+                documents[doc_path] = {
+                    'status': 'unchanged',
+                    'reviewed_at': last_review.get('timestamp'),
+                    'consensus_achieved': last_documents[doc_path]['consensus_achieved']
+                }
+            elif doc_path in self.document_cache.entries or doc_path in last_documents:
+                sections = self.corpus.get_section_hashes(doc_path) if doc_path.endswith('.md') else {}
+                documents[doc_path] = {
+                    'status': 'changed',
+                    'changed_sections': changed_sections(self.document_cache.previous_sections(doc_path), sections)
+                }
+            else:
+                documents[doc_path] = {'status': 'not_reviewed'}
+        
+        present = [d for d in documents.values() if d['status'] != 'missing']
+        projected_documents = {'consensus_achieved': bool(present) and all(d.get('consensus_achieved') for d in present)}
+        projected_readiness = self.readiness_score(
+            projected_documents,
+            {'coherence_score': last_review.get('coherence_score') or 0},
+            {'consensus_effectiveness': last_review.get('consensus_effectiveness') or 0},
+            {'improvement_consensus': {'consensus_achieved': last_review.get('improvement_consensus', False)}}
+        )
+        stale = [doc for doc, d in documents.items() if d['status'] in ('changed', 'not_reviewed')]
+        missing = [doc for doc, d in documents.items() if d['status'] == 'missing']
+        
+        return {
+            'last_review_id': last_review.get('review_id'),
+            'last_review_at': last_review.get('timestamp'),
+            'last_readiness_score': last_review.get('readiness_score'),
+            'projected_readiness_score': projected_readiness,
+            'documents': documents,
+            'documents_needing_review': stale,
+            'documents_missing': missing,
+            'passed': bool(last_review) and not stale and not missing and projected_readiness >= 90,
+            'duration_seconds': round(time.monotonic() - started, 3)
+        }
+    
+    async def save_comprehensive_review(self, review: Dict) -> Dict:
+        """Save the review as a compressed artifact and index its summary"""
         
-        with open(review_file, 'w') as f:
-            json.dump(review, f, indent=2)
+        review_file = f"{ORGANIZATION_ROOT}/logs/comprehensive_review_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json.gz"
+        summary = save_review_artifact(review, review_file)
         
-        print(f"   📄 Review saved: {review_file}")
+        print(f"   📄 Review saved: {review_file} ({os.path.getsize(review_file) / 1024:.1f} KB)")
+        
+        # Add the snapshot to the trend store so review-to-review regressions are queryable
+        trends = ReviewTrendStore()
+        trends.ingest_review(review, os.path.basename(review_file))
+        trends.save()
+        
+        return summary
     
-    async def generate_final_report(self, review: Dict):
-        """Generate final consensus report"""
+    async def generate_final_report(self, summary: Dict):
+        """Generate final consensus report from the review summary"""
         
         report = f"""# COMPREHENSIVE ORGANIZATIONAL REVIEW REPORT
 
 **Date**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-**Duration**: {review['duration_minutes']:.1f} minutes
-**Consensus Achieved**: {'✅ YES' if review['consensus_achieved'] else '❌ NO'}
-**Operations Ready**: {'✅ YES' if review['ready_for_operations'] else '❌ NO'}
+**Duration**: {summary['duration_minutes']:.1f} minutes
+**Consensus Achieved**: {'✅ YES' if summary['consensus_achieved'] else '❌ NO'}
+**Operations Ready**: {'✅ YES' if summary['ready_for_operations'] else '❌ NO'}
 
 ## Executive Summary
 
-Overall Readiness Score: **{review['final_consensus']['overall_readiness_score']:.1f}/100**
+Overall Readiness Score: **{summary['readiness_score']:.1f}/100**
 
-Status: **{review['final_consensus']['status']}**
+Status: **{summary['status']}**
 
 ## Consensus Results
 
 ### Document Analysis
-- Documents Reviewed: {review['document_analysis']['documents_reviewed']}
-- Documents Missing: {review['document_analysis']['documents_missing']}
-- Document Consensus: {'✅' if review['document_analysis']['consensus_achieved'] else '❌'}
+- Documents Reviewed: {summary['documents_reviewed']}
+- Documents Missing: {summary['documents_missing']}
+- Documents Reused (unchanged): {summary['documents_reused']}
+- Document Consensus: {'✅' if summary['document_consensus'] else '❌'}
 
 ### Structural Review  
-- Coherence Score: {review['structural_review']['coherence_score']:.1f}/100
-- Structural Consensus: {'✅' if review['structural_review']['consensus']['consensus_achieved'] else '❌'}
+- Coherence Score: {summary['coherence_score']:.1f}/100
+- Structural Consensus: {'✅' if summary['structural_consensus'] else '❌'}
 
 ### Consensus Mechanisms
-- Effectiveness Score: {review['consensus_evaluation']['consensus_effectiveness']:.1f}/100
-- Meta-Consensus: {'✅' if review['consensus_evaluation']['meta_consensus']['consensus_achieved'] else '❌'}
+- Effectiveness Score: {summary['consensus_effectiveness']:.1f}/100
+- Meta-Consensus: {'✅' if summary['meta_consensus'] else '❌'}
 
 ### Improvement Plan
-- Improvements Identified: {review['gap_analysis']['total_improvements_identified']}
-- Improvement Consensus: {'✅' if review['gap_analysis']['improvement_consensus']['consensus_achieved'] else '❌'}
+- Improvements Identified: {summary['improvements_identified']}
+- Improvement Consensus: {'✅' if summary['improvement_consensus'] else '❌'}
 
 ## Final Recommendation
 
-**{review['final_consensus']['recommendation']}**
+**{summary['recommendation']}**
 
-Confidence Level: **{review['final_consensus'].get('confidence', 'medium').upper()}**
+Confidence Level: **{(summary['confidence'] or 'medium').upper()}**
 
 ## Next Steps
 
 """
         
-        if review['ready_for_operations']:
+        if summary['ready_for_operations']:
             report += """
 ✅ **PROCEED TO OPERATIONS**
 1. Deploy organizational structure
@@ -992,22 +1174,22 @@ Confidence Level: **{review['final_consensus'].get('confidence', 'medium').upper
 4. Achieve full consensus before operations
 """
         
-        if review['final_consensus'].get('critical_blockers'):
+        if summary['critical_blockers']:
             report += f"""
 ## Critical Blockers
-{chr(10).join(f"- {blocker}" for blocker in review['final_consensus']['critical_blockers'])}
+{chr(10).join(f"- {blocker}" for blocker in summary['critical_blockers'])}
 """
         
         report += f"""
 
 ---
 Generated by Comprehensive Organizational Review System
-OpenAI + Claude Consensus Achieved: {review['consensus_achieved']}
-Review ID: {review['review_id']}
+OpenAI + Claude Consensus Achieved: {summary['consensus_achieved']}
+Review ID: {summary['review_id']}
 """
         
         # Save report
-        report_file = f"/root/wirereport_organization/COMPREHENSIVE_REVIEW_REPORT.md"
+        report_file = f"{ORGANIZATION_ROOT}/COMPREHENSIVE_REVIEW_REPORT.md"
         with open(report_file, 'w') as f:
             f.write(report)
         
@@ -1019,15 +1201,40 @@ async def main():
     
     parser = argparse.ArgumentParser(description='Comprehensive Organizational Review')
     parser.add_argument('--full-review', action='store_true', help='Conduct full organizational review')
-    parser.add_argument('--quick-check', action='store_true', help='Quick readiness check')
+    parser.add_argument('--quick-check', action='store_true', help='Offline readiness check against the last full review and document cache (no API calls)')
+    parser.add_argument('--documents', nargs='+', metavar='GLOB',
+                        help='Also review documents matching these globs (e.g. "implementation/*.md")')
+    parser.add_argument('--concurrency', type=int, help='Documents analyzed concurrently (default 8)')
+    parser.add_argument('--no-reuse', action='store_true',
+                        help='Re-analyze every document even if its content is unchanged')
+    parser.add_argument('--retry-failed', nargs='?', const='latest', metavar='REVIEW_JSON',
+                        help='Re-run only the failed phases of a saved review artifact (default: the latest)')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and re-analyze documents as they change')
+    parser.add_argument('--debounce', type=float, help='Seconds a document must be quiet before re-analysis (default 2)')
     
     args = parser.parse_args()
     
-    reviewer = ComprehensiveOrganizationalReview()
+    reviewer = ComprehensiveOrganizationalReview(concurrency=args.concurrency, reuse_analyses=not args.no_reuse)
+    if args.documents:
+        reviewer.expand_document_patterns(args.documents)
+    
+    if args.watch:
+        try:
+            await DocumentWatcher(reviewer, debounce=args.debounce).run()
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            print("\n👋 Watch stopped")
+        return True
     
-    if args.full_review or not any(vars(args).values()):
+    if args.full_review or not args.quick_check:
         # Default to full review
-        result = await reviewer.conduct_comprehensive_review()
+        previous_review = None
+        if args.retry_failed == 'latest':
+            previous_review = reviewer.load_latest_review()
+        elif args.retry_failed:
+            previous_review = load_review_artifact(args.retry_failed)
+        
+        result = await reviewer.conduct_comprehensive_review(previous_review)
         
         print(f"\n🏛️ COMPREHENSIVE REVIEW COMPLETE")
         print(f"Consensus Achieved: {'YES' if result['consensus_achieved'] else 'NO'}")
@@ -1037,9 +1244,32 @@ async def main():
     
     elif args.quick_check:
         print("🔍 Quick organizational readiness check...")
-        # Implement quick check logic
-        return True
+        check = reviewer.quick_check()
+        
+        if not check['last_review_id']:
+            print("   ⚠️ No saved full review - run --full-review first")
+        else:
+            print(f"   📄 Last full review: {check['last_review_id']} ({check['last_review_at']})")
+        
+        icons = {'unchanged': '✅', 'changed': '✏️', 'not_reviewed': '🆕', 'missing': '❌'}
+        for doc_path, doc in check['documents'].items():
+            detail = ''
+            if doc['status'] == 'unchanged' and not doc['consensus_achieved']:
+                detail = ' - no consensus at last review'
+            elif doc['status'] == 'changed':
+                changes = doc['changed_sections']
+                detail = f" - {len(changes['modified'])} modified, {len(changes['added'])} added, {len(changes['removed'])} removed sections"
+            print(f"   {icons[doc['status']]} {doc_path}: {doc['status']}{detail}")
+        
+        if check['last_readiness_score'] is not None:
+            print(f"Last Readiness: {check['last_readiness_score']:.1f}/100")
+        print(f"Projected Readiness: {check['projected_readiness_score']:.1f}/100")
+        if check['documents_needing_review']:
+            print(f"Needs Full Review: {', '.join(check['documents_needing_review'])}")
+        print(f"Quick Check: {'PASSED' if check['passed'] else 'FAILED'} in {check['duration_seconds']:.2f}s")
+        
+        return check['passed']
 
 if __name__ == "__main__":
     result = asyncio.run(main())
-    exit(0 if result else 1)
\ No newline at end of file
+    exit(0 if result else 1)
@@ -10,8 +10,19 @@ import aiohttp
 from datetime import datetime
 from pathlib import Path
 import os
+import sys
 from typing import Dict, List, Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from document_index import load_document_index
+
+REVIEW_FOCUS = [
+    'Queue size (currently 5 max)',
+    'API call efficiency',
+    'Rate limiting strategy',
+    'Scalability concerns'
+]
+
 class ArchitectureConsensus:
     def __init__(self):
         self.openai_api_key = os.getenv('OPENAI_API_KEY')
@@ -20,9 +31,9 @@ class ArchitectureConsensus:
         self.consensus_points = []
         self.disagreement_points = []
         
-        # Load the master plan
-        with open('/root/wirereport/MASTER_PLAN.md', 'r') as f:
-            self.master_plan = f.read()
+        # Sections of the organizational documents relevant to the review focus
+        self.document_index = load_document_index()
+        self.context_token_budget = int(os.getenv('CCO_CONTEXT_TOKEN_BUDGET', '1500'))
     
     async def call_chatgpt(self, messages: List[Dict]) -> str:
         """Call ChatGPT-4o API"""
@@ -120,6 +131,11 @@ class ArchitectureConsensus:
         print("=" * 60)
         
         # Initial prompt to ChatGPT
+        architecture_context = self.document_index.select_context(
+            'WireReport architecture ' + ' '.join(REVIEW_FOCUS), self.context_token_budget
+        )
+        focus = '\n                '.join(f"{number}. {item}" for number, item in enumerate(REVIEW_FOCUS, 1))
+        
         messages = [
             {
                 'role': 'system',
@@ -130,13 +146,10 @@ class ArchitectureConsensus:
                 'content': f"""
                 Review this WireReport architecture and provide feedback:
                 
-                {self.master_plan[:3000]}  # First 3000 chars of master plan
+                {architecture_context}
                 
                 Focus on:
-                1. Queue size (currently 5 max)
-                2. API call efficiency 
-                3. Rate limiting strategy
-                4. Scalability concerns
+                {focus}
                 
                 Format your response with clear sections:
                 - AGREEMENTS: What works well
@@ -253,4 +266,4 @@ async def main():
     await builder.run_consensus_loop()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
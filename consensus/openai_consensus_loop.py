@@ -9,9 +9,13 @@ import json
 import asyncio
 import aiohttp
 from datetime import datetime
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from document_corpus import get_corpus
+
 class OpenAIConsensusLoop:
     def __init__(self):
         self.openai_api_key = os.getenv('OPENAI_API_KEY')
@@ -29,19 +33,16 @@ class OpenAIConsensusLoop:
     
     def load_system_docs(self):
         """Load all relevant WireReport documentation"""
-        docs = {}
         doc_files = {
             'master_plan': '/root/wirereport/MASTER_PLAN.md',
             'consensus': '/root/wirereport/FINAL_CONSENSUS.md',
             'refactoring': '/root/wirereport/REFACTORING_COMPLETE.md'
         }
         
-        for name, path in doc_files.items():
-            if Path(path).exists():
-                with open(path, 'r') as f:
-                    docs[name] = f.read()
-        
-        self.system_docs = docs
+        loaded = get_corpus().load_many(doc_files.values())
+        self.system_docs = {
+            name: loaded[path]['content'] for name, path in doc_files.items() if loaded[path] is not None
+        }
     
     async def call_openai(self, messages: List[Dict], model: str = "gpt-4-turbo-preview") -> str:
         """Make actual API call to OpenAI"""
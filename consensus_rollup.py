@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Executive Consensus Rollups
+Mergeable aggregates over the persisted consensus log, checkpointed so each
+report only processes records appended since the last run
+"""
+
+import os
+import json
+import math
+from collections import deque
+from typing import Dict, List, Optional
+
+from segmented_log import iter_new_records
+
+ROLLUP_CHECKPOINT_FILE = '/root/wirereport_organization/logs/executive_consensus_rollup.json'
+
+class DurationHistogram:
+    """Log-bucketed durations: bounded memory, mergeable, within 10% of the true percentile"""
+    GROWTH = 1.1
+    MIN_SECONDS = 0.01
+    
+    def __init__(self, buckets: Optional[Dict[str, int]] = None):
+        self.buckets = {int(k): v for k, v in (buckets or {}).items()}
+        self.count = sum(self.buckets.values())
+    
+    def bucket(self, seconds: float) -> int:
+        if seconds <= self.MIN_SECONDS:
+            return 0
+        return int(math.ceil(math.log(seconds / self.MIN_SECONDS, self.GROWTH)))
+    
+    def add(self, seconds: float):
+        index = self.bucket(seconds)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+    
+    def percentile(self, p: float) -> Optional[float]:
+        """Upper bound of the bucket holding the p-th percentile"""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * p / 100))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return self.MIN_SECONDS * self.GROWTH ** index
+        return None
+    
+    def to_dict(self) -> Dict[str, int]:
+        return {str(k): v for k, v in self.buckets.items()}
+
+class ConsensusRollup:
+    def __init__(self, state: Optional[Dict] = None, recent_size: int = 5):
+        state = state or {}
+        self.total = state.get('total', 0)
+        self.approved = state.get('approved', 0)
+        self.consensus_types = state.get('consensus_types', {})
+        self.levels = state.get('levels', {})
+        self.histograms = {level: DurationHistogram(buckets) for level, buckets in state.get('histograms', {}).items()}
+        self.recent = deque(state.get('recent', []), maxlen=recent_size)
+        self.cursor = state.get('cursor', {})
+    
+    @classmethod
+    def load(cls, checkpoint_file: str = ROLLUP_CHECKPOINT_FILE) -> 'ConsensusRollup':
+        if os.path.exists(checkpoint_file):
+            try:
+                with open(checkpoint_file, 'r') as f:
+                    return cls(json.load(f))
+            except (OSError, json.JSONDecodeError):
+                print(f"⚠️ Ignoring unreadable rollup checkpoint {checkpoint_file}")
+        return cls()
+    
+    def save(self, checkpoint_file: str = ROLLUP_CHECKPOINT_FILE):
+        """Persist the rollup and its log cursor atomically"""
+        os.makedirs(os.path.dirname(checkpoint_file) or '.', exist_ok=True)
+        tmp_file = f"{checkpoint_file}.tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump(self.to_dict(), f, separators=(',', ':'))
+        os.replace(tmp_file, checkpoint_file)
+    
+    def add(self, record: Dict):
+        result = record.get('consensus_result', {})
+        level = record.get('executive_level', 'unknown')
+        approved = bool(result.get('approved', False))
+        duration = record.get('duration_seconds', 0) or 0
+        
+        self.total += 1
+        self.approved += approved
+        consensus_type = result.get('consensus_type', 'unknown')
+        self.consensus_types[consensus_type] = self.consensus_types.get(consensus_type, 0) + 1
+        
+        stats = self.levels.setdefault(level, {'total': 0, 'approved': 0, 'duration_total': 0.0})
+        stats['total'] += 1
+        stats['approved'] += approved
+        stats['duration_total'] += duration
+        self.histograms.setdefault(level, DurationHistogram()).add(duration)
+        
+        self.recent.append({
+            'title': record.get('change_proposal', {}).get('title', 'Untitled Change'),
+            'executive_level': level,
+            'approved': approved,
+            'confidence': result.get('confidence', 'N/A'),
+            'duration_seconds': duration,
+            'reasoning': result.get('reasoning', 'No reasoning provided')[:100]
+        })
+    
+    def update(self, log_file: str) -> int:
+        """Fold in records appended to the log since the last checkpoint"""
+        processed = 0
+        for record in iter_new_records(log_file, self.cursor):
+            self.add(record)
+            processed += 1
+        return processed
+    
+    def level_summary(self, level: str) -> Dict:
+        stats = self.levels[level]
+        histogram = self.histograms.get(level, DurationHistogram())
+        return {
+            **stats,
+            'approval_rate': stats['approved'] / stats['total'] * 100 if stats['total'] else 0,
+            'duration_avg': stats['duration_total'] / stats['total'] if stats['total'] else 0,
+            'p50': histogram.percentile(50),
+            'p90': histogram.percentile(90),
+            'p99': histogram.percentile(99)
+        }
+    
+    def to_dict(self) -> Dict:
+        return {
+            'total': self.total,
+            'approved': self.approved,
+            'consensus_types': self.consensus_types,
+            'levels': self.levels,
+            'histograms': {level: h.to_dict() for level, h in self.histograms.items()},
+            'recent': list(self.recent),
+            'cursor': self.cursor
+        }
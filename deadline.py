@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Deadline Budgets
+A single time budget threaded through every step of a consensus decision
+Per-call timeouts shrink as the budget is spent
+"""
+
+import time
+import asyncio
+from typing import Awaitable, Dict, Optional
+
+class DeadlineExceeded(Exception):
+    def __init__(self, stage: str, budget_seconds: float):
+        super().__init__(f"Deadline of {budget_seconds:.0f}s exceeded during {stage}")
+        self.stage = stage
+        self.budget_seconds = budget_seconds
+
+class Deadline:
+    def __init__(self, budget_seconds: float, min_call_timeout: float = 1.0):
+        self.budget_seconds = budget_seconds
+        self.min_call_timeout = min_call_timeout
+        self.started = time.monotonic()
+        self.expires = self.started + budget_seconds
+        self.exceeded_stage = None
+    
+    @classmethod
+    def from_minutes(cls, minutes: float) -> 'Deadline':
+        return cls(minutes * 60)
+    
+    def remaining(self) -> float:
+        return max(0.0, self.expires - time.monotonic())
+    
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+    
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+    
+    def check(self, stage: str):
+        """Raise DeadlineExceeded if too little budget is left to start the stage"""
+        if self.remaining() < self.min_call_timeout:
+            self.exceeded_stage = stage
+            raise DeadlineExceeded(stage, self.budget_seconds)
+    
+    def timeout(self, cap: float, stage: str = 'call') -> float:
+        """Per-call timeout: the call's own cap, shrunk to the remaining budget"""
+        self.check(stage)
+        return min(cap, self.remaining())
+    
+    async def run(self, awaitable: Awaitable, stage: str, cap: Optional[float] = None):
+        """Await within the remaining budget (and cap), raising DeadlineExceeded on timeout"""
+        try:
+            timeout = self.timeout(cap if cap is not None else self.remaining(), stage)
+        except DeadlineExceeded:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise
+        
+        try:
+            return await asyncio.wait_for(awaitable, timeout=timeout)
+        except asyncio.TimeoutError:
+            self.exceeded_stage = stage
+            raise DeadlineExceeded(stage, self.budget_seconds)
+    
+    def as_dict(self) -> Dict:
+        return {
+            'budget_seconds': self.budget_seconds,
+            'elapsed_seconds': round(self.elapsed(), 3),
+            'remaining_seconds': round(self.remaining(), 3),
+            'exceeded_stage': self.exceeded_stage
+        }
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Executive Decision Cache
+Canonical proposal fingerprints and a persisted store of decisions keyed by them,
+so an identical re-submitted proposal reuses its earlier decision
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+from datetime import datetime
+from typing import Dict, Iterator, Optional, Tuple
+
+from segmented_log import get_log_writer, iter_log_records, compact_log
+
+DECISION_CACHE_FILE = '/root/wirereport_organization/logs/executive_decisions.jsonl'
+
+# The log is rewritten with only live decisions once it holds this many records
+# and at least this share of them are expired or superseded
+COMPACT_MIN_RECORDS = 1000
+COMPACT_DEAD_RATIO = 0.5
+
+# Only real consensus outcomes are reused - never timeouts or failed reviews
+CACHEABLE_CONSENSUS_TYPES = {'unanimous_approval', 'unanimous_rejection', 'confidence_tiebreaker', 'unresolved_tie'}
+FAILED_REVIEW_MARKERS = {'API call failed', 'Exception occurred', 'API unavailable', 'Response parsing failed'}
+
+WHITESPACE = re.compile(r'\s+')
+
+def _normalize_text(value) -> str:
+    return WHITESPACE.sub(' ', str(value or '')).strip()
+
+def proposal_fingerprint(change_proposal: Dict) -> str:
+    """Stable SHA-256 of a proposal's content, ignoring ids, whitespace and file order"""
+    canonical = {
+        'title': _normalize_text(change_proposal.get('title')),
+        'type': _normalize_text(change_proposal.get('type')).lower(),
+        'files_changed': sorted(set(change_proposal.get('files_changed', []) or [])),
+        'description': _normalize_text(change_proposal.get('description'))
+    }
+    payload = json.dumps(canonical, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class DecisionCache:
+    def __init__(self, cache_file: Optional[str] = None, ttl_seconds: Optional[float] = None):
+        self.cache_file = cache_file or os.getenv('CCO_DECISION_CACHE', DECISION_CACHE_FILE)
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(os.getenv('CCO_DECISION_TTL_HOURS', '168')) * 3600
+        self.writer = get_log_writer(self.cache_file)
+        
+        self.entries, records = self.live_entries(iter_log_records(self.cache_file))
+        if records >= COMPACT_MIN_RECORDS and records - len(self.entries) >= records * COMPACT_DEAD_RATIO:
+            self.compact()
+    
+    @staticmethod
+    def live_entries(records: Iterator[Dict]) -> Tuple[Dict[str, Dict], int]:
+        """Latest unexpired decision per fingerprint, and how many records were read"""
+        now = time.time()
+        entries = {}
+        count = 0
+        for entry in records:
+            count += 1
+            if entry.get('expires_at', 0) > now:
+                entries[entry['fingerprint']] = entry
+        return entries, count
+    
+    def compact(self):
+        """Rewrite the log with only live decisions, re-read under the log's lock"""
+        self.writer.flush()
+        kept = compact_log(self.cache_file, lambda records: self.live_entries(records)[0].values())
+        print(f"🗜️ Compacted decision cache to {kept} live decisions")
+    
+    @staticmethod
+    def is_cacheable(consensus_result: Dict, reviews) -> bool:
+        if consensus_result.get('consensus_type') not in CACHEABLE_CONSENSUS_TYPES:
+            return False
+        return not any(review and review.get('executive_analysis') in FAILED_REVIEW_MARKERS for review in reviews)
+    
+    def get(self, fingerprint: str, executive_level: str) -> Optional[Dict]:
+        """Cached decision with provenance, or None if missing, expired or decided at another level"""
+        entry = self.entries.get(fingerprint)
+        if entry is None:
+            return None
+        
+        now = time.time()
+        if entry['expires_at'] <= now:
+            del self.entries[fingerprint]
+            return None
+        if entry['executive_level'] != executive_level:
+            return None
+        
+        return {
+            **entry['consensus_result'],
+            'cached': True,
+            'provenance': {
+                'fingerprint': fingerprint,
+                'original_change_id': entry['change_id'],
+                'decided_at': entry['decided_at'],
+                'age_seconds': round(now - entry['stored_at'], 1),
+                'expires_at': datetime.fromtimestamp(entry['expires_at']).isoformat()
+            }
+        }
+    
+    def put(self, fingerprint: str, executive_level: str, change_id: str, consensus_result: Dict):
+        now = time.time()
+        entry = {
+            'fingerprint': fingerprint,
+            'executive_level': executive_level,
+            'change_id': change_id,
+            'consensus_result': dict(consensus_result),
+            'decided_at': datetime.now().isoformat(),
+            'stored_at': now,
+            'expires_at': now + self.ttl_seconds
+        }
+        self.entries[fingerprint] = entry
+        self.writer.append(entry)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Document Review Cache
+Content hashes per document and per Markdown section, and a persisted cache of
+per-document analyses so unchanged documents are not sent to the reviewers again
+"""
+
+import os
+import re
+import json
+import hashlib
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+DOCUMENT_CACHE_FILE = '/root/wirereport_organization/logs/document_review_cache.json'
+
+# Bump when prompts or consensus rules change so cached analyses are not reused
+ANALYSIS_VERSION = 1
+
+MARKDOWN_HEADING = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$', re.MULTILINE)
+MARKDOWN_FENCE = re.compile(r'^ {0,3}(`{3,}|~{3,})(.*)$')
+
+def content_sha256(content: str) -> str:
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+def markdown_headings(content: str) -> List[Tuple[int, int, str]]:
+    """(offset, level, title) of each heading, skipping '#' lines inside ``` or ~~~ fenced code"""
+    headings = []
+    fence = None
+    offset = 0
+    
+    for line in content.splitlines(keepends=True):
+        fence_match = MARKDOWN_FENCE.match(line)
+        if fence is None:
+            # A backtick fence's info string may not contain backticks (that is inline code)
+            if fence_match and not (fence_match.group(1)[0] == '`' and '`' in fence_match.group(2)):
+                fence = fence_match.group(1)
+            else:
+                heading = MARKDOWN_HEADING.match(line)
+                if heading:
+                    headings.append((offset, len(heading.group(1)), heading.group(2)))
+        elif (fence_match and fence_match.group(1)[0] == fence[0] and len(fence_match.group(1)) >= len(fence)
+                and not fence_match.group(2).strip()):
+            fence = None
+        offset += len(line)
+    
+    return headings
+
+def split_markdown_sections(content: str) -> List[Tuple[str, str]]:
+    """Split Markdown into (heading path, text) sections; text before the first heading is the preamble"""
+    sections = []
+    trail = []
+    headings = markdown_headings(content)
+    
+    if not headings or headings[0][0] > 0:
+        preamble = content[:headings[0][0]] if headings else content
+        if preamble.strip():
+            sections.append(('(preamble)', preamble))
+    
+    for index, (start, level, title) in enumerate(headings):
+        trail = trail[:level - 1] + [title]
+        end = headings[index + 1][0] if index + 1 < len(headings) else len(content)
+        sections.append((' > '.join(trail), content[start:end]))
+    
+    return sections
+
+def section_hashes(content: str) -> Dict[str, str]:
+    """Hash of each Markdown section keyed by heading path (duplicates get a #n suffix)"""
+    hashes = {}
+    for heading, text in split_markdown_sections(content):
+        key = heading
+        suffix = 2
+        while key in hashes:
+            key = f"{heading} #{suffix}"
+            suffix += 1
+        hashes[key] = content_sha256(text.strip())
+    return hashes
+
+def changed_sections(old: Dict[str, str], new: Dict[str, str]) -> Dict[str, List[str]]:
+    return {
+        'added': [s for s in new if s not in old],
+        'modified': [s for s in new if s in old and old[s] != new[s]],
+        'removed': [s for s in old if s not in new]
+    }
+
+class DocumentReviewCache:
+    def __init__(self, cache_file: Optional[str] = None):
+        self.cache_file = cache_file or os.getenv('CCO_DOCUMENT_CACHE', DOCUMENT_CACHE_FILE)
+        self.entries = {}
+        self.dirty = False
+        
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r') as f:
+                    cached = json.load(f)
+                if cached.get('version') == ANALYSIS_VERSION:
+                    self.entries = cached.get('documents', {})
+            except (OSError, json.JSONDecodeError):
+                print(f"⚠️ Ignoring unreadable document cache {self.cache_file}")
+    
+    def get(self, doc_path: str, sha256: str) -> Optional[Dict]:
+        """Cached review for this exact content, if any"""
+        entry = self.entries.get(doc_path)
+        if entry and entry['content_sha256'] == sha256:
+            return entry
+        return None
+    
+    def previous_sections(self, doc_path: str) -> Dict[str, str]:
+        entry = self.entries.get(doc_path)
+        return entry.get('section_hashes', {}) if entry else {}
+    
+    def put(self, doc_path: str, sha256: str, sections: Dict[str, str], review: Dict):
+        self.entries[doc_path] = {
+            'content_sha256': sha256,
+            'section_hashes': sections,
+            'review': review,
+            'analyzed_at': datetime.now().isoformat()
+        }
+        self.dirty = True
+    
+    def save(self):
+        """Persist the cache atomically if anything changed"""
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.cache_file) or '.', exist_ok=True)
+        tmp_file = f"{self.cache_file}.tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump({'version': ANALYSIS_VERSION, 'documents': self.entries}, f, separators=(',', ':'))
+        os.replace(tmp_file, self.cache_file)
+        self.dirty = False
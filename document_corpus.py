@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Organizational Document Corpus
+Shared, process-wide access to the organization's documents: files are
+memory-mapped and hashed on a thread pool, and contents, Markdown sections and
+metadata are cached until a file's mtime or size changes
+"""
+
+import os
+import mmap
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from document_cache import split_markdown_sections, section_hashes
+
+ORGANIZATION_ROOT = '/root/wirereport_organization'
+CORPUS_DIRECTORIES = ['governance', 'consensus', 'implementation']
+SKIPPED_DIRECTORIES = {'__pycache__', 'logs'}
+
+def read_mapped(full_path: str) -> Tuple[str, str]:
+    """Content and SHA-256 of a file, hashed and decoded straight from the memory map
+    
+    The mapping is decoded through a memoryview, so the file is never copied into
+    an intermediate bytes object; only the decoded text is kept.
+    """
+    with open(full_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return '', hashlib.sha256(b'').hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                sha256 = hashlib.sha256(view).hexdigest()
+                content = str(view, 'utf-8', 'replace')
+            return content, sha256
+
+class DocumentCorpus:
+    def __init__(self, root: str = ORGANIZATION_ROOT, directories: Optional[List[str]] = None,
+                 max_workers: Optional[int] = None):
+        self.root = root
+        self.directories = directories or CORPUS_DIRECTORIES
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or int(os.getenv('CCO_CORPUS_WORKERS', str(min(8, os.cpu_count() or 4)))),
+            thread_name_prefix='corpus'
+        )
+        self.documents = {}
+        self.sections = {}
+        self.listing = None
+        self.lock = threading.Lock()
+    
+    def full_path(self, path: str) -> str:
+        return path if os.path.isabs(path) else os.path.join(self.root, path)
+    
+    def list_documents(self, refresh: bool = False) -> List[str]:
+        """Markdown files at the root and under the corpus directories, relative to the root
+        
+        The tree is walked once; pass refresh=True to pick up added or deleted files.
+        """
+        if self.listing is not None and not refresh:
+            return self.listing
+        
+        paths = []
+        if not os.path.isdir(self.root):
+            self.listing = paths
+            return paths
+        with os.scandir(self.root) as entries:
+            paths.extend(entry.name for entry in entries if entry.is_file() and entry.name.endswith('.md'))
+        for directory in self.directories:
+            for dirpath, dirnames, filenames in os.walk(os.path.join(self.root, directory)):
+                dirnames[:] = [d for d in dirnames if not d.startswith('.') and d not in SKIPPED_DIRECTORIES]
+                paths.extend(
+                    os.path.relpath(os.path.join(dirpath, filename), self.root)
+                    for filename in filenames if filename.endswith('.md')
+                )
+        self.listing = sorted(paths)
+        return self.listing
+    
+    def get(self, path: str) -> Optional[Dict]:
+        """Document content and metadata, re-read only if mtime or size changed; None if missing"""
+        full_path = self.full_path(path)
+        try:
+            stat = os.stat(full_path)
+        except FileNotFoundError:
+            with self.lock:
+                self.documents.pop(full_path, None)
+            return None
+        
+        cached = self.documents.get(full_path)
+        if cached and cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+            return cached
+        
+        content, sha256 = read_mapped(full_path)
+        document = {
+            'path': path,
+            'full_path': full_path,
+            'content': content,
+            'sha256': sha256,
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'mtime_ns': stat.st_mtime_ns
+        }
+        with self.lock:
+            self.documents[full_path] = document
+        return document
+    
+    def load_many(self, paths: Iterable[str]) -> Dict[str, Optional[Dict]]:
+        """get() for many documents at once; changed files are read and hashed in parallel"""
+        paths = list(paths)
+        return dict(zip(paths, self.executor.map(self.get, paths)))
+    
+    def read(self, path: str) -> Optional[str]:
+        document = self.get(path)
+        return document['content'] if document else None
+    
+    def parsed_sections(self, path: str) -> Dict:
+        """Markdown sections and their hashes, recomputed only when the content hash changes"""
+        document = self.get(path)
+        if document is None:
+            return {'sections': [], 'hashes': {}}
+        parsed = self.sections.get(document['full_path'])
+        if parsed is None or parsed['sha256'] != document['sha256']:
+            parsed = {
+                'sha256': document['sha256'],
+                'sections': split_markdown_sections(document['content']),
+                'hashes': section_hashes(document['content'])
+            }
+            self.sections[document['full_path']] = parsed
+        return parsed
+    
+    def get_sections(self, path: str) -> List[Tuple[str, str]]:
+        return self.parsed_sections(path)['sections']
+    
+    def get_section_hashes(self, path: str) -> Dict[str, str]:
+        return self.parsed_sections(path)['hashes']
+
+_corpora = {}
+_corpora_lock = threading.Lock()
+
+def get_corpus(root: str = ORGANIZATION_ROOT) -> DocumentCorpus:
+    """The process-wide corpus for root"""
+    with _corpora_lock:
+        if root not in _corpora:
+            _corpora[root] = DocumentCorpus(root)
+        return _corpora[root]
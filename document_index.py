@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Organizational Document Index
+Persisted BM25 inverted index over the Markdown sections of the implementation,
+governance and consensus documents, updated incrementally by content hash, for
+selecting the most relevant sections to put in a prompt under a token budget
+"""
+
+import os
+import re
+import json
+import math
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from cco_patch_review import estimate_tokens, split_oversized
+from document_corpus import get_corpus
+
+ORGANIZATION_ROOT = '/root/wirereport_organization'
+DOCUMENT_INDEX_FILE = f'{ORGANIZATION_ROOT}/logs/document_index.json'
+INDEXED_DIRECTORIES = ['implementation', 'governance', 'consensus']
+
+# Bump when tokenization or section splitting changes so the index is rebuilt
+INDEX_VERSION = 2
+
+# Sections longer than this are indexed (and retrieved) in pieces
+MAX_SECTION_TOKENS = 800
+
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+TERM = re.compile(r'[a-z0-9][a-z0-9_]+')
+STOPWORDS = {
+    'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'any', 'can', 'has', 'have', 'was', 'were',
+    'this', 'that', 'with', 'from', 'into', 'will', 'would', 'should', 'could', 'what', 'when', 'which',
+    'their', 'there', 'they', 'them', 'than', 'then', 'its', 'our', 'your', 'each', 'also', 'more',
+    'how', 'why', 'who', 'out', 'use', 'used', 'using', 'via', 'per', 'some', 'such', 'only', 'other'
+}
+
+def tokenize(text: str) -> List[str]:
+    return [term for term in TERM.findall(text.lower()) if term not in STOPWORDS]
+
+def document_units(sections: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """(heading path, text) retrieval units: Markdown sections, oversized ones split on lines"""
+    units = []
+    for heading, text in sections:
+        if estimate_tokens(text) <= MAX_SECTION_TOKENS:
+            units.append((heading, text))
+            continue
+        pieces = split_oversized(text, MAX_SECTION_TOKENS)
+        for index, piece in enumerate(pieces, 1):
+            units.append((f"{heading} (part {index}/{len(pieces)})", piece))
+    return units
+
+class DocumentIndex:
+    def __init__(self, root: str = ORGANIZATION_ROOT, index_file: Optional[str] = None,
+                 directories: Optional[List[str]] = None):
+        self.root = root
+        self.index_file = index_file or os.getenv('CCO_DOCUMENT_INDEX', DOCUMENT_INDEX_FILE)
+        self.directories = directories or INDEXED_DIRECTORIES
+        self.corpus = get_corpus(root)
+        self.documents = {}
+        self.sections = {}
+        self.postings = {}
+        self.total_length = 0
+        self.dirty = False
+        
+        if os.path.exists(self.index_file):
+            try:
+                with open(self.index_file, 'r') as f:
+                    stored = json.load(f)
+                if stored.get('version') == INDEX_VERSION and stored.get('directories') == self.directories:
+                    self.documents = stored['documents']
+                    self.sections = stored['sections']
+                    self.postings = stored['postings']
+                    self.total_length = sum(section['length'] for section in self.sections.values())
+            except (OSError, json.JSONDecodeError, KeyError):
+                print(f"⚠️ Rebuilding unreadable document index {self.index_file}")
+    
+    def document_paths(self) -> List[str]:
+        prefixes = tuple(os.path.join(directory, '') for directory in self.directories)
+        return [path for path in self.corpus.list_documents(refresh=True) if path.startswith(prefixes)]
+    
+    def update(self) -> Dict:
+        """Re-index documents added or changed since the last update and drop deleted ones
+        
+        Files whose size and mtime are unchanged are not even read.
+        """
+        counts = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0}
+        paths = self.document_paths()
+        
+        for doc_path in set(self.documents) - set(paths):
+            self.remove_document(doc_path)
+            counts['removed'] += 1
+        
+        stale = []
+        for doc_path in paths:
+            known = self.documents.get(doc_path)
+            stat = os.stat(os.path.join(self.root, doc_path))
+            if known and known['size'] == stat.st_size and known['mtime'] == stat.st_mtime:
+                counts['unchanged'] += 1
+            else:
+                stale.append(doc_path)
+        
+        # Only new or touched files are read, in parallel on the corpus pool
+        for doc_path, document in self.corpus.load_many(stale).items():
+            known = self.documents.get(doc_path)
+            if document is None:
+                continue
+            if known and known['content_sha256'] == document['sha256']:
+                known.update({'size': document['size'], 'mtime': document['mtime']})
+                self.dirty = True
+                counts['unchanged'] += 1
+                continue
+            
+            if known:
+                self.remove_document(doc_path)
+            self.add_document(doc_path, document)
+            counts['updated' if known else 'added'] += 1
+        
+        return counts
+    
+    def add_document(self, doc_path: str, document: Dict):
+        section_ids = []
+        for index, (heading, text) in enumerate(document_units(self.corpus.get_sections(doc_path))):
+            terms = tokenize(f"{heading} {text}")
+            if not terms:
+                continue
+            section_id = f"{doc_path}#{index}"
+            self.sections[section_id] = {
+                'path': doc_path,
+                'heading': heading,
+                'text': text,
+                'length': len(terms),
+                'tokens': estimate_tokens(text)
+            }
+            for term, frequency in Counter(terms).items():
+                self.postings.setdefault(term, {})[section_id] = frequency
+            self.total_length += len(terms)
+            section_ids.append(section_id)
+        
+        self.documents[doc_path] = {
+            'content_sha256': document['sha256'],
+            'size': document['size'],
+            'mtime': document['mtime'],
+            'sections': section_ids,
+            'indexed_at': datetime.now().isoformat()
+        }
+        self.dirty = True
+    
+    def remove_document(self, doc_path: str):
+        for section_id in self.documents.pop(doc_path, {}).get('sections', []):
+            section = self.sections.pop(section_id, None)
+            if section is None:
+                continue
+            self.total_length -= section['length']
+            for term in set(tokenize(f"{section['heading']} {section['text']}")):
+                postings = self.postings.get(term)
+                if postings is not None:
+                    postings.pop(section_id, None)
+                    if not postings:
+                        del self.postings[term]
+        self.dirty = True
+    
+    def save(self):
+        """Persist the index atomically if anything changed"""
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.index_file) or '.', exist_ok=True)
+        tmp_file = f"{self.index_file}.tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump({
+                'version': INDEX_VERSION,
+                'directories': self.directories,
+                'documents': self.documents,
+                'sections': self.sections,
+                'postings': self.postings
+            }, f, separators=(',', ':'))
+        os.replace(tmp_file, self.index_file)
+        self.dirty = False
+    
+    def search(self, query: str, k: int = 10, paths: Optional[List[str]] = None) -> List[Tuple[float, Dict]]:
+        """Top-k sections by BM25 score, optionally restricted to some documents"""
+        section_count = len(self.sections)
+        if not section_count:
+            return []
+        
+        average_length = self.total_length / section_count
+        scores = Counter()
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (section_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for section_id, frequency in postings.items():
+                length = self.sections[section_id]['length']
+                scores[section_id] += idf * frequency * (BM25_K1 + 1) / (
+                    frequency + BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+                )
+        
+        results = []
+        for section_id, score in scores.most_common():
+            section = self.sections[section_id]
+            if paths and section['path'] not in paths:
+                continue
+            results.append((round(score, 4), {'id': section_id, **section}))
+            if len(results) >= k:
+                break
+        return results
+    
+    def select_context(self, query: str, token_budget: int = 1500, k: int = 20,
+                       paths: Optional[List[str]] = None) -> str:
+        """Most relevant sections for query, best first, packed under token_budget"""
+        selected = []
+        used = 0
+        for _, section in self.search(query, k, paths):
+            block = f"[{section['path']} - {section['heading']}]\n{section['text'].strip()}"
+            block_tokens = estimate_tokens(block)
+            if used + block_tokens > token_budget:
+                continue
+            selected.append(block)
+            used += block_tokens
+        return '\n\n'.join(selected)
+
+def load_document_index(update: bool = True) -> DocumentIndex:
+    """Open the persisted index, bringing it up to date with the documents on disk"""
+    index = DocumentIndex()
+    if update:
+        index.update()
+        index.save()
+    return index
+
+if __name__ == "__main__":
+    import sys
+    
+    index = DocumentIndex()
+    counts = index.update()
+    index.save()
+    print(f"📚 Indexed {len(index.documents)} documents, {len(index.sections)} sections "
+          f"({counts['added']} added, {counts['updated']} updated, {counts['removed']} removed)")
+    
+    if len(sys.argv) > 1:
+        for score, section in index.search(' '.join(sys.argv[1:]), k=5):
+            print(f"   {score:6.2f}  {section['path']} - {section['heading']}")
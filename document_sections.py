@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Document Section Map-Reduce
+Packs Markdown sections into chunks under a token budget and reduces the
+per-chunk analyses back into the per-document analysis schema
+"""
+
+from typing import Dict, List
+
+from cco_patch_review import estimate_tokens, split_oversized
+from document_cache import split_markdown_sections
+
+SCORE_FIELDS = [
+    'strategic_alignment', 'operational_feasibility', 'governance_soundness',
+    'technical_viability', 'financial_sustainability', 'overall_score'
+]
+LIST_LIMITS = {'key_strengths': 10, 'concerns': 15, 'recommendations': 15}
+
+def chunk_document(content: str, token_budget: int, markdown: bool = True) -> List[Dict]:
+    """Consecutive sections packed into chunks no larger than token_budget
+    
+    A section larger than the budget is split on line boundaries.
+    """
+    sections = split_markdown_sections(content) if markdown else [('(document)', content)]
+    chunks = []
+    current = {'headings': [], 'text': '', 'tokens': 0}
+    
+    def flush():
+        nonlocal current
+        if current['text']:
+            chunks.append(current)
+        current = {'headings': [], 'text': '', 'tokens': 0}
+    
+    for heading, text in sections:
+        pieces = split_oversized(text, token_budget) if estimate_tokens(text) > token_budget else [text]
+        for index, piece in enumerate(pieces, 1):
+            label = heading if len(pieces) == 1 else f"{heading} (part {index}/{len(pieces)})"
+            piece_tokens = estimate_tokens(piece)
+            if current['tokens'] + piece_tokens > token_budget:
+                flush()
+            current['headings'].append(label)
+            current['text'] += piece
+            current['tokens'] += piece_tokens
+    
+    flush()
+    return chunks
+
+def quality_for_score(score: float) -> str:
+    if score >= 90:
+        return 'excellent'
+    if score >= 75:
+        return 'good'
+    if score >= 60:
+        return 'fair'
+    return 'poor'
+
+def reduce_section_analyses(chunks: List[Dict], analyses: List[Dict]) -> Dict:
+    """Merge per-chunk analyses into one document analysis
+    
+    Scores are averaged weighted by chunk size; any rejected section rejects the
+    document and unreviewed sections make it conditional at best.
+    """
+    reviewed = [(chunk, analysis) for chunk, analysis in zip(chunks, analyses)
+                if not analysis.get('error') and not analysis.get('parse_error')]
+    failed = [chunk for chunk, analysis in zip(chunks, analyses)
+              if analysis.get('error') or analysis.get('parse_error')]
+    
+    if not reviewed:
+        return {
+            'analysis_quality': 'unavailable',
+            'overall_score': 0,
+            'approval_status': 'rejected',
+            'error': f'No sections could be analyzed: {analyses[0].get("error", "parse failure") if analyses else "empty document"}'
+        }
+    
+    result = {}
+    for field in SCORE_FIELDS:
+        weighted = [(analysis[field], chunk['tokens']) for chunk, analysis in reviewed
+                    if isinstance(analysis.get(field), (int, float))]
+        if weighted:
+            result[field] = round(sum(score * weight for score, weight in weighted) / sum(w for _, w in weighted), 1)
+    
+    for field, limit in LIST_LIMITS.items():
+        merged = []
+        for _, analysis in reviewed:
+            for item in analysis.get(field, []) or []:
+                if item not in merged:
+                    merged.append(item)
+        result[field] = merged[:limit]
+    
+    statuses = [analysis.get('approval_status', 'conditional') for _, analysis in reviewed]
+    if 'rejected' in statuses:
+        approval_status = 'rejected'
+    elif failed or any(status != 'approved' for status in statuses):
+        approval_status = 'conditional'
+    else:
+        approval_status = 'approved'
+    
+    overall = result.get('overall_score', 0)
+    result.update({
+        'analysis_quality': quality_for_score(overall),
+        'approval_status': approval_status,
+        'reasoning': ' '.join(
+            f"[{', '.join(chunk['headings'][:3])}] {str(analysis.get('reasoning') or '')[:300]}"
+            for chunk, analysis in reviewed[:8]
+        ),
+        'review_mode': 'section-map-reduce',
+        'sections_total': len(chunks),
+        'sections_reviewed': len(reviewed),
+        'section_results': [
+            {
+                'headings': chunk['headings'],
+                'overall_score': analysis.get('overall_score'),
+                'approval_status': analysis.get('approval_status'),
+                'error': analysis.get('error') or ('unparseable response' if analysis.get('parse_error') else None)
+            }
+            for chunk, analysis in zip(chunks, analyses)
+        ]
+    })
+    if failed:
+        result['concerns'] = (result['concerns'] + [
+            f"Not reviewed: {', '.join(chunk['headings'][:3])}" for chunk in failed
+        ])[:LIST_LIMITS['concerns']]
+    return result
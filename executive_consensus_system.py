@@ -6,17 +6,34 @@ Integrates with CCO GitHub workflow for automated approvals
 """
 
 import os
+import sys
+import glob
 import json
 import asyncio
-import requests
+import contextlib
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 import time
+from cco_path_router import PathRouter, LEVEL_RANK
+from executive_keyword_classifier import KeywordClassifier
+from openai_client import OpenAIClient
+from deadline import Deadline, DeadlineExceeded
+from segmented_log import get_log_writer
+from consensus_rollup import ConsensusRollup, ROLLUP_CHECKPOINT_FILE
+from decision_cache import DecisionCache, proposal_fingerprint
+from review_json import (extract_json, response_format, structured_output_enabled,
+                         ReviewParseError, EXECUTIVE_DECISION_SCHEMA)
+
+CONSENSUS_LOG_FILE = '/root/wirereport_organization/logs/executive_consensus.jsonl'
 
 class ExecutiveConsensusSystem:
-    def __init__(self):
+    def __init__(self, openai_client: Optional[OpenAIClient] = None):
         self.openai_api_key = os.getenv('OPENAI_API_KEY')
+        self.openai_client = openai_client or OpenAIClient(self.openai_api_key)
         self.consensus_log = []
+        self.path_router = PathRouter.load()
+        self.keyword_classifier = KeywordClassifier.load()
+        self.decision_cache = DecisionCache()
         self.executive_levels = {
             'board': {
                 'authority': '>$500K, strategic initiatives, major partnerships',
@@ -38,8 +55,12 @@ class ExecutiveConsensusSystem:
             }
         }
     
-    async def evaluate_executive_change(self, change_proposal: Dict) -> Dict:
-        """Evaluate executive-level change with OpenAI/Claude consensus"""
+    async def evaluate_executive_change(self, change_proposal: Dict, deadline: Optional[Deadline] = None,
+                                        force_refresh: bool = False) -> Dict:
+        """Evaluate executive-level change with OpenAI/Claude consensus within the level's time budget
+        
+        An identical proposal decided before (and not expired) reuses that decision unless force_refresh.
+        """
         
         print(f"🏛️ Executive Consensus: {change_proposal.get('title', 'Untitled Change')}")
         print("-" * 60)
@@ -61,40 +82,90 @@ class ExecutiveConsensusSystem:
                 'reasoning': 'Standard change - no executive consensus required'
             }
         
-        # Start consensus process
-        consensus_start = datetime.now()
-        
-        # Step 1: OpenAI Executive Review
-        print("\n🤖 Requesting OpenAI Executive Review...")
-        openai_review = await self.get_openai_executive_review(change_proposal, executive_level)
+        fingerprint = proposal_fingerprint(change_proposal)
+        if not force_refresh:
+            lookup_start = datetime.now()
+            cached = self.decision_cache.get(fingerprint, executive_level)
+            if cached:
+                provenance = cached['provenance']
+                print(f"♻️ Reusing decision for unchanged proposal {provenance['original_change_id']} "
+                      f"from {provenance['decided_at']}: {cached.get('status', 'UNKNOWN')}")
+                
+                # The reused decision is still a decision for this change - log it for the audit trail and rollup
+                consensus_record = {
+                    'change_id': change_proposal.get('id', f"change-{int(time.time())}"),
+                    'fingerprint': fingerprint,
+                    'executive_level': executive_level,
+                    'change_proposal': change_proposal,
+                    'openai_review': None,
+                    'claude_review': None,
+                    'consensus_result': cached,
+                    'cached': True,
+                    'provenance': provenance,
+                    'duration_seconds': (datetime.now() - lookup_start).total_seconds(),
+                    'timestamp': datetime.now().isoformat()
+                }
+                self.consensus_log.append(consensus_record)
+                await self.save_consensus_log(consensus_record)
+                return cached
         
-        # Step 2: Claude Executive Review
-        print("🧠 Requesting Claude Executive Review...")
-        claude_review = await self.get_claude_executive_review(change_proposal, executive_level)
+        # Start consensus process - the level's timeout_minutes bounds every step
+        consensus_start = datetime.now()
+        deadline = deadline or Deadline.from_minutes(requirements['timeout_minutes'])
+        openai_review = claude_review = None
         
-        # Step 3: Consensus Analysis
-        print("⚖️ Analyzing Executive Consensus...")
-        consensus_result = await self.analyze_executive_consensus(
-            openai_review, claude_review, change_proposal, executive_level
-        )
+        try:
+            # Step 1: OpenAI Executive Review
+            print("\n🤖 Requesting OpenAI Executive Review...")
+            openai_review = await self.get_openai_executive_review(change_proposal, executive_level, deadline)
+            
+            # Step 2: Claude Executive Review
+            print("🧠 Requesting Claude Executive Review...")
+            claude_review = await deadline.run(
+                self.get_claude_executive_review(change_proposal, executive_level), 'Claude review'
+            )
+            
+            # Step 3: Consensus Analysis
+            print("⚖️ Analyzing Executive Consensus...")
+            consensus_result = await self.analyze_executive_consensus(
+                openai_review, claude_review, change_proposal, executive_level, deadline
+            )
+        except DeadlineExceeded as e:
+            print(f"   ⏰ {e}")
+            consensus_result = {
+                'approved': False,
+                'status': 'DEADLINE EXCEEDED - REQUIRES REVISION',
+                'consensus_type': 'deadline_exceeded',
+                'confidence': 0,
+                'reasoning': f'{executive_level} consensus was not reached within its '
+                             f'{e.budget_seconds / 60:.1f} minute budget (stopped during {e.stage}).',
+                'action_required': 'Resubmit the proposal for a fresh consensus round'
+            }
+        consensus_result['executive_level'] = executive_level
         
         # Log the complete consensus process
         consensus_record = {
             'change_id': change_proposal.get('id', f"change-{int(time.time())}"),
+            'fingerprint': fingerprint,
             'executive_level': executive_level,
             'change_proposal': change_proposal,
             'openai_review': openai_review,
             'claude_review': claude_review,
             'consensus_result': consensus_result,
             'duration_seconds': (datetime.now() - consensus_start).total_seconds(),
+            'deadline': deadline.as_dict(),
             'timestamp': datetime.now().isoformat()
         }
         
         self.consensus_log.append(consensus_record)
         
-        # Save consensus log
+        # Save consensus log - a non-blocking queue append, deliberately outside the
+        # budget so deadline_exceeded outcomes are recorded too
         await self.save_consensus_log(consensus_record)
         
+        if self.decision_cache.is_cacheable(consensus_result, [openai_review, claude_review]):
+            self.decision_cache.put(fingerprint, executive_level, consensus_record['change_id'], consensus_result)
+        
         print(f"\n{'✅' if consensus_result['approved'] else '❌'} Executive Consensus: {consensus_result['status']}")
         print(f"⏱️ Duration: {consensus_record['duration_seconds']:.1f} seconds")
         
@@ -102,54 +173,27 @@ class ExecutiveConsensusSystem:
     
     def determine_executive_level(self, change_proposal: Dict) -> str:
         """Determine required executive approval level"""
-        
-        change_type = change_proposal.get('type', '').lower()
-        files_changed = change_proposal.get('files_changed', [])
-        title = change_proposal.get('title', '').lower()
-        
-        # Board-level indicators
-        board_indicators = [
-            'governance', 'charter', 'strategic', 'budget', 'partnership',
-            'merger', 'acquisition', 'expansion', 'ipo', 'funding'
-        ]
-        
-        # C-suite level indicators
-        csuite_indicators = [
-            'policy', 'operational', 'revenue', 'cost', 'financial',
-            'organizational', 'personnel', 'crisis', 'security'
-        ]
-        
-        # CCO level indicators
-        cco_indicators = [
-            'implementation', 'technical', 'infrastructure', 'deployment',
-            'architecture', 'performance', 'monitoring'
-        ]
-        
-        # Check for board-level changes
-        if any(indicator in title for indicator in board_indicators):
-            return 'board'
-        
-        if any('governance/' in f or 'charters/' in f for f in files_changed):
-            return 'board'
-        
-        # Check for C-suite changes
-        if any(indicator in title for indicator in csuite_indicators):
-            return 'c-suite'
-        
-        if any('consensus/' in f for f in files_changed):
-            return 'c-suite'
-        
-        # Check for CCO changes
-        if any(indicator in title for indicator in cco_indicators):
-            return 'cco'
-        
-        if any('implementation/' in f for f in files_changed):
-            return 'cco'
-        
-        # Default to CCO level
-        return 'cco'
+        return self.determine_executive_levels([change_proposal])[0]
+    
+    def determine_executive_levels(self, change_proposals: List[Dict]) -> List[str]:
+        """Determine approval levels for many proposals at once
+        
+        The level is the higher of the keyword tier (title, type and description)
+        and the tier required by the changed file paths, never below CCO.
+        """
+        keyword_results = self.keyword_classifier.classify_batch(change_proposals)
+        levels = []
+        
+        for change_proposal, keyword_result in zip(change_proposals, keyword_results):
+            # Level required by the changed file paths (single pass, stops at board)
+            path_level = self.path_router.highest_level(change_proposal.get('files_changed', []))
+            level = max(keyword_result['executive_level'], path_level, 'cco', key=LEVEL_RANK.get)
+            levels.append(level)
+        
+        return levels
     
-    async def get_openai_executive_review(self, change_proposal: Dict, executive_level: str) -> Dict:
+    async def get_openai_executive_review(self, change_proposal: Dict, executive_level: str,
+                                          deadline: Optional[Deadline] = None) -> Dict:
         """Get OpenAI's executive review of the proposed change"""
         
         if not self.openai_api_key:
@@ -199,11 +243,6 @@ Respond in JSON format:
 """
         
         try:
-            headers = {
-                'Authorization': f'Bearer {self.openai_api_key}',
-                'Content-Type': 'application/json'
-            }
-            
             data = {
                 'model': 'gpt-4o',
                 'messages': [
@@ -213,29 +252,33 @@ Respond in JSON format:
                 'temperature': 0.3,
                 'max_tokens': 2000
             }
+            if structured_output_enabled():
+                data['response_format'] = response_format('executive_decision', EXECUTIVE_DECISION_SCHEMA)
             
-            response = requests.post(
-                'https://api.openai.com/v1/chat/completions',
-                headers=headers,
-                json=data,
-                timeout=120
-            )
+            if deadline:
+                # Socket timeout and overall wait both shrink with the remaining budget
+                call_timeout = deadline.timeout(120, 'OpenAI review')
+                response = await deadline.run(
+                    self.openai_client.achat(data, timeout=call_timeout), 'OpenAI review', cap=call_timeout
+                )
+            else:
+                response = await self.openai_client.achat(data, timeout=120)
             
             if response.status_code == 200:
                 content = response.json()['choices'][0]['message']['content']
                 
-                # Parse JSON response
+                # Parse and validate the JSON decision (bare, fenced or in prose)
                 try:
-                    result = json.loads(content)
+                    result = extract_json(content, EXECUTIVE_DECISION_SCHEMA)
                     print(f"   ✅ OpenAI: {result.get('approved', False)} (confidence: {result.get('confidence', 0)}%)")
                     return result
-                except json.JSONDecodeError:
-                    # Fallback if JSON parsing fails
+                except ReviewParseError as e:
+                    # Never guess approval from free text
                     return {
-                        'approved': 'approve' in content.lower(),
-                        'confidence': 70,
-                        'reasoning': content,
-                        'executive_analysis': 'JSON parsing failed, used text analysis'
+                        'approved': False,
+                        'confidence': 0,
+                        'reasoning': f'Unparseable OpenAI decision ({e}): {content[:500]}',
+                        'executive_analysis': 'Response parsing failed'
                     }
             else:
                 return {
@@ -245,6 +288,8 @@ Respond in JSON format:
                     'executive_analysis': 'API call failed'
                 }
                 
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             return {
                 'approved': False,
@@ -298,7 +343,8 @@ Respond in JSON format:
         return claude_analysis
     
     async def analyze_executive_consensus(self, openai_review: Dict, claude_review: Dict, 
-                                        change_proposal: Dict, executive_level: str) -> Dict:
+                                        change_proposal: Dict, executive_level: str,
+                                        deadline: Optional[Deadline] = None) -> Dict:
         """Analyze consensus between OpenAI and Claude executive reviews"""
         
         openai_approved = openai_review.get('approved', False)
@@ -331,10 +377,14 @@ Respond in JSON format:
             }
             
         else:
-            # Split decision - requires tie-breaking
-            consensus_result = await self.resolve_executive_tie(
+            # Split decision - requires tie-breaking, within what is left of the budget
+            tie_resolution = self.resolve_executive_tie(
                 openai_review, claude_review, change_proposal, executive_level
             )
+            if deadline:
+                consensus_result = await deadline.run(tie_resolution, 'tie resolution')
+            else:
+                consensus_result = await tie_resolution
         
         return consensus_result
     
@@ -380,27 +430,93 @@ Respond in JSON format:
             }
     
     async def save_consensus_log(self, consensus_record: Dict):
-        """Save consensus record to log file"""
+        """Queue consensus record on the shared buffered log writer"""
+        get_log_writer(CONSENSUS_LOG_FILE).append(consensus_record)
+    
+    async def evaluate_batch(self, proposals: Iterator[Tuple[str, Dict, Optional[str]]], concurrency: int = 8,
+                             output=None, force_refresh: bool = False) -> Dict:
+        """Evaluate many proposals with bounded concurrency, streaming JSONL results
+        
+        Proposals are pulled from the iterator only as evaluation slots free up, so
+        a long stream is never buffered. Results are written as they complete,
+        followed by a summary line.
+        """
+        output = output or sys.stdout
+        batch_start = time.monotonic()
+        
+        async def evaluate_one(source: str, proposal: Dict, error: Optional[str]) -> Dict:
+            started = time.monotonic()
+            result = None
+            if error is None:
+                try:
+                    result = await self.evaluate_executive_change(proposal, force_refresh=force_refresh)
+                except Exception as e:
+                    error = f'Evaluation failed: {e}'
+            return {
+                'type': 'result',
+                'source': source,
+                'change_id': proposal.get('id'),
+                'title': proposal.get('title'),
+                'result': result,
+                'error': error,
+                'duration_seconds': round(time.monotonic() - started, 3)
+            }
         
-        log_file = '/root/wirereport_organization/logs/executive_consensus.jsonl'
-        os.makedirs(os.path.dirname(log_file), exist_ok=True)
+        summary = {'type': 'summary', 'total': 0, 'approved': 0, 'rejected': 0, 'errors': 0, 'by_level': {}}
         
-        with open(log_file, 'a') as f:
-            f.write(json.dumps(consensus_record) + '\n')
+        def write_record(record: Dict):
+            output.write(json.dumps(record, default=str) + '\n')
+            output.flush()
+            
+            summary['total'] += 1
+            if record['error']:
+                summary['errors'] += 1
+                return
+            result = record['result']
+            summary['approved' if result.get('approved') else 'rejected'] += 1
+            level = result.get('executive_level', 'unknown')
+            summary['by_level'][level] = summary['by_level'].get(level, 0) + 1
+        
+        # At most `concurrency` evaluations in flight; refill as each one completes
+        proposals = iter(proposals)
+        in_flight = set()
+        while True:
+            while len(in_flight) < concurrency:
+                item = next(proposals, None)
+                if item is None:
+                    break
+                in_flight.add(asyncio.ensure_future(evaluate_one(*item)))
+            if not in_flight:
+                break
+            done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                write_record(task.result())
+        
+        summary['duration_seconds'] = round(time.monotonic() - batch_start, 3)
+        output.write(json.dumps(summary) + '\n')
+        output.flush()
+        return summary
     
-    def generate_executive_report(self) -> str:
-        """Generate executive consensus report"""
+    def generate_executive_report(self, checkpoint_file: str = ROLLUP_CHECKPOINT_FILE) -> str:
+        """Generate executive consensus report from the persisted log
+        
+        Rollups are checkpointed, so each run only streams records added since the last one.
+        """
+        get_log_writer(CONSENSUS_LOG_FILE).flush()
+        rollup = ConsensusRollup.load(checkpoint_file)
+        new_records = rollup.update(CONSENSUS_LOG_FILE)
+        rollup.save(checkpoint_file)
         
-        if not self.consensus_log:
+        if not rollup.total:
             return "No executive consensus decisions recorded."
         
-        total_decisions = len(self.consensus_log)
-        approved_decisions = sum(1 for log in self.consensus_log 
-                               if log.get('consensus_result', {}).get('approved', False))
+        total_decisions = rollup.total
+        approved_decisions = rollup.approved
         
         report = f"""
 # Executive Consensus Report
 Generated: {datetime.now().isoformat()}
+New Records Processed: {new_records}
 
 ## Executive Summary
 - Total Executive Decisions: {total_decisions}
@@ -411,52 +527,120 @@ Generated: {datetime.now().isoformat()}
 ## Consensus Breakdown by Level
 """
         
-        # Count by executive level
-        level_counts = {}
-        for log in self.consensus_log:
-            level = log.get('executive_level', 'unknown')
-            level_counts[level] = level_counts.get(level, 0) + 1
+        def seconds(value: Optional[float]) -> str:
+            return f"{value:.1f}s" if value is not None else 'N/A'
         
-        for level, count in level_counts.items():
-            report += f"- {level.upper()}: {count} decisions\n"
+        for level in sorted(rollup.levels, key=lambda l: -LEVEL_RANK.get(l, -1)):
+            summary = rollup.level_summary(level)
+            report += (
+                f"- {level.upper()}: {summary['total']} decisions, {summary['approval_rate']:.1f}% approved, "
+                f"avg {seconds(summary['duration_avg'])}, p50 {seconds(summary['p50'])}, "
+                f"p90 {seconds(summary['p90'])}, p99 {seconds(summary['p99'])}\n"
+            )
+        
+        report += "\n## Consensus Outcomes\n"
+        for consensus_type, count in sorted(rollup.consensus_types.items(), key=lambda item: -item[1]):
+            report += f"- {consensus_type}: {count}\n"
         
         report += "\n## Recent Executive Decisions\n"
         
         # Show last 5 decisions
-        for log in self.consensus_log[-5:]:
-            result = log.get('consensus_result', {})
-            status = "✅ APPROVED" if result.get('approved', False) else "❌ REJECTED"
+        for log in rollup.recent:
+            status = "✅ APPROVED" if log['approved'] else "❌ REJECTED"
             
             report += f"""
-### {log.get('change_proposal', {}).get('title', 'Untitled Change')}
+### {log['title']}
 - **Status**: {status}
-- **Level**: {log.get('executive_level', 'unknown').upper()}
-- **Confidence**: {result.get('confidence', 'N/A')}%
-- **Duration**: {log.get('duration_seconds', 0):.1f}s
-- **Reasoning**: {result.get('reasoning', 'No reasoning provided')[:100]}...
+- **Level**: {log['executive_level'].upper()}
+- **Confidence**: {log['confidence']}%
+- **Duration**: {log['duration_seconds']:.1f}s
+- **Reasoning**: {log['reasoning']}...
 """
         
         return report
 
+def load_checked(proposal) -> Tuple[Dict, Optional[str]]:
+    """(proposal, load error) - anything but a JSON object is reported instead of evaluated"""
+    if not isinstance(proposal, dict):
+        return {}, f'Proposal must be a JSON object, got {type(proposal).__name__}'
+    return proposal, None
+
+def read_jsonl_proposals(source: str, stream) -> Iterator[Tuple[str, Dict, Optional[str]]]:
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            proposal = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield f"{source}:{line_number}", {}, f'Invalid JSON: {e}'
+            continue
+        yield f"{source}:{line_number}", *load_checked(proposal)
+
+def iter_proposals(source: str) -> Iterator[Tuple[str, Dict, Optional[str]]]:
+    """Yield (source, proposal, load error) from a JSON file, directory, glob or JSONL stream ('-' for stdin)"""
+    if source == '-':
+        yield from read_jsonl_proposals('stdin', sys.stdin)
+        return
+    
+    if source.endswith('.jsonl'):
+        with open(source, 'r') as f:
+            yield from read_jsonl_proposals(source, f)
+        return
+    
+    if os.path.isdir(source):
+        paths = sorted(glob.glob(os.path.join(source, '*.json')))
+    elif any(c in source for c in '*?['):
+        paths = sorted(glob.glob(source, recursive=True))
+    else:
+        paths = [source]
+    
+    for path in paths:
+        try:
+            with open(path, 'r') as f:
+                loaded = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            yield path, {}, f'Could not load proposal: {e}'
+            continue
+        
+        # A file may hold a single proposal or a list (e.g. a board agenda)
+        if isinstance(loaded, list):
+            for index, proposal in enumerate(loaded):
+                yield f"{path}[{index}]", *load_checked(proposal)
+        else:
+            yield path, *load_checked(loaded)
+
+def is_batch_source(source: str) -> bool:
+    return source == '-' or source.endswith('.jsonl') or os.path.isdir(source) or any(c in source for c in '*?[')
+
 # CLI interface for executive consensus
 async def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='Executive Consensus System')
-    parser.add_argument('--evaluate', type=str, help='Evaluate change from JSON file')
+    parser.add_argument('--evaluate', type=str,
+                        help='Evaluate change(s) from a JSON file, directory, glob or JSONL stream (- for stdin)')
+    parser.add_argument('--concurrency', type=int, default=8, help='Concurrent evaluations in batch mode')
+    parser.add_argument('--force-refresh', action='store_true',
+                        help='Re-run consensus even if an identical proposal was already decided')
     parser.add_argument('--report', action='store_true', help='Generate executive report')
     parser.add_argument('--test', action='store_true', help='Test consensus system')
     
     args = parser.parse_args()
     
-    consensus = ExecutiveConsensusSystem()
+    consensus = ExecutiveConsensusSystem(OpenAIClient(pool_size=args.concurrency))
+    
+    if args.evaluate and is_batch_source(args.evaluate):
+        # Batch mode: JSONL results on stdout, progress on stderr
+        output = sys.stdout
+        with contextlib.redirect_stdout(sys.stderr):
+            await consensus.evaluate_batch(iter_proposals(args.evaluate), args.concurrency, output, args.force_refresh)
     
-    if args.evaluate:
+    elif args.evaluate:
         # Load change proposal from file
         with open(args.evaluate, 'r') as f:
             change_proposal = json.load(f)
         
-        result = await consensus.evaluate_executive_change(change_proposal)
+        result = await consensus.evaluate_executive_change(change_proposal, force_refresh=args.force_refresh)
         print(json.dumps(result, indent=2))
         
     elif args.report:
@@ -480,4 +664,4 @@ async def main():
         print("Executive Consensus System - Use --help for options")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Executive Keyword Classifier
+Compiled word-boundary keyword matching of change proposals to executive tiers
+Title, type and description are scored together in a single regex pass
+"""
+
+import os
+import re
+import json
+from typing import Dict, Iterable, List, Optional
+
+from cco_path_router import LEVEL_RANK
+
+DEFAULT_KEYWORD_TIERS = {
+    'board': [
+        'governance', 'charter', 'strategic', 'budget', 'partnership',
+        'merger', 'acquisition', 'expansion', 'ipo', 'funding'
+    ],
+    'c-suite': [
+        'policy', 'policies', 'operational', 'revenue', 'cost', 'financial',
+        'organizational', 'personnel', 'crisis', 'security'
+    ],
+    'cco': [
+        'implementation', 'technical', 'infrastructure', 'deployment',
+        'architecture', 'performance', 'monitoring'
+    ]
+}
+
+# A title hit alone qualifies a tier; description mentions need corroboration
+DEFAULT_FIELD_WEIGHTS = {'title': 3, 'type': 2, 'description': 1}
+DEFAULT_THRESHOLD = 2
+
+# Identifiers like governance_policy or budget-review split into words
+SEPARATORS = re.compile(r'[_\-/.]+')
+
+class KeywordClassifier:
+    def __init__(self, tiers: Optional[Dict[str, List[str]]] = None,
+                 field_weights: Optional[Dict[str, int]] = None, threshold: int = DEFAULT_THRESHOLD):
+        """Compile every tier's keywords into one case-insensitive alternation"""
+        self.tiers = tiers or DEFAULT_KEYWORD_TIERS
+        self.field_weights = field_weights or DEFAULT_FIELD_WEIGHTS
+        self.threshold = threshold
+        
+        self.keyword_tiers = {}
+        for tier, keywords in self.tiers.items():
+            if tier not in LEVEL_RANK:
+                raise ValueError(f"Unknown executive level '{tier}' in keyword rules")
+            for keyword in keywords:
+                keyword = keyword.lower()
+                # A keyword listed under several tiers counts for the highest one
+                if LEVEL_RANK[tier] > LEVEL_RANK.get(self.keyword_tiers.get(keyword), -1):
+                    self.keyword_tiers[keyword] = tier
+        
+        # Longest first so multi-word keywords win over their prefixes; optional plural suffix
+        alternation = '|'.join(re.escape(k) for k in sorted(self.keyword_tiers, key=len, reverse=True))
+        self.pattern = re.compile(rf'\b({alternation})(?:s|es)?\b', re.IGNORECASE)
+    
+    @classmethod
+    def load(cls, rules_file: Optional[str] = None) -> 'KeywordClassifier':
+        """Load tiers from CCO_KEYWORD_RULES (or the given JSON file), falling back to the defaults"""
+        rules_file = rules_file or os.getenv('CCO_KEYWORD_RULES')
+        if rules_file and os.path.exists(rules_file):
+            with open(rules_file, 'r') as f:
+                rules = json.load(f)
+            return cls(rules.get('tiers'), rules.get('field_weights'), rules.get('threshold', DEFAULT_THRESHOLD))
+        return cls()
+    
+    def score(self, proposal: Dict) -> Dict:
+        """Weighted keyword hits per tier, plus the matched keywords"""
+        scores = {tier: 0 for tier in self.tiers}
+        matches = {}
+        
+        for field, weight in self.field_weights.items():
+            text = proposal.get(field) or ''
+            if not isinstance(text, str):
+                continue
+            for match in self.pattern.finditer(SEPARATORS.sub(' ', text)):
+                keyword = match.group(1).lower()
+                tier = self.keyword_tiers[keyword]
+                scores[tier] += weight
+                matches.setdefault(tier, [])
+                if keyword not in matches[tier]:
+                    matches[tier].append(keyword)
+        
+        return {'scores': scores, 'matches': matches}
+    
+    def classify(self, proposal: Dict) -> Dict:
+        """Highest tier whose score reaches the threshold ('standard' when none does)"""
+        scored = self.score(proposal)
+        level = 'standard'
+        for tier, tier_score in scored['scores'].items():
+            if tier_score >= self.threshold and LEVEL_RANK[tier] > LEVEL_RANK[level]:
+                level = tier
+        return {'executive_level': level, **scored}
+    
+    def classify_batch(self, proposals: Iterable[Dict]) -> List[Dict]:
+        """Classify many proposals, reusing results for repeated title/type/description"""
+        cache = {}
+        results = []
+        for proposal in proposals:
+            key = tuple(str(proposal.get(field) or '') for field in self.field_weights)
+            if key not in cache:
+                cache[key] = self.classify(proposal)
+            results.append(cache[key])
+        return results
@@ -0,0 +1,801 @@
+#!/usr/bin/env python3
+"""
+Fake GitHub Server for CCO Scale Testing
+Local stand-in for the GitHub REST API subset used by ChiefCodeOfficer
+Seeded repositories, pull requests and files, with latency and rate limits
+
+Point the CCO at it with:
+    GITHUB_API_URL=http://localhost:8091 GITHUB_TOKEN=test python cco_github_manager.py --review-pr 1
+"""
+
+import os
+import re
+import json
+import time
+import random
+import hashlib
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+from flask import Flask, request, jsonify
+
+FAKE_GITHUB_PORT = int(os.getenv('FAKE_GITHUB_PORT', '8091'))
+
+def object_sha(kind: str, payload) -> str:
+    """Deterministic SHA for a fake git object"""
+    return hashlib.sha1(f"{kind}:{json.dumps(payload, sort_keys=True)}".encode('utf-8')).hexdigest()
+
+def timestamp() -> str:
+    return datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
+
+class FakeRepository:
+    def __init__(self, owner: str, name: str):
+        self.owner = owner
+        self.name = name
+        self.blobs = {}       # sha -> {'content', 'encoding', 'size'}
+        self.trees = {}       # sha -> {path: {'mode', 'type', 'sha', 'size'}} (flattened, full paths)
+        self.commits = {}     # sha -> git commit dict
+        self.refs = {}        # 'refs/heads/main' -> sha
+        self.pulls = {}       # number -> pull dict
+        self.pull_files = {}  # number -> list of file dicts
+        self.reviews = {}     # number -> list of reviews
+        self.statuses = {}    # sha -> list of statuses (newest last)
+        self.protection = {}  # branch -> protection settings
+        self.mergeable_polls = {}  # number -> GETs since last head change
+        
+        root_tree = self.store_tree({})
+        self.refs['refs/heads/main'] = self.store_commit('Initial commit', root_tree, [])
+    
+    @property
+    def full_name(self) -> str:
+        return f"{self.owner}/{self.name}"
+    
+    def store_tree(self, entries: Dict[str, Dict]) -> str:
+        sha = object_sha('tree', entries)
+        self.trees[sha] = entries
+        return sha
+    
+    def store_commit(self, message: str, tree_sha: str, parents: List[str]) -> str:
+        commit = {
+            'message': message,
+            'tree': tree_sha,
+            'parents': parents,
+            'date': timestamp(),
+            'author': {'name': 'Fake GitHub', 'email': 'fake@github.local', 'date': timestamp()}
+        }
+        sha = object_sha('commit', commit)
+        self.commits[sha] = commit
+        return sha
+
+class FakeGitHub:
+    def __init__(self, owner: str = 'wirereport', latency_ms: float = 0, jitter_ms: float = 0,
+                 rate_limit: int = 5000, rate_window_seconds: int = 3600):
+        self.owner = owner
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit = rate_limit
+        self.rate_window_seconds = rate_window_seconds
+        self.repos = {}
+        self.rate_usage = {}  # token -> [window_reset_epoch, used]
+        self.lock = threading.RLock()
+        self.request_count = 0
+    
+    def create_repo(self, owner: str, name: str) -> FakeRepository:
+        with self.lock:
+            repo = FakeRepository(owner, name)
+            self.repos[repo.full_name] = repo
+            return repo
+    
+    def seed(self, repo_name: str = 'wirereport-ai-organization', pulls: int = 1000,
+             files_per_pull: int = 20, hunk_lines: int = 12, random_seed: int = 2025) -> FakeRepository:
+        """Seed a repository with a file tree and many open pull requests"""
+        rng = random.Random(random_seed)
+        repo = self.create_repo(self.owner, repo_name)
+        directories = ['governance', 'consensus', 'implementation', 'charters', 'logs', 'cco-system']
+        
+        # Base tree with a few hundred documents
+        entries = {}
+        for index in range(max(files_per_pull * 10, 100)):
+            directory = directories[index % len(directories)]
+            content = f"# Document {index}\n\nSeeded organizational document in {directory}.\n"
+            blob_sha = object_sha('blob', content)
+            repo.blobs[blob_sha] = {'content': content, 'encoding': 'utf-8', 'size': len(content)}
+            entries[f"{directory}/DOC_{index:04d}.md"] = {'mode': '100644', 'type': 'blob', 'sha': blob_sha, 'size': len(content)}
+        
+        base_sha = repo.store_commit('Seed organization tree', repo.store_tree(entries), [repo.refs['refs/heads/main']])
+        repo.refs['refs/heads/main'] = base_sha
+        paths = sorted(entries)
+        
+        for number in range(1, pulls + 1):
+            count = rng.randint(1, files_per_pull)
+            files = []
+            for path in rng.sample(paths, min(count, len(paths))):
+                added = rng.randint(1, hunk_lines)
+                patch = f"@@ -1,3 +1,{3 + added} @@\n # Document\n \n" + ''.join(
+                    f"+Seeded change {number}.{line} to {path}\n" for line in range(added)
+                )
+                files.append({
+                    'sha': object_sha('blob', patch),
+                    'filename': path,
+                    'status': 'modified',
+                    'additions': added,
+                    'deletions': 0,
+                    'changes': added,
+                    'patch': patch
+                })
+            
+            head_sha = object_sha('head', {'pull': number, 'files': [f['filename'] for f in files]})
+            repo.commits[head_sha] = {
+                'message': f'Seeded change #{number}',
+                'tree': repo.commits[base_sha]['tree'],
+                'parents': [base_sha],
+                'date': timestamp(),
+                'author': {'name': 'Seed Bot', 'email': 'seed@github.local', 'date': timestamp()}
+            }
+            branch = f"seed/change-{number}"
+            repo.refs[f'refs/heads/{branch}'] = head_sha
+            repo.pulls[number] = {
+                'number': number,
+                'title': f"{rng.choice(['Update', 'Revise', 'Add', 'Refactor'])} {files[0]['filename']}",
+                'body': f"Seeded pull request touching {len(files)} files.",
+                'state': 'open',
+                'merged': False,
+                'head': {'ref': branch, 'sha': head_sha},
+                'base': {'ref': 'main', 'sha': base_sha},
+                'user': {'login': rng.choice(['openai-agent', 'claude-agent', 'cao-bot'])},
+                'created_at': timestamp()
+            }
+            repo.pull_files[number] = files
+        
+        return repo
+    
+    def consume_rate_limit(self, token: str) -> Dict:
+        """Count a request against the token's rate limit window"""
+        with self.lock:
+            now = int(time.time())
+            reset, used = self.rate_usage.get(token, (now + self.rate_window_seconds, 0))
+            if now >= reset:
+                reset, used = now + self.rate_window_seconds, 0
+            used += 1
+            self.rate_usage[token] = (reset, used)
+            self.request_count += 1
+        
+        return {
+            'X-RateLimit-Limit': str(self.rate_limit),
+            'X-RateLimit-Remaining': str(max(self.rate_limit - used, 0)),
+            'X-RateLimit-Reset': str(reset),
+            'X-RateLimit-Used': str(used),
+            'X-RateLimit-Resource': 'core'
+        }
+
+def create_app(fake: FakeGitHub) -> Flask:
+    """Build the Flask app serving the fake GitHub API"""
+    app = Flask(__name__)
+    
+    def base() -> str:
+        return request.host_url.rstrip('/')
+    
+    def repo_url(repo: FakeRepository) -> str:
+        return f"{base()}/repos/{repo.full_name}"
+    
+    def error(status: int, message: str):
+        return jsonify({'message': message, 'documentation_url': 'https://docs.github.com/rest'}), status
+    
+    def get_repo(owner: str, name: str) -> Optional[FakeRepository]:
+        return fake.repos.get(f"{owner}/{name}")
+    
+    def paginate(items: List):
+        per_page = min(int(request.args.get('per_page', 30)), 100)
+        page = max(int(request.args.get('page', 1)), 1)
+        chunk = items[(page - 1) * per_page:page * per_page]
+        response = jsonify(chunk)
+        last = max((len(items) + per_page - 1) // per_page, 1)
+        links = []
+        if page < last:
+            links.append(f'<{request.base_url}?per_page={per_page}&page={page + 1}>; rel="next"')
+            links.append(f'<{request.base_url}?per_page={per_page}&page={last}>; rel="last"')
+        if links:
+            response.headers['Link'] = ', '.join(links)
+        return response
+    
+    def user_json(login: str) -> Dict:
+        return {'login': login, 'id': abs(hash(login)) % 10 ** 8, 'type': 'User', 'url': f"{base()}/users/{login}"}
+    
+    def repo_json(repo: FakeRepository) -> Dict:
+        return {
+            'id': abs(hash(repo.full_name)) % 10 ** 8,
+            'name': repo.name,
+            'full_name': repo.full_name,
+            'owner': user_json(repo.owner),
+            'private': False,
+            'default_branch': 'main',
+            'url': repo_url(repo),
+            'html_url': f"{base()}/{repo.full_name}",
+            'clone_url': f"{base()}/{repo.full_name}.git",
+            'has_issues': True,
+            'has_projects': True,
+            'has_wiki': True
+        }
+    
+    def commit_json(repo: FakeRepository, sha: str) -> Dict:
+        commit = repo.commits[sha]
+        return {
+            'sha': sha,
+            'url': f"{repo_url(repo)}/git/commits/{sha}",
+            'message': commit['message'],
+            'author': commit['author'],
+            'committer': commit['author'],
+            'tree': {'sha': commit['tree'], 'url': f"{repo_url(repo)}/git/trees/{commit['tree']}"},
+            'parents': [{'sha': p, 'url': f"{repo_url(repo)}/git/commits/{p}"} for p in commit['parents']]
+        }
+    
+    def ref_json(repo: FakeRepository, ref: str) -> Dict:
+        sha = repo.refs[ref]
+        return {
+            'ref': ref,
+            'url': f"{repo_url(repo)}/git/{ref}",
+            'object': {'sha': sha, 'type': 'commit', 'url': f"{repo_url(repo)}/git/commits/{sha}"}
+        }
+    
+    def required_contexts(repo: FakeRepository, branch: str) -> List[str]:
+        checks = (repo.protection.get(branch) or {}).get('required_status_checks') or {}
+        return checks.get('contexts') or [check['context'] for check in checks.get('checks', [])]
+    
+    def combined_state(repo: FakeRepository, sha: str) -> Dict[str, str]:
+        latest = {}
+        for status in repo.statuses.get(sha, []):
+            latest[status['context']] = status['state']
+        return latest
+    
+    def strict_checks(repo: FakeRepository, branch: str) -> bool:
+        checks = (repo.protection.get(branch) or {}).get('required_status_checks') or {}
+        return bool(checks.get('strict'))
+    
+    def is_ancestor(repo: FakeRepository, ancestor: str, sha: str) -> bool:
+        seen = set()
+        stack = [sha]
+        while stack:
+            current = stack.pop()
+            if current == ancestor:
+                return True
+            if current in seen or current not in repo.commits:
+                continue
+            seen.add(current)
+            stack.extend(repo.commits[current]['parents'])
+        return False
+    
+    def pull_json(repo: FakeRepository, number: int) -> Dict:
+        pull = repo.pulls[number]
+        
+        # GitHub computes mergeability lazily: null on the first read after a change
+        polls = repo.mergeable_polls.get(number, 0)
+        repo.mergeable_polls[number] = polls + 1
+        mergeable = None if polls == 0 and not pull['merged'] else pull['state'] == 'open'
+        
+        if mergeable is None:
+            mergeable_state = 'unknown'
+        elif pull['state'] == 'open' and not is_ancestor(repo, repo.refs['refs/heads/main'], pull['head']['sha']):
+            mergeable_state = 'behind'
+        else:
+            mergeable_state = 'clean'
+        
+        url = f"{repo_url(repo)}/pulls/{number}"
+        return {
+            **pull,
+            'id': number,
+            'url': url,
+            'html_url': f"{base()}/{repo.full_name}/pull/{number}",
+            'user': user_json(pull['user']['login']),
+            'head': {**pull['head'], 'label': pull['head']['ref'], 'repo': repo_json(repo)},
+            'base': {**pull['base'], 'sha': repo.refs['refs/heads/main'], 'label': 'main', 'repo': repo_json(repo)},
+            'mergeable': mergeable,
+            'mergeable_state': mergeable_state,
+            'changed_files': len(repo.pull_files.get(number, [])),
+            'commits': 1
+        }
+    
+    @app.before_request
+    def simulate_network():
+        delay = fake.latency_ms + (random.uniform(0, fake.jitter_ms) if fake.jitter_ms else 0)
+        if delay:
+            time.sleep(delay / 1000)
+        
+        token = request.headers.get('Authorization', 'anonymous')
+        request.rate_headers = fake.consume_rate_limit(token)
+        if int(request.rate_headers['X-RateLimit-Used']) > fake.rate_limit:
+            response, status = error(403, 'API rate limit exceeded')
+            response.headers.update(request.rate_headers)
+            return response, status
+    
+    @app.after_request
+    def add_rate_headers(response):
+        response.headers.update(getattr(request, 'rate_headers', {}))
+        return response
+    
+    @app.route('/rate_limit', methods=['GET'])
+    def rate_limit():
+        headers = request.rate_headers
+        core = {
+            'limit': int(headers['X-RateLimit-Limit']),
+            'remaining': int(headers['X-RateLimit-Remaining']),
+            'reset': int(headers['X-RateLimit-Reset']),
+            'used': int(headers['X-RateLimit-Used'])
+        }
+        return jsonify({'resources': {'core': core, 'graphql': core}, 'rate': core})
+    
+    @app.route('/user', methods=['GET'])
+    def get_user():
+        return jsonify(user_json(fake.owner))
+    
+    @app.route('/orgs/<org>', methods=['GET'])
+    def get_org(org):
+        return jsonify({'login': org, 'id': abs(hash(org)) % 10 ** 8, 'url': f"{base()}/orgs/{org}"})
+    
+    @app.route('/user/repos', methods=['POST'])
+    @app.route('/orgs/<org>/repos', methods=['POST'])
+    def create_repo(org=None):
+        payload = request.get_json(force=True)
+        owner = org or fake.owner
+        if f"{owner}/{payload['name']}" in fake.repos:
+            return error(422, 'Repository creation failed: name already exists on this account')
+        repo = fake.create_repo(owner, payload['name'])
+        return jsonify(repo_json(repo)), 201
+    
+    @app.route('/repos/<owner>/<name>', methods=['GET'])
+    def get_repository(owner, name):
+        repo = get_repo(owner, name)
+        return jsonify(repo_json(repo)) if repo else error(404, 'Not Found')
+    
+    @app.route('/repos/<owner>/<name>/branches/<path:branch>', methods=['GET'])
+    def get_branch(owner, name, branch):
+        repo = get_repo(owner, name)
+        if not repo or f'refs/heads/{branch}' not in repo.refs:
+            return error(404, 'Branch not found')
+        sha = repo.refs[f'refs/heads/{branch}']
+        return jsonify({
+            'name': branch,
+            'commit': {'sha': sha, 'url': f"{repo_url(repo)}/commits/{sha}"},
+            'protected': branch in repo.protection,
+            'protection_url': f"{repo_url(repo)}/branches/{branch}/protection"
+        })
+    
+    @app.route('/repos/<owner>/<name>/branches/<path:branch>/protection', methods=['PUT', 'GET'])
+    def branch_protection(owner, name, branch):
+        repo = get_repo(owner, name)
+        if not repo:
+            return error(404, 'Not Found')
+        if request.method == 'PUT':
+            with fake.lock:
+                repo.protection[branch] = request.get_json(force=True)
+        elif branch not in repo.protection:
+            return error(404, 'Branch not protected')
+        settings = repo.protection[branch]
+        return jsonify({
+            'url': f"{repo_url(repo)}/branches/{branch}/protection",
+            'required_status_checks': {**(settings.get('required_status_checks') or {}),
+                                       'url': f"{repo_url(repo)}/branches/{branch}/protection/required_status_checks"},
+            'enforce_admins': {'enabled': bool(settings.get('enforce_admins'))}
+        })
+    
+    @app.route('/repos/<owner>/<name>/pulls', methods=['GET'])
+    def list_pulls(owner, name):
+        repo = get_repo(owner, name)
+        if not repo:
+            return error(404, 'Not Found')
+        state = request.args.get('state', 'open')
+        numbers = [n for n, p in sorted(repo.pulls.items()) if state == 'all' or p['state'] == state]
+        return paginate([pull_json(repo, n) for n in numbers])
+    
+    @app.route('/repos/<owner>/<name>/pulls/<int:number>', methods=['GET'])
+    def get_pull(owner, name, number):
+        repo = get_repo(owner, name)
+        if not repo or number not in repo.pulls:
+            return error(404, 'Not Found')
+        with fake.lock:
+            return jsonify(pull_json(repo, number))
+    
+    @app.route('/repos/<owner>/<name>/pulls/<int:number>/files', methods=['GET'])
+    def get_pull_files(owner, name, number):
+        repo = get_repo(owner, name)
+        if not repo or number not in repo.pulls:
+            return error(404, 'Not Found')
+        return paginate(repo.pull_files.get(number, []))
+    
+    @app.route('/repos/<owner>/<name>/pulls/<int:number>/reviews', methods=['GET', 'POST'])
+    def pull_reviews(owner, name, number):
+        repo = get_repo(owner, name)
+        if not repo or number not in repo.pulls:
+            return error(404, 'Not Found')
+        if request.method == 'GET':
+            return paginate(repo.reviews.get(number, []))
+        
+        payload = request.get_json(force=True)
+        state = {'APPROVE': 'APPROVED', 'REQUEST_CHANGES': 'CHANGES_REQUESTED', 'COMMENT': 'COMMENTED'}.get(
+            payload.get('event'), 'PENDING'
+        )
+        with fake.lock:
+            reviews = repo.reviews.setdefault(number, [])
+            review = {
+                'id': len(reviews) + 1,
+                'user': user_json(fake.owner),
+                'body': payload.get('body', ''),
+                'state': state,
+                'commit_id': repo.pulls[number]['head']['sha'],
+                'submitted_at': timestamp(),
+                'html_url': f"{base()}/{repo.full_name}/pull/{number}#review-{len(reviews) + 1}",
+                'pull_request_url': f"{repo_url(repo)}/pulls/{number}"
+            }
+            reviews.append(review)
+        return jsonify(review)
+    
+    @app.route('/repos/<owner>/<name>/pulls/<int:number>/merge', methods=['PUT', 'GET'])
+    def merge_pull(owner, name, number):
+        repo = get_repo(owner, name)
+        if not repo or number not in repo.pulls:
+            return error(404, 'Not Found')
+        pull = repo.pulls[number]
+        if request.method == 'GET':
+            return ('', 204) if pull['merged'] else error(404, 'Not Found')
+        
+        payload = request.get_json(force=True, silent=True) or {}
+        with fake.lock:
+            if pull['merged'] or pull['state'] != 'open':
+                return error(405, 'Pull Request is not mergeable')
+            if payload.get('sha') and payload['sha'] != pull['head']['sha']:
+                return error(409, 'Head branch was modified. Review and try the merge again.')
+            
+            required = required_contexts(repo, pull['base']['ref'])
+            states = combined_state(repo, pull['head']['sha'])
+            missing = [context for context in required if states.get(context) != 'success']
+            if missing:
+                return error(405, f"Required status check \"{missing[0]}\" is expected.")
+            
+            base_ref = f"refs/heads/{pull['base']['ref']}"
+            base_sha = repo.refs[base_ref]
+            if strict_checks(repo, pull['base']['ref']) and not is_ancestor(repo, base_sha, pull['head']['sha']):
+                return error(405, 'Head branch is not up to date with the base branch')
+            merge_sha = repo.store_commit(
+                payload.get('commit_message') or f"Merge pull request #{number}",
+                repo.commits[base_sha]['tree'],
+                [base_sha, pull['head']['sha']]
+            )
+            repo.refs[base_ref] = merge_sha
+            pull.update({'merged': True, 'state': 'closed', 'merge_commit_sha': merge_sha})
+            
+            # Base moved: every other open PR needs its mergeability recomputed
+            for other in repo.pulls:
+                repo.mergeable_polls[other] = 0
+        
+        return jsonify({'sha': merge_sha, 'merged': True, 'message': 'Pull Request successfully merged'})
+    
+    @app.route('/repos/<owner>/<name>/pulls/<int:number>/update-branch', methods=['PUT'])
+    def update_pull_branch(owner, name, number):
+        repo = get_repo(owner, name)
+        if not repo or number not in repo.pulls:
+            return error(404, 'Not Found')
+        pull = repo.pulls[number]
+        payload = request.get_json(force=True, silent=True) or {}
+        with fake.lock:
+            if pull['state'] != 'open':
+                return error(422, 'Pull request is closed')
+            head_sha = pull['head']['sha']
+            if payload.get('expected_head_sha') and payload['expected_head_sha'] != head_sha:
+                return error(422, 'expected_head_sha does not match the pull request head')
+            base_sha = repo.refs[f"refs/heads/{pull['base']['ref']}"]
+            if is_ancestor(repo, base_sha, head_sha):
+                return error(422, 'There are no new commits on the base branch.')
+            
+            # Merge the base into the head branch, as the "Update branch" button does
+            merged_sha = repo.store_commit(
+                f"Merge branch '{pull['base']['ref']}' into {pull['head']['ref']}",
+                repo.commits[head_sha]['tree'],
+                [head_sha, base_sha]
+            )
+            repo.refs[f"refs/heads/{pull['head']['ref']}"] = merged_sha
+            pull['head']['sha'] = merged_sha
+            repo.mergeable_polls[number] = 0
+        
+        return jsonify({'message': 'Updating pull request branch.', 'url': f"{repo_url(repo)}/pulls/{number}"}), 202
+    
+    @app.route('/repos/<owner>/<name>/merges', methods=['POST'])
+    def merge_branches(owner, name):
+        repo = get_repo(owner, name)
+        if not repo:
+            return error(404, 'Not Found')
+        payload = request.get_json(force=True)
+        base_ref = f"refs/heads/{payload['base']}"
+        head_sha = repo.refs.get(f"refs/heads/{payload['head']}", payload['head'])
+        if base_ref not in repo.refs or head_sha not in repo.commits:
+            return error(404, 'Base or head does not exist')
+        with fake.lock:
+            base_sha = repo.refs[base_ref]
+            if head_sha == base_sha or head_sha in repo.commits[base_sha]['parents']:
+                return '', 204
+            merge_sha = repo.store_commit(
+                payload.get('commit_message') or f"Merge {payload['head']} into {payload['base']}",
+                repo.commits[base_sha]['tree'],
+                [base_sha, head_sha]
+            )
+            repo.refs[base_ref] = merge_sha
+        return jsonify({
+            'sha': merge_sha,
+            'url': f"{repo_url(repo)}/commits/{merge_sha}",
+            'commit': commit_json(repo, merge_sha)
+        }), 201
+    
+    @app.route('/repos/<owner>/<name>/commits/<ref>', methods=['GET'])
+    def get_commit(owner, name, ref):
+        repo = get_repo(owner, name)
+        sha = repo.refs.get(f'refs/heads/{ref}', ref) if repo else None
+        if not repo or sha not in repo.commits:
+            return error(404, 'No commit found')
+        return jsonify({
+            'sha': sha,
+            'url': f"{repo_url(repo)}/commits/{sha}",
+            'commit': commit_json(repo, sha),
+            'parents': [{'sha': p, 'url': f"{repo_url(repo)}/commits/{p}"} for p in repo.commits[sha]['parents']],
+            'files': []
+        })
+    
+    @app.route('/repos/<owner>/<name>/statuses/<sha>', methods=['POST'])
+    def create_status(owner, name, sha):
+        repo = get_repo(owner, name)
+        if not repo:
+            return error(404, 'Not Found')
+        payload = request.get_json(force=True)
+        if payload.get('state') not in ('error', 'failure', 'pending', 'success'):
+            return error(422, 'Validation Failed')
+        with fake.lock:
+            statuses = repo.statuses.setdefault(sha, [])
+            status = {
+                'id': len(statuses) + 1,
+                'url': f"{repo_url(repo)}/statuses/{sha}",
+                'state': payload['state'],
+                'context': payload.get('context', 'default'),
+                'description': payload.get('description'),
+                'target_url': payload.get('target_url'),
+                'created_at': timestamp(),
+                'updated_at': timestamp(),
+                'creator': user_json(fake.owner)
+            }
+            statuses.append(status)
+        return jsonify(status), 201
+    
+    @app.route('/repos/<owner>/<name>/commits/<ref>/status', methods=['GET'])
+    def get_combined_status(owner, name, ref):
+        repo = get_repo(owner, name)
+        if not repo:
+            return error(404, 'Not Found')
+        sha = repo.refs.get(f'refs/heads/{ref}', ref)
+        latest = {}
+        for status in repo.statuses.get(sha, []):
+            latest[status['context']] = status
+        states = [s['state'] for s in latest.values()]
+        if any(s in ('error', 'failure') for s in states):
+            state = 'failure'
+        elif not states or 'pending' in states:
+            state = 'pending'
+        else:
+            state = 'success'
+        return jsonify({'state': state, 'sha': sha, 'total_count': len(latest),
+                        'statuses': list(latest.values()), 'url': f"{repo_url(repo)}/commits/{sha}/status"})
+    
+    @app.route('/repos/<owner>/<name>/git/blobs', methods=['POST'])
+    def create_blob(owner, name):
+        repo = get_repo(owner, name)
+        if not repo:
+            return error(404, 'Not Found')
+        payload = request.get_json(force=True)
+        sha = object_sha('blob', payload['content'])
+        with fake.lock:
+            repo.blobs[sha] = {'content': payload['content'], 'encoding': payload.get('encoding', 'utf-8'),
+                               'size': len(payload['content'])}
+        return jsonify({'sha': sha, 'url': f"{repo_url(repo)}/git/blobs/{sha}"}), 201
+    
+    def tree_json(repo: FakeRepository, sha: str, recursive: bool) -> Dict:
+        entries = repo.trees[sha]
+        if recursive:
+            listing = [{'path': path, **entry, 'url': f"{repo_url(repo)}/git/blobs/{entry['sha']}"}
+                       for path, entry in sorted(entries.items())]
+        else:
+            listing, subtrees = [], {}
+            for path, entry in sorted(entries.items()):
+                head, _, rest = path.partition('/')
+                if rest:
+                    subtrees.setdefault(head, {})[rest] = entry
+                else:
+                    listing.append({'path': path, **entry, 'url': f"{repo_url(repo)}/git/blobs/{entry['sha']}"})
+            for directory, sub_entries in sorted(subtrees.items()):
+                sub_sha = repo.store_tree(sub_entries)
+                listing.append({'path': directory, 'mode': '040000', 'type': 'tree', 'sha': sub_sha,
+                                'url': f"{repo_url(repo)}/git/trees/{sub_sha}"})
+        return {'sha': sha, 'url': f"{repo_url(repo)}/git/trees/{sha}", 'tree': listing, 'truncated': False}
+    
+    @app.route('/repos/<owner>/<name>/git/trees', methods=['POST'])
+    def create_tree(owner, name):
+        repo = get_repo(owner, name)
+        if not repo:
+            return error(404, 'Not Found')
+        payload = request.get_json(force=True)
+        with fake.lock:
+            entries = dict(repo.trees.get(payload.get('base_tree'), {}))
+            for element in payload['tree']:
+                if element.get('sha') is None and 'content' not in element:
+                    entries.pop(element['path'], None)
+                    continue
+                sha = element.get('sha')
+                if 'content' in element:
+                    sha = object_sha('blob', element['content'])
+                    repo.blobs[sha] = {'content': element['content'], 'encoding': 'utf-8', 'size': len(element['content'])}
+                entries[element['path']] = {'mode': element['mode'], 'type': element['type'], 'sha': sha,
+                                            'size': repo.blobs.get(sha, {}).get('size', 0)}
+            tree_sha = repo.store_tree(entries)
+        return jsonify(tree_json(repo, tree_sha, recursive=True)), 201
+    
+    @app.route('/repos/<owner>/<name>/git/trees/<sha>', methods=['GET'])
+    def get_tree(owner, name, sha):
+        repo = get_repo(owner, name)
+        if not repo:
+            return error(404, 'Not Found')
+        sha = repo.commits[sha]['tree'] if sha in repo.commits else sha
+        if sha not in repo.trees:
+            return error(404, 'Not Found')
+        return jsonify(tree_json(repo, sha, recursive=bool(request.args.get('recursive'))))
+    
+    @app.route('/repos/<owner>/<name>/git/commits', methods=['POST'])
+    def create_git_commit(owner, name):
+        repo = get_repo(owner, name)
+        if not repo:
+            return error(404, 'Not Found')
+        payload = request.get_json(force=True)
+        if payload['tree'] not in repo.trees:
+            return error(422, 'Tree SHA does not exist')
+        with fake.lock:
+            sha = repo.store_commit(payload['message'], payload['tree'], payload.get('parents', []))
+        return jsonify(commit_json(repo, sha)), 201
+    
+    @app.route('/repos/<owner>/<name>/git/commits/<sha>', methods=['GET'])
+    def get_git_commit(owner, name, sha):
+        repo = get_repo(owner, name)
+        if not repo or sha not in repo.commits:
+            return error(404, 'Not Found')
+        return jsonify(commit_json(repo, sha))
+    
+    @app.route('/repos/<owner>/<name>/git/ref/<path:ref>', methods=['GET'])
+    @app.route('/repos/<owner>/<name>/git/refs/<path:ref>', methods=['GET', 'PATCH', 'DELETE'])
+    def git_ref(owner, name, ref):
+        repo = get_repo(owner, name)
+        full_ref = f"refs/{ref}"
+        if not repo or full_ref not in repo.refs:
+            return error(404, 'Not Found')
+        
+        if request.method == 'DELETE':
+            with fake.lock:
+                del repo.refs[full_ref]
+            return '', 204
+        
+        if request.method == 'PATCH':
+            payload = request.get_json(force=True)
+            with fake.lock:
+                current = repo.refs[full_ref]
+                if payload['sha'] not in repo.commits:
+                    return error(422, 'Object does not exist')
+                if not payload.get('force') and current not in repo.commits[payload['sha']]['parents'] and current != payload['sha']:
+                    return error(422, 'Update is not a fast forward')
+                branch = ref.partition('heads/')[2]
+                if required_contexts(repo, branch):
+                    return error(422, 'Protected branch update failed: required status checks are expected.')
+                repo.refs[full_ref] = payload['sha']
+        
+        return jsonify(ref_json(repo, full_ref))
+    
+    @app.route('/repos/<owner>/<name>/git/refs', methods=['POST'])
+    def create_git_ref(owner, name):
+        repo = get_repo(owner, name)
+        if not repo:
+            return error(404, 'Not Found')
+        payload = request.get_json(force=True)
+        if payload['ref'] in repo.refs:
+            return error(422, 'Reference already exists')
+        if payload['sha'] not in repo.commits:
+            return error(422, 'Object does not exist')
+        with fake.lock:
+            repo.refs[payload['ref']] = payload['sha']
+        return jsonify(ref_json(repo, payload['ref'])), 201
+    
+    @app.route('/repos/<owner>/<name>/contents/<path:path>', methods=['PUT'])
+    def put_contents(owner, name, path):
+        repo = get_repo(owner, name)
+        if not repo:
+            return error(404, 'Not Found')
+        payload = request.get_json(force=True)
+        branch = payload.get('branch', 'main')
+        with fake.lock:
+            head = repo.refs[f'refs/heads/{branch}']
+            blob_sha = object_sha('blob', payload['content'])
+            repo.blobs[blob_sha] = {'content': payload['content'], 'encoding': 'base64', 'size': len(payload['content'])}
+            entries = dict(repo.trees[repo.commits[head]['tree']])
+            entries[path] = {'mode': '100644', 'type': 'blob', 'sha': blob_sha, 'size': len(payload['content'])}
+            commit_sha = repo.store_commit(payload['message'], repo.store_tree(entries), [head])
+            repo.refs[f'refs/heads/{branch}'] = commit_sha
+        return jsonify({
+            'content': {'name': path.rsplit('/', 1)[-1], 'path': path, 'sha': blob_sha,
+                        'url': f"{repo_url(repo)}/contents/{path}"},
+            'commit': commit_json(repo, commit_sha)
+        }), 201
+    
+    @app.route('/graphql', methods=['POST'])
+    def graphql():
+        """Minimal GraphQL: rateLimit and repository.pullRequest lookups (selection sets ignored)"""
+        query = (request.get_json(force=True) or {}).get('query', '')
+        data = {}
+        
+        if 'rateLimit' in query:
+            headers = request.rate_headers
+            data['rateLimit'] = {'limit': int(headers['X-RateLimit-Limit']), 'remaining': int(headers['X-RateLimit-Remaining']),
+                                 'used': int(headers['X-RateLimit-Used']), 'cost': 1,
+                                 'resetAt': datetime.utcfromtimestamp(int(headers['X-RateLimit-Reset'])).isoformat() + 'Z'}
+        
+        repo_match = re.search(r'repository\s*\(\s*owner\s*:\s*"([^"]+)"\s*,\s*name\s*:\s*"([^"]+)"', query)
+        if repo_match:
+            repo = get_repo(*repo_match.groups())
+            if not repo:
+                return jsonify({'data': None, 'errors': [{'type': 'NOT_FOUND', 'message': 'Could not resolve to a Repository'}]})
+            repository = {'nameWithOwner': repo.full_name}
+            pull_match = re.search(r'pullRequest\s*\(\s*number\s*:\s*(\d+)', query)
+            if pull_match and int(pull_match.group(1)) in repo.pulls:
+                number = int(pull_match.group(1))
+                pull = pull_json(repo, number)
+                repository['pullRequest'] = {
+                    'number': number,
+                    'title': pull['title'],
+                    'body': pull['body'],
+                    'state': pull['state'].upper() if not pull['merged'] else 'MERGED',
+                    'mergeable': {None: 'UNKNOWN', True: 'MERGEABLE', False: 'CONFLICTING'}[pull['mergeable']],
+                    'headRefOid': pull['head']['sha'],
+                    'author': {'login': pull['user']['login']},
+                    'files': {
+                        'totalCount': len(repo.pull_files.get(number, [])),
+                        'nodes': [{'path': f['filename'], 'additions': f['additions'], 'deletions': f['deletions']}
+                                  for f in repo.pull_files.get(number, [])[:100]]
+                    }
+                }
+            data['repository'] = repository
+        
+        return jsonify({'data': data})
+    
+    return app
+
+def start_in_thread(fake: FakeGitHub, port: int = 0) -> str:
+    """Serve the fake API from a background thread and return its base URL"""
+    from werkzeug.serving import make_server
+    
+    server = make_server('127.0.0.1', port, create_app(fake), threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}"
+
+if __name__ == '__main__':
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Fake GitHub API for CCO scale testing')
+    parser.add_argument('--port', type=int, default=FAKE_GITHUB_PORT, help='Port to listen on')
+    parser.add_argument('--owner', type=str, default='wirereport', help='Authenticated user / repository owner')
+    parser.add_argument('--repo', type=str, default='wirereport-ai-organization', help='Seeded repository name')
+    parser.add_argument('--pulls', type=int, default=1000, help='Number of seeded pull requests')
+    parser.add_argument('--files-per-pull', type=int, default=20, help='Maximum files per seeded pull request')
+    parser.add_argument('--latency-ms', type=float, default=0, help='Fixed latency added to every request')
+    parser.add_argument('--jitter-ms', type=float, default=0, help='Random extra latency up to this value')
+    parser.add_argument('--rate-limit', type=int, default=5000, help='Requests per token per window')
+    parser.add_argument('--rate-window', type=int, default=3600, help='Rate limit window in seconds')
+    
+    args = parser.parse_args()
+    
+    fake = FakeGitHub(args.owner, args.latency_ms, args.jitter_ms, args.rate_limit, args.rate_window)
+    seeded = fake.seed(args.repo, args.pulls, args.files_per_pull)
+    
+    print("🧪 Starting Fake GitHub Server")
+    print(f"   Repository: {seeded.full_name} ({len(seeded.pulls)} PRs)")
+    print(f"   API URL: http://localhost:{args.port}")
+    print(f"   Latency: {args.latency_ms}ms (+{args.jitter_ms}ms jitter), rate limit {args.rate_limit}/{args.rate_window}s")
+    
+    create_app(fake).run(host='127.0.0.1', port=args.port, debug=False, threaded=True)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Shared OpenAI Client
+One pooled HTTP session for chat completions, shared by concurrent reviews
+Blocking calls run on the client's own thread pool so they never stall the event loop
+A process-wide rate limiter paces requests across every client
+"""
+
+import os
+import time
+import asyncio
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional
+
+OPENAI_CHAT_URL = 'https://api.openai.com/v1/chat/completions'
+
+# Conservative default pacing for concurrent reviews; OPENAI_REQUESTS_PER_MINUTE=0 disables it
+DEFAULT_REQUESTS_PER_MINUTE = 60
+
+class RateLimiter:
+    """Token bucket shared across threads and event loops"""
+    
+    def __init__(self, requests_per_minute: float, burst: Optional[int] = None):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = burst or max(1, int(requests_per_minute // 6))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """Take a token now and return how long to wait before using it"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+    
+    async def acquire(self):
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+    
+    def acquire_sync(self):
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+_shared_limiter = None
+_shared_limiter_lock = threading.Lock()
+
+def shared_rate_limiter() -> Optional[RateLimiter]:
+    """Process-wide limiter from OPENAI_REQUESTS_PER_MINUTE (default 60; 0 disables it)"""
+    global _shared_limiter
+    requests_per_minute = float(os.getenv('OPENAI_REQUESTS_PER_MINUTE', str(DEFAULT_REQUESTS_PER_MINUTE)))
+    if requests_per_minute <= 0:
+        return None
+    with _shared_limiter_lock:
+        if _shared_limiter is None:
+            _shared_limiter = RateLimiter(requests_per_minute)
+        return _shared_limiter
+
+class OpenAIClient:
+    def __init__(self, api_key: Optional[str] = None, pool_size: int = 8,
+                 rate_limiter: Optional[RateLimiter] = None):
+        self.api_key = api_key or os.getenv('OPENAI_API_KEY')
+        self.pool_size = pool_size
+        self.rate_limiter = rate_limiter or shared_rate_limiter()
+        
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'Authorization': f'Bearer {self.api_key}',
+            'Content-Type': 'application/json'
+        })
+        
+        self.executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix='openai')
+    
+    def post(self, data: Dict, timeout: float) -> requests.Response:
+        return self.session.post(OPENAI_CHAT_URL, json=data, timeout=timeout)
+    
+    def chat(self, data: Dict, timeout: float = 120) -> requests.Response:
+        """POST a chat completion request over the pooled session"""
+        if self.rate_limiter:
+            self.rate_limiter.acquire_sync()
+        return self.post(data, timeout)
+    
+    async def achat(self, data: Dict, timeout: float = 120) -> requests.Response:
+        """Chat completion without blocking the event loop"""
+        if self.rate_limiter:
+            await self.rate_limiter.acquire()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, lambda: self.post(data, timeout))
+    
+    def close(self):
+        self.executor.shutdown(wait=False)
+        self.session.close()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Phase Scheduler
+Runs review phases as a dependency graph: independent phases run concurrently,
+each phase is timed and retried, and completed phases can be carried over so
+only failed ones re-run
+"""
+
+import time
+import asyncio
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional
+
+class Phase:
+    def __init__(self, name: str, run: Callable[[Dict], Awaitable], depends_on: Optional[List[str]] = None,
+                 title: Optional[str] = None):
+        self.name = name
+        self.run = run
+        self.depends_on = depends_on or []
+        self.title = title or name
+
+class PhaseScheduler:
+    def __init__(self, phases: List[Phase], max_attempts: int = 2, retry_delay: float = 2.0):
+        self.phases = {phase.name: phase for phase in phases}
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        
+        for phase in phases:
+            for dependency in phase.depends_on:
+                if dependency not in self.phases:
+                    raise ValueError(f"Phase '{phase.name}' depends on unknown phase '{dependency}'")
+        self.check_acyclic()
+    
+    def check_acyclic(self):
+        visiting, visited = set(), set()
+        
+        def visit(name: str):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Phase dependency cycle through '{name}'")
+            visiting.add(name)
+            for dependency in self.phases[name].depends_on:
+                visit(dependency)
+            visiting.discard(name)
+            visited.add(name)
+        
+        for name in self.phases:
+            visit(name)
+    
+    async def run(self, completed: Optional[Dict] = None) -> Dict:
+        """Run every phase not already completed
+        
+        Returns {'results': {phase: result}, 'phases': {phase: status and timing}}.
+        completed maps phase names to results carried over from an earlier run.
+        """
+        completed = completed or {}
+        results = dict(completed)
+        timings = {
+            name: {'status': 'reused', 'attempts': 0, 'duration_seconds': 0.0}
+            for name in completed if name in self.phases
+        }
+        tasks = {}
+        
+        async def run_phase(phase: Phase):
+            for dependency in phase.depends_on:
+                await tasks[dependency]
+                if timings[dependency]['status'] not in ('completed', 'reused'):
+                    timings[phase.name] = {'status': 'skipped', 'attempts': 0, 'duration_seconds': 0.0,
+                                           'error': f"dependency '{dependency}' did not complete"}
+                    return
+            
+            print(f"\n{phase.title}")
+            print("-" * 40)
+            started_at = datetime.now().isoformat()
+            started = time.monotonic()
+            error = None
+            
+            for attempt in range(1, self.max_attempts + 1):
+                try:
+                    results[phase.name] = await phase.run(results)
+                    error = None
+                    break
+                except Exception as e:
+                    error = f"{type(e).__name__}: {e}"
+                    print(f"   ⚠️ {phase.name} attempt {attempt}/{self.max_attempts} failed: {error}")
+                    if attempt < self.max_attempts:
+                        await asyncio.sleep(self.retry_delay * attempt)
+            
+            timings[phase.name] = {
+                'status': 'failed' if error else 'completed',
+                'attempts': attempt,
+                'started_at': started_at,
+                'duration_seconds': round(time.monotonic() - started, 3)
+            }
+            if error:
+                timings[phase.name]['error'] = error
+        
+        for name, phase in self.phases.items():
+            if name not in completed:
+                tasks[name] = asyncio.ensure_future(run_phase(phase))
+            else:
+                tasks[name] = asyncio.ensure_future(asyncio.sleep(0))
+        
+        await asyncio.gather(*tasks.values())
+        return {'results': results, 'phases': timings}
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Comprehensive Review Artifacts
+Full reviews are stored as compact gzipped JSON; a small summary of each is
+appended to a JSONL index so readiness and consensus flags can be read without
+loading the full payload
+"""
+
+import os
+import gzip
+import glob
+import json
+from typing import Dict, Iterator, Optional
+
+from segmented_log import get_log_writer, iter_log_records, tail_log_records
+
+ORGANIZATION_ROOT = '/root/wirereport_organization'
+REVIEW_DIRECTORY = f'{ORGANIZATION_ROOT}/logs'
+REVIEW_INDEX_FILE = f'{REVIEW_DIRECTORY}/comprehensive_review_index.jsonl'
+
+# Matches both compressed artifacts and older pretty-printed snapshots
+REVIEW_ARTIFACT_PATTERN = f'{REVIEW_DIRECTORY}/comprehensive_review_[0-9]*.json*'
+
+def review_summary(review: Dict, artifact: str) -> Dict:
+    """Readiness, phase outcomes and per-document hashes and consensus of a review"""
+    documents = review.get('document_analysis', {})
+    structural = review.get('structural_review', {})
+    mechanisms = review.get('consensus_evaluation', {})
+    gaps = review.get('gap_analysis', {})
+    final = review.get('final_consensus', {})
+    
+    return {
+        'review_id': review.get('review_id'),
+        'timestamp': review.get('timestamp'),
+        'artifact': artifact,
+        'duration_minutes': review.get('duration_minutes'),
+        'consensus_achieved': review.get('consensus_achieved', False),
+        'ready_for_operations': review.get('ready_for_operations', False),
+        'failed_phases': review.get('failed_phases', []),
+        'retry_of': review.get('retry_of'),
+        'readiness_score': final.get('overall_readiness_score'),
+        'status': final.get('status'),
+        'recommendation': final.get('recommendation'),
+        'confidence': final.get('confidence'),
+        'critical_blockers': final.get('critical_blockers', []),
+        'documents_reviewed': documents.get('documents_reviewed'),
+        'documents_missing': documents.get('documents_missing'),
+        'documents_reused': documents.get('documents_reused', 0),
+        'document_consensus': documents.get('consensus_achieved'),
+        'coherence_score': structural.get('coherence_score'),
+        'structural_consensus': structural.get('consensus', {}).get('consensus_achieved'),
+        'consensus_effectiveness': mechanisms.get('consensus_effectiveness'),
+        'meta_consensus': mechanisms.get('meta_consensus', {}).get('consensus_achieved'),
+        'improvements_identified': gaps.get('total_improvements_identified'),
+        'improvement_consensus': gaps.get('improvement_consensus', {}).get('consensus_achieved'),
+        'documents': {
+            doc_path: {
+                'content_sha256': doc.get('content_sha256'),
+                'consensus_achieved': doc.get('consensus', {}).get('consensus_achieved', False),
+                'score': doc.get('consensus', {}).get('average_score')
+            }
+            for doc_path, doc in documents.get('document_details', {}).items() if 'error' not in doc
+        }
+    }
+
+def save_review_artifact(review: Dict, review_file: str, index_file: str = REVIEW_INDEX_FILE) -> Dict:
+    """Write the review as gzipped compact JSON and index its summary; returns the summary"""
+    os.makedirs(os.path.dirname(review_file), exist_ok=True)
+    tmp_file = f"{review_file}.tmp"
+    with gzip.open(tmp_file, 'wt', encoding='utf-8', compresslevel=6) as f:
+        json.dump(review, f, separators=(',', ':'))
+    os.replace(tmp_file, review_file)
+    
+    summary = review_summary(review, review_file)
+    writer = get_log_writer(index_file)
+    writer.append(summary)
+    writer.flush()
+    return summary
+
+def load_review_artifact(path: str) -> Dict:
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        return json.load(f)
+
+def iter_review_summaries(index_file: str = REVIEW_INDEX_FILE) -> Iterator[Dict]:
+    return iter_log_records(index_file)
+
+def latest_review_summary(index_file: str = REVIEW_INDEX_FILE) -> Optional[Dict]:
+    """Summary of the most recent review, from the index or else the newest legacy snapshot"""
+    latest = tail_log_records(index_file, 1)
+    if latest:
+        return latest[0]
+    
+    legacy_files = sorted(path for path in glob.glob(REVIEW_ARTIFACT_PATTERN) if not path.endswith('.tmp'))
+    if not legacy_files:
+        return None
+    return review_summary(load_review_artifact(legacy_files[-1]), legacy_files[-1])
+
+def load_latest_review(index_file: str = REVIEW_INDEX_FILE) -> Optional[Dict]:
+    summary = latest_review_summary(index_file)
+    return load_review_artifact(summary['artifact']) if summary else None
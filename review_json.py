@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Reviewer JSON Extraction
+Single-pass extraction and schema validation of the JSON decision object in a
+model response (bare, fenced or surrounded by prose), plus the matching
+structured-output response_format for the chat completions API
+"""
+
+import os
+import json
+import itertools
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Field specs: JSON type, whether required, optional numeric bounds
+DECISION_SCHEMA = {
+    'approved': {'type': 'boolean', 'required': True},
+    'confidence': {'type': 'number', 'minimum': 0, 'maximum': 100},
+    'reasoning': {'type': 'string'},
+    'recommendations': {'type': 'array', 'items': 'string'}
+}
+
+EXECUTIVE_DECISION_SCHEMA = {
+    **DECISION_SCHEMA,
+    'strategic_impact': {'type': 'string', 'enum': ['high', 'medium', 'low']},
+    'risk_level': {'type': 'string', 'enum': ['high', 'medium', 'low']},
+    'resource_requirements': {'type': 'string'},
+    'implementation_timeline': {'type': 'string'}
+}
+
+PYTHON_TYPES = {'boolean': bool, 'number': (int, float), 'string': str, 'array': list, 'object': dict}
+
+class ReviewParseError(ValueError):
+    pass
+
+def structured_output_enabled() -> bool:
+    return os.getenv('CCO_STRUCTURED_OUTPUT', '1') != '0'
+
+def response_format(name: str, schema: Dict) -> Dict:
+    """Strict json_schema response_format; optional fields become nullable"""
+    properties = {}
+    for field, spec in schema.items():
+        prop = {'type': spec['type'] if spec.get('required') else [spec['type'], 'null']}
+        if spec['type'] == 'array':
+            prop['items'] = {'type': spec.get('items', 'string')}
+        if 'enum' in spec:
+            prop['enum'] = spec['enum'] + ([] if spec.get('required') else [None])
+        properties[field] = prop
+    
+    return {
+        'type': 'json_schema',
+        'json_schema': {
+            'name': name,
+            'strict': True,
+            'schema': {
+                'type': 'object',
+                'properties': properties,
+                'required': list(schema),
+                'additionalProperties': False
+            }
+        }
+    }
+
+def iter_json_objects(text: str) -> Iterator[Tuple[int, int]]:
+    """Yield (start, end) of each balanced top-level {...} span in one scan
+    
+    String literals are tracked so braces inside them are ignored.
+    """
+    depth = 0
+    start = -1
+    in_string = False
+    escaped = False
+    
+    for index, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            if depth:
+                in_string = True
+        elif char == '{':
+            if depth == 0:
+                start = index
+            depth += 1
+        elif char == '}' and depth:
+            depth -= 1
+            if depth == 0:
+                yield start, index + 1
+
+def validate(obj: Dict, schema: Dict) -> Tuple[Optional[Dict], List[str]]:
+    """Check obj against a field schema, coercing harmless variants (e.g. "85" confidence)
+    
+    Only required fields can invalidate the object; bad optional fields are dropped.
+    """
+    errors = []
+    result = dict(obj)
+    
+    for field, spec in schema.items():
+        value = obj.get(field)
+        if value is None:
+            if spec.get('required'):
+                errors.append(f"missing required field '{field}'")
+            result.pop(field, None)
+            continue
+        
+        expected = spec['type']
+        if expected == 'number' and isinstance(value, str):
+            try:
+                value = float(value.strip().rstrip('%'))
+            except ValueError:
+                pass
+        if expected == 'boolean' and isinstance(value, str) and value.strip().lower() in ('true', 'false'):
+            value = value.strip().lower() == 'true'
+        
+        if not isinstance(value, PYTHON_TYPES[expected]) or (expected == 'number' and isinstance(value, bool)):
+            if spec.get('required'):
+                errors.append(f"field '{field}' should be {expected}, got {type(value).__name__}")
+            result.pop(field, None)
+            continue
+        
+        if expected == 'number':
+            value = min(max(value, spec.get('minimum', value)), spec.get('maximum', value))
+        if 'enum' in spec and value not in spec['enum']:
+            value = str(value).lower()
+            if value not in spec['enum']:
+                if spec.get('required'):
+                    errors.append(f"field '{field}' should be one of {spec['enum']}")
+                result.pop(field, None)
+                continue
+        
+        result[field] = value
+    
+    return (None if errors else result), errors
+
+def extract_json(text: str, schema: Optional[Dict] = None) -> Dict:
+    """Return the first JSON object in text that satisfies schema
+    
+    Bare JSON is parsed directly; otherwise balanced spans (inside code fences
+    or prose) are tried in order from a single scan of the text.
+    """
+    if not text:
+        raise ReviewParseError('empty response')
+    
+    stripped = text.strip()
+    candidates = iter_json_objects(text)
+    errors = []
+    
+    if stripped.startswith('{') and stripped.endswith('}'):
+        # Fast path for a bare object; the scan only runs if it fails
+        candidates = itertools.chain([(text.index('{'), text.rindex('}') + 1)], candidates)
+    
+    for start, end in candidates:
+        try:
+            obj = json.loads(text[start:end])
+        except json.JSONDecodeError as e:
+            errors.append(f'invalid JSON at {start}: {e.msg}')
+            continue
+        if not isinstance(obj, dict):
+            continue
+        if schema is None:
+            return obj
+        valid, problems = validate(obj, schema)
+        if valid is not None:
+            return valid
+        errors.extend(problems)
+    
+    raise ReviewParseError('; '.join(errors) or 'no JSON object found in response')
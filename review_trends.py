@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Review Trend Store
+Columnar time series of readiness, phase scores and per-document scores built
+from the comprehensive review artifacts, with a CLI for trends and regressions
+"""
+
+import os
+import json
+import glob
+import bisect
+from typing import Dict, List, Optional
+
+from review_artifacts import REVIEW_ARTIFACT_PATTERN, load_review_artifact
+
+ORGANIZATION_ROOT = '/root/wirereport_organization'
+TREND_STORE_FILE = f'{ORGANIZATION_ROOT}/logs/review_trends.json'
+
+TREND_VERSION = 1
+
+# Review-level columns: name -> how to read it from a review snapshot
+REVIEW_COLUMNS = {
+    'readiness': lambda review: review.get('final_consensus', {}).get('overall_readiness_score'),
+    'structural_score': lambda review: review.get('structural_review', {}).get('coherence_score'),
+    'consensus_effectiveness': lambda review: review.get('consensus_evaluation', {}).get('consensus_effectiveness'),
+    'document_consensus': lambda review: review.get('document_analysis', {}).get('consensus_achieved'),
+    'improvement_consensus': lambda review: review.get('gap_analysis', {}).get('improvement_consensus', {}).get('consensus_achieved'),
+    'consensus_achieved': lambda review: review.get('consensus_achieved'),
+    'ready_for_operations': lambda review: review.get('ready_for_operations'),
+    'duration_minutes': lambda review: review.get('duration_minutes')
+}
+
+# Per-document columns read from document_analysis.document_details[path]
+DOCUMENT_COLUMNS = {
+    'score': lambda doc: doc.get('consensus', {}).get('average_score'),
+    'openai_score': lambda doc: doc.get('openai_analysis', {}).get('overall_score'),
+    'claude_score': lambda doc: doc.get('claude_analysis', {}).get('overall_score'),
+    'consensus': lambda doc: doc.get('consensus', {}).get('consensus_achieved')
+}
+
+class ReviewTrendStore:
+    def __init__(self, store_file: Optional[str] = None):
+        self.store_file = store_file or os.getenv('CCO_REVIEW_TRENDS', TREND_STORE_FILE)
+        self.columns = {'review_id': [], 'timestamp': [], 'source': [], **{name: [] for name in REVIEW_COLUMNS}}
+        self.documents = {}
+        self.dirty = False
+        
+        if os.path.exists(self.store_file):
+            try:
+                with open(self.store_file, 'r') as f:
+                    stored = json.load(f)
+                if stored.get('version') == TREND_VERSION:
+                    self.columns.update(stored['columns'])
+                    self.documents = stored['documents']
+            except (OSError, json.JSONDecodeError, KeyError, AttributeError) as e:
+                # Start empty - the next ingest rebuilds the store from the review artifacts
+                print(f"⚠️ Rebuilding unreadable trend store {self.store_file}: {e}")
+                self.columns = {name: [] for name in self.columns}
+                self.documents = {}
+    
+    def __len__(self) -> int:
+        return len(self.columns['review_id'])
+    
+    def ingest_review(self, review: Dict, source: str) -> bool:
+        """Add one review snapshot as a row, kept in timestamp order; False if already ingested"""
+        if review.get('review_id') in self.columns['review_id'] or source in self.columns['source']:
+            return False
+        
+        row = bisect.bisect_right(self.columns['timestamp'], review.get('timestamp', ''))
+        values = {
+            'review_id': review.get('review_id'),
+            'timestamp': review.get('timestamp', ''),
+            'source': source,
+            **{name: read(review) for name, read in REVIEW_COLUMNS.items()}
+        }
+        for name, column in self.columns.items():
+            column.insert(row, values.get(name))
+        
+        details = review.get('document_analysis', {}).get('document_details', {})
+        for doc_path in details:
+            if doc_path not in self.documents:
+                self.documents[doc_path] = {name: [None] * (len(self) - 1) for name in DOCUMENT_COLUMNS}
+        for doc_path, doc_columns in self.documents.items():
+            doc = details.get(doc_path)
+            for name, read in DOCUMENT_COLUMNS.items():
+                doc_columns[name].insert(row, read(doc) if doc and 'error' not in doc else None)
+        
+        self.dirty = True
+        return True
+    
+    def ingest(self, pattern: str = REVIEW_ARTIFACT_PATTERN) -> int:
+        """Ingest snapshots not seen before, reading one file at a time"""
+        seen = set(self.columns['source'])
+        added = 0
+        for path in sorted(glob.glob(pattern)):
+            source = os.path.basename(path)
+            if source in seen or path.endswith('.tmp'):
+                continue
+            try:
+                review = load_review_artifact(path)
+            except (OSError, EOFError, json.JSONDecodeError) as e:
+                print(f"⚠️ Skipping unreadable snapshot {source}: {e}")
+                continue
+            added += self.ingest_review(review, source)
+        return added
+    
+    def save(self):
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.store_file) or '.', exist_ok=True)
+        tmp_file = f"{self.store_file}.tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump({'version': TREND_VERSION, 'columns': self.columns, 'documents': self.documents},
+                      f, separators=(',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.store_file)
+        self.dirty = False
+    
+    def rows(self, last: Optional[int] = None) -> range:
+        start = max(len(self) - last, 0) if last else 0
+        return range(start, len(self))
+    
+    def regressions(self, threshold: float = 5.0, last: Optional[int] = None) -> List[Dict]:
+        """Score drops of at least threshold, and consensus flags lost, between consecutive reviews"""
+        series = {name: self.columns[name] for name in REVIEW_COLUMNS if name != 'duration_minutes'}
+        for doc_path, doc_columns in self.documents.items():
+            series[f"{doc_path}:score"] = doc_columns['score']
+            series[f"{doc_path}:consensus"] = doc_columns['consensus']
+        
+        found = []
+        for row in self.rows(last):
+            if row == 0:
+                continue
+            for name, column in series.items():
+                before, after = column[row - 1], column[row]
+                if before is None or after is None:
+                    continue
+                if isinstance(before, bool):
+                    regressed = before and not after
+                else:
+                    regressed = before - after >= threshold
+                if regressed:
+                    found.append({
+                        'review_id': self.columns['review_id'][row],
+                        'timestamp': self.columns['timestamp'][row],
+                        'series': name,
+                        'before': before,
+                        'after': after
+                    })
+        return found
+
+def format_value(value) -> str:
+    if value is None:
+        return '-'
+    if isinstance(value, bool):
+        return 'yes' if value else 'no'
+    if isinstance(value, (int, float)):
+        return f"{value:.1f}"
+    return str(value)
+
+def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Comprehensive review trends')
+    parser.add_argument('--store', help='Trend store file (default logs/review_trends.json)')
+    parser.add_argument('--no-ingest', action='store_true', help='Query without ingesting new snapshots first')
+    subcommands = parser.add_subparsers(dest='command')
+    
+    subcommands.add_parser('ingest', help='Ingest new review snapshots')
+    show = subcommands.add_parser('show', help='Readiness and phase scores per review')
+    show.add_argument('--last', type=int, default=20)
+    document = subcommands.add_parser('document', help='Score history of one document')
+    document.add_argument('path')
+    document.add_argument('--last', type=int, default=20)
+    regressions = subcommands.add_parser('regressions', help='Score drops and lost consensus between reviews')
+    regressions.add_argument('--threshold', type=float, default=5.0)
+    regressions.add_argument('--last', type=int)
+    
+    args = parser.parse_args()
+    store = ReviewTrendStore(args.store)
+    
+    if not args.no_ingest or args.command == 'ingest':
+        added = store.ingest()
+        store.save()
+        if added or args.command == 'ingest':
+            print(f"📥 Ingested {added} new review snapshots ({len(store)} total)")
+    
+    if args.command in (None, 'show'):
+        print(f"{'Timestamp':<20} {'Readiness':>9} {'Structure':>9} {'Mechanism':>9} {'Docs':>5} {'Ready':>5}")
+        for row in store.rows(getattr(args, 'last', 20)):
+            print(f"{store.columns['timestamp'][row][:19]:<20} "
+                  f"{format_value(store.columns['readiness'][row]):>9} "
+                  f"{format_value(store.columns['structural_score'][row]):>9} "
+                  f"{format_value(store.columns['consensus_effectiveness'][row]):>9} "
+                  f"{format_value(store.columns['document_consensus'][row]):>5} "
+                  f"{format_value(store.columns['ready_for_operations'][row]):>5}")
+    
+    elif args.command == 'document':
+        doc_columns = store.documents.get(args.path)
+        if doc_columns is None:
+            print(f"❌ No trend data for {args.path}")
+            return False
+        print(f"📄 {args.path}")
+        print(f"{'Timestamp':<20} {'Score':>6} {'OpenAI':>6} {'Claude':>6} {'Consensus':>9}")
+        for row in store.rows(args.last):
+            print(f"{store.columns['timestamp'][row][:19]:<20} "
+                  f"{format_value(doc_columns['score'][row]):>6} "
+                  f"{format_value(doc_columns['openai_score'][row]):>6} "
+                  f"{format_value(doc_columns['claude_score'][row]):>6} "
+                  f"{format_value(doc_columns['consensus'][row]):>9}")
+    
+    elif args.command == 'regressions':
+        found = store.regressions(args.threshold, args.last)
+        for regression in found:
+            print(f"📉 {regression['timestamp'][:19]} {regression['series']}: "
+                  f"{format_value(regression['before'])} -> {format_value(regression['after'])}")
+        print(f"{len(found)} regressions across {len(store)} reviews")
+        return not found
+    
+    return True
+
+if __name__ == "__main__":
+    exit(0 if main() else 1)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Organizational Document Watcher
+Polls the governance, consensus and implementation documents (and the root
+Markdown files), debounces bursts of edits and re-analyzes only the documents
+that changed, so an edited document gets a fresh consensus score without a
+full review
+"""
+
+import os
+import time
+import asyncio
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from segmented_log import get_log_writer
+
+DOCUMENT_WATCH_LOG = '/root/wirereport_organization/logs/document_watch.jsonl'
+
+class DocumentWatcher:
+    def __init__(self, reviewer, interval: Optional[float] = None, debounce: Optional[float] = None,
+                 log_file: Optional[str] = None):
+        self.reviewer = reviewer
+        self.corpus = reviewer.corpus
+        self.interval = interval or float(os.getenv('CCO_WATCH_INTERVAL', '1.0'))
+        self.debounce = debounce if debounce is not None else float(os.getenv('CCO_WATCH_DEBOUNCE', '2.0'))
+        self.writer = get_log_writer(log_file or os.getenv('CCO_WATCH_LOG', DOCUMENT_WATCH_LOG))
+        self.stats = {}
+        self.pending = {}
+        self.queue = asyncio.Queue()
+        self.batches_reviewed = 0
+    
+    def watched_paths(self) -> List[str]:
+        """Corpus Markdown plus any critical documents outside it (e.g. governance code)"""
+        return sorted(set(self.corpus.list_documents(refresh=True)) | set(self.reviewer.critical_documents))
+    
+    def snapshot(self) -> Dict[str, Tuple[int, int]]:
+        stats = {}
+        for doc_path in self.watched_paths():
+            try:
+                stat = os.stat(self.corpus.full_path(doc_path))
+            except FileNotFoundError:
+                continue
+            stats[doc_path] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+    
+    def poll(self) -> List[str]:
+        """Record documents changed since the last poll; return those whose edits have settled"""
+        now = time.monotonic()
+        current = self.snapshot()
+        
+        for doc_path in self.stats.keys() - current.keys():
+            print(f"   🗑️ Removed: {doc_path}")
+            self.pending.pop(doc_path, None)
+        for doc_path, stat in current.items():
+            if self.stats.get(doc_path) != stat:
+                # Every further edit pushes the document's deadline back
+                self.pending[doc_path] = now
+        self.stats = current
+        
+        settled = sorted(doc_path for doc_path, changed_at in self.pending.items() if now - changed_at >= self.debounce)
+        for doc_path in settled:
+            del self.pending[doc_path]
+        return settled
+    
+    async def review_batches(self):
+        while True:
+            doc_paths = await self.queue.get()
+            try:
+                await self.review_batch(doc_paths)
+            except Exception as e:
+                print(f"   ❌ Incremental review failed for {', '.join(doc_paths)}: {e}")
+            finally:
+                self.batches_reviewed += 1
+                self.queue.task_done()
+    
+    async def review_batch(self, doc_paths: List[str]):
+        started = time.monotonic()
+        print(f"\n🔄 {datetime.now().strftime('%H:%M:%S')} Re-analyzing {len(doc_paths)} changed documents")
+        analysis = await self.reviewer.analyze_all_documents(doc_paths)
+        
+        for doc_path, result in analysis['document_details'].items():
+            consensus = result.get('consensus', {})
+            record = {
+                'path': doc_path,
+                'timestamp': datetime.now().isoformat(),
+                'content_sha256': result.get('content_sha256'),
+                'result_source': result.get('result_source'),
+                'consensus_achieved': consensus.get('consensus_achieved', False),
+                'score': consensus.get('average_score'),
+                'status': consensus.get('status') or result.get('error')
+            }
+            self.writer.append(record)
+            score = f"{record['score']:.1f}" if record['score'] is not None else '-'
+            print(f"   {'✅' if record['consensus_achieved'] else '❌'} {doc_path}: {record['status']} (score {score})")
+        
+        print(f"   ⏱️ Incremental review in {time.monotonic() - started:.1f}s")
+    
+    async def run(self, max_batches: Optional[int] = None):
+        """Watch until interrupted (or until max_batches reviews have run)"""
+        self.stats = self.snapshot()
+        print(f"👀 Watching {len(self.stats)} documents (poll {self.interval}s, debounce {self.debounce}s)")
+        consumer = asyncio.ensure_future(self.review_batches())
+        
+        try:
+            while max_batches is None or self.batches_reviewed < max_batches:
+                settled = await asyncio.get_running_loop().run_in_executor(None, self.poll)
+                if settled:
+                    self.queue.put_nowait(settled)
+                await asyncio.sleep(self.interval)
+            await self.queue.join()
+        finally:
+            consumer.cancel()
+            self.writer.flush()
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Segmented JSONL Log
+Buffered append-only log writer shared by the CCO and executive consensus logs
+A background thread group-commits records, rotates segments by size or age
+and gzips rotated segments; readers stream transparently across segments
+Processes sharing a log coordinate through a lock file: writes hold it shared,
+rotation holds it exclusively, and writers reopen the path after a rotation
+"""
+
+import os
+import glob
+import gzip
+import json
+import fcntl
+import queue
+import atexit
+import shutil
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+FSYNC_MODES = ('always', 'batch', 'never')
+
+class SegmentedLogWriter:
+    def __init__(self, path: str, flush_interval: Optional[float] = None, max_batch: int = 256,
+                 fsync: Optional[str] = None, max_bytes: Optional[int] = None,
+                 rotate_seconds: Optional[float] = None, compress: bool = True):
+        self.path = path
+        self.flush_interval = flush_interval if flush_interval is not None else float(os.getenv('CCO_LOG_FLUSH_INTERVAL', '0.5'))
+        self.max_batch = max_batch
+        self.fsync = fsync or os.getenv('CCO_LOG_FSYNC', 'batch')
+        self.max_bytes = max_bytes if max_bytes is not None else int(os.getenv('CCO_LOG_MAX_BYTES', str(64 * 1024 * 1024)))
+        self.rotate_seconds = rotate_seconds if rotate_seconds is not None else float(os.getenv('CCO_LOG_ROTATE_SECONDS', '0'))
+        self.compress = compress
+        
+        if self.fsync not in FSYNC_MODES:
+            raise ValueError(f"Unknown fsync mode '{self.fsync}' (expected one of {', '.join(FSYNC_MODES)})")
+        
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.lock_file = open(f"{path}.lock", 'a')
+        self.open_segment()
+        
+        self.queue = queue.Queue()
+        self.closed = False
+        self.records_written = 0
+        self.commits = 0
+        self.thread = threading.Thread(target=self.run, name=f'log-writer:{os.path.basename(path)}', daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+    
+    def append(self, record: Dict):
+        """Queue a record for the next group commit; never blocks on disk I/O"""
+        if self.closed:
+            raise RuntimeError(f"Log writer for {self.path} is closed")
+        self.queue.put(json.dumps(record, default=str) + '\n')
+    
+    def flush(self):
+        """Block until every queued record has been written"""
+        self.queue.join()
+    
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.put(None)
+        self.thread.join()
+        self.file.close()
+        self.lock_file.close()
+    
+    def run(self):
+        idle_timeout = max(self.flush_interval, 1.0)
+        while True:
+            try:
+                first = self.queue.get(timeout=idle_timeout)
+            except queue.Empty:
+                # Age-based rotation of an idle log; a failure must not kill the writer thread
+                try:
+                    self.maybe_rotate()
+                except Exception as e:
+                    print(f"⚠️ Log writer {self.path}: rotation failed: {e}")
+                continue
+            
+            # Group commit: gather records for up to flush_interval after the first
+            batch = [first]
+            commit_at = time.monotonic() + self.flush_interval
+            while len(batch) < self.max_batch and batch[-1] is not None:
+                remaining = commit_at - time.monotonic()
+                try:
+                    batch.append(self.queue.get(timeout=remaining) if remaining > 0 else self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            lines = [line for line in batch if line is not None]
+            try:
+                if lines:
+                    self.commit(lines)
+            except Exception as e:
+                print(f"⚠️ Log writer {self.path}: commit failed: {e}")
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+            
+            if None in batch:
+                return
+    
+    def open_segment(self):
+        self.file = open(self.path, 'a')
+        self.inode = os.fstat(self.file.fileno()).st_ino
+        self.segment_started = time.time()
+    
+    def path_inode(self) -> Optional[int]:
+        try:
+            return os.stat(self.path).st_ino
+        except FileNotFoundError:
+            return None
+    
+    @contextmanager
+    def locked(self, operation: int):
+        """Hold the log's cross-process lock (LOCK_SH to write, LOCK_EX to rotate)"""
+        fcntl.flock(self.lock_file.fileno(), operation)
+        try:
+            yield
+        finally:
+            fcntl.flock(self.lock_file.fileno(), fcntl.LOCK_UN)
+    
+    def reopen_if_rotated(self):
+        """Follow a rotation done by another process so records never land in a renamed segment"""
+        if self.path_inode() != self.inode:
+            self.file.close()
+            self.open_segment()
+    
+    def commit(self, lines: List[str]):
+        """Write a group of records with one flush (and fsync, per mode)"""
+        with self.locked(fcntl.LOCK_SH):
+            self.reopen_if_rotated()
+            if self.fsync == 'always':
+                for line in lines:
+                    self.file.write(line)
+                    self.file.flush()
+                    os.fsync(self.file.fileno())
+            else:
+                self.file.write(''.join(lines))
+                self.file.flush()
+                if self.fsync == 'batch':
+                    os.fsync(self.file.fileno())
+        
+        self.records_written += len(lines)
+        self.commits += 1
+        self.maybe_rotate()
+    
+    def maybe_rotate(self):
+        too_big = self.max_bytes and self.file.tell() >= self.max_bytes
+        too_old = self.rotate_seconds and time.time() - self.segment_started >= self.rotate_seconds
+        if (too_big or too_old) and self.file.tell() > 0:
+            self.rotate()
+    
+    def rotate(self):
+        """Rename the active segment with a timestamp, start a new one and gzip the old one
+        
+        The exclusive lock waits out writes in progress in other processes, which
+        reopen the path before their next write.
+        """
+        with self.locked(fcntl.LOCK_EX):
+            if self.path_inode() != self.inode:
+                # Another process rotated this segment already
+                self.reopen_if_rotated()
+                return
+            
+            stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+            rotated = f"{self.path}.{stamp}"
+            suffix = 1
+            while glob.glob(f"{rotated}*"):
+                rotated = f"{self.path}.{stamp}-{suffix:04d}"
+                suffix += 1
+            os.replace(self.path, rotated)
+            
+            self.file.close()
+            self.open_segment()
+        
+        if self.compress:
+            with open(rotated, 'rb') as source, gzip.open(f"{rotated}.gz.tmp", 'wb') as target:
+                shutil.copyfileobj(source, target)
+            os.replace(f"{rotated}.gz.tmp", f"{rotated}.gz")
+            os.remove(rotated)
+
+_writers = {}
+_writers_lock = threading.Lock()
+
+def get_log_writer(path: str) -> SegmentedLogWriter:
+    """Process-wide writer for a log path, so every producer shares one buffer"""
+    with _writers_lock:
+        writer = _writers.get(path)
+        if writer is None or writer.closed:
+            writer = _writers[path] = SegmentedLogWriter(path)
+        return writer
+
+def log_segments(path: str) -> List[str]:
+    """Rotated segments oldest first, then the active file"""
+    rotated = set(p for p in glob.glob(f"{glob.escape(path)}.[0-9]*") if not p.endswith('.tmp'))
+    # An uncompressed segment whose .gz already exists was interrupted mid-cleanup
+    rotated = [p for p in rotated if f"{p}.gz" not in rotated]
+    segments = sorted(rotated, key=lambda p: p[:-3] if p.endswith('.gz') else p)
+    if os.path.exists(path):
+        segments.append(path)
+    return segments
+
+def _read_segment(segment: str) -> Iterator[Dict]:
+    if not os.path.exists(segment) and os.path.exists(f"{segment}.gz"):
+        segment = f"{segment}.gz" # compressed since it was listed
+    
+    opener = gzip.open if segment.endswith('.gz') else open
+    with opener(segment, 'rt') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue # torn write from a crash
+
+def iter_log_records(path: str) -> Iterator[Dict]:
+    """Stream every record across rotated and active segments, oldest first"""
+    for segment in log_segments(path):
+        yield from _read_segment(segment)
+
+def tail_log_records(path: str, count: int) -> List[Dict]:
+    """Last count records, reading segments newest first only as far as needed"""
+    records = deque()
+    for segment in reversed(log_segments(path)):
+        needed = count - len(records)
+        if needed <= 0:
+            break
+        segment_tail = deque(_read_segment(segment), maxlen=needed)
+        records.extendleft(reversed(segment_tail))
+    return list(records)
+
+def segment_key(segment: str) -> str:
+    """Stable name of a rotated segment, whether or not it has been gzipped yet"""
+    name = os.path.basename(segment)
+    return name[:-3] if name.endswith('.gz') else name
+
+def iter_new_records(path: str, cursor: Dict) -> Iterator[Dict]:
+    """Stream only records appended since the cursor, advancing it in place
+    
+    The cursor remembers fully read rotated segments and the inode, byte offset
+    and record count reached in the active file. When the active file has since
+    been rotated, the records already read from it are skipped in the rotated copy.
+    """
+    done = cursor.setdefault('segments', {})
+    active = cursor.setdefault('active', {'inode': None, 'offset': 0, 'records': 0})
+    skip = active['records']
+    
+    for segment in log_segments(path):
+        if segment == path:
+            break
+        key = segment_key(segment)
+        if key in done:
+            continue
+        
+        count = 0
+        for record in _read_segment(segment):
+            count += 1
+            if count > skip:
+                yield record
+        done[key] = count
+        skip = 0
+        active.update({'inode': None, 'offset': 0, 'records': 0})
+    
+    if not os.path.exists(path):
+        return
+    
+    with open(path, 'r') as f:
+        inode = os.fstat(f.fileno()).st_ino
+        if active['inode'] == inode and os.fstat(f.fileno()).st_size >= active['offset']:
+            f.seek(active['offset'])
+        else:
+            active.update({'inode': inode, 'offset': 0, 'records': 0})
+        
+        while True:
+            line = f.readline()
+            if not line or not line.endswith('\n'):
+                break # partial trailing line - picked up on the next pass
+            active['offset'] = f.tell()
+            if not line.strip():
+                continue
+            active['records'] += 1
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+def compact_log(path: str, select: Callable[[Iterator[Dict]], Iterable[Dict]]) -> int:
+    """Replace every segment of a log with the records select keeps; returns how many were kept
+    
+    Runs under the log's exclusive lock so no writer appends mid-rewrite; writers
+    reopen the compacted file on their next commit.
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(f"{path}.lock", 'a') as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        segments = log_segments(path)
+        kept = list(select(iter_log_records(path)))
+        
+        tmp_file = f"{path}.compact.tmp"
+        with open(tmp_file, 'w') as f:
+            f.write(''.join(json.dumps(record, default=str) + '\n' for record in kept))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, path)
+        
+        for segment in segments:
+            if segment == path:
+                continue
+            for stale in (segment, f"{segment}.gz"):
+                try:
+                    os.remove(stale)
+                except FileNotFoundError:
+                    pass
+    return len(kept)
+
+def count_log_records(path: str) -> int:
+    return sum(1 for _ in iter_log_records(path))